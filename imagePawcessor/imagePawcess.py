@@ -16,24 +16,27 @@ from concurrent.futures import ThreadPoolExecutor
 import webbrowser
 import cv2 
 # Image processing libraries
-from PIL import Image, ImageSequence, ImageGrab, ImageQt, ImageFilter, UnidentifiedImageError, ImageDraw
+from PIL import Image, ImageSequence, ImageGrab, ImageQt, UnidentifiedImageError, ImageDraw
 import numpy as np
 import shutil
 # Scikit-learn and SciPy utilities
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
+from scipy.spatial import cKDTree
 from joblib import parallel_backend
 # PySide6 (Qt framework)
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QFileDialog, QLabel, QPushButton,
     QVBoxLayout, QHBoxLayout, QCheckBox, QSlider, QComboBox,
     QProgressBar, QMessageBox, QStackedWidget, QLineEdit, QSizePolicy,
-    QFormLayout, QGridLayout, QSpacerItem, QFrame, QStackedLayout, QScrollArea
+    QFormLayout, QGridLayout, QSpacerItem, QFrame, QStackedLayout, QScrollArea,
+    QStyle, QStyleOptionButton, QStylePainter
 )
 from PySide6.QtGui import (
-    QPixmap, QMovie, QIcon, QPainter, QCursor, QImage, QPen, QKeySequence, QShortcut
+    QPixmap, QMovie, QIcon, QPainter, QCursor, QImage, QImageReader, QPen, QKeySequence, QShortcut, QPixmapCache
 )
 from PySide6.QtCore import (
-    Qt, Signal, QObject, QTimer, QPropertyAnimation, QEasingCurve, QPoint, QSize, QThread, Slot, QRect, QBuffer, QIODevice
+    Qt, Signal, QObject, QTimer, QPropertyAnimation, QEasingCurve, QPoint, QSize, QThread, Slot, QRect, QBuffer, QIODevice,
+    QRunnable, QThreadPool, QFileSystemWatcher, QByteArray
 )
 
 
@@ -58,6 +61,23 @@ def exe_path_str(relative_path: str) -> str:
 
     return exe_path_fs(relative_path).as_posix()
 
+# Every GIF step reads and writes its frames here, so resolve it once
+FRAMES_DIR = exe_path_fs('game_data/frames')
+
+# Other locations the processing steps and menus keep coming back to, resolved
+# once at import rather than on every call
+STAMP_PREVIEW_DIR = exe_path_fs('game_data/stamp_preview')
+PREVIEW_PNG_PATH = STAMP_PREVIEW_DIR / 'preview.png'
+PREVIEW_GIF_PATH = STAMP_PREVIEW_DIR / 'preview.gif'
+CURRENT_STAMP_DIR = exe_path_fs('game_data/current_stamp_data')
+GAME_CANVASES_DIR = exe_path_fs('game_data/game_canvises')
+MENU_PICS_DIR = exe_path_str('imagePawcessor/menu_pics')
+CLIPBOARD_IMAGE_PATH = exe_path_fs('imagePawcessor/temp/clipboard_image.webp')
+
+# Intermediate frame PNGs are only read back by this script, so favour encode
+# speed over file size (zlib level 1 instead of PIL's default 6)
+FRAME_PNG_COMPRESS_LEVEL = 1
+
 def get_appdata_dir() -> Path:
     """
     Get the system-specific AppData/Local directory for storing application data.
@@ -74,6 +94,47 @@ def get_appdata_dir() -> Path:
     appdata_dir.mkdir(parents=True, exist_ok=True)  # Ensure it exists
     return appdata_dir
 
+# Parsed saved_stamps.json, keyed by (path, mtime, size) so the menus only
+# reparse it after a save, delete or shuffle rewrites the file
+SAVED_STAMPS_CACHE = {}
+
+def load_saved_stamps(json_path) -> dict:
+    """
+    Parse saved_stamps.json, reusing the last result while the file is unchanged.
+
+    The returned dict is shared between callers, so it must not be modified;
+    code that edits and rewrites the file should load its own copy.
+    Raises the same errors as opening and json-decoding the file.
+    """
+    stat = os.stat(json_path)
+    key = (os.fspath(json_path), stat.st_mtime_ns, stat.st_size)
+    cached = SAVED_STAMPS_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # json.loads detects the encoding from the bytes and skips the text layer
+    with open(json_path, 'rb') as f:
+        saved_stamps = json.loads(f.read())
+
+    SAVED_STAMPS_CACHE.clear()
+    SAVED_STAMPS_CACHE[key] = saved_stamps
+    return saved_stamps
+
+def save_saved_stamps(json_path, saved_stamps):
+    """
+    Write saved_stamps.json through a temporary file that replaces it in one
+    step, so an interrupted write can't leave it half-written. The written
+    dict becomes the cached parse, so it must not be modified afterwards.
+    """
+    tmp_path = os.fspath(json_path) + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(saved_stamps, f, indent=4)
+    os.replace(tmp_path, json_path)
+
+    stat = os.stat(json_path)
+    SAVED_STAMPS_CACHE.clear()
+    SAVED_STAMPS_CACHE[(os.fspath(json_path), stat.st_mtime_ns, stat.st_size)] = saved_stamps
+
 if os.name == "nt":
     mod_name = "PurplePuppy-Stamps"
 else:
@@ -121,6 +182,36 @@ chalks_colors = False
 first = False
 brightness = 0.5
 
+# Shared pool for splitting pointwise per-pixel work into row stripes.
+# Only used for work that never waits on the pool itself (numpy/cv2 calls
+# that release the GIL), so callers on other pools can safely use it.
+TILE_WORKERS = os.cpu_count() or 1
+TILE_MIN_PIXELS = 65536
+tile_executor = ThreadPoolExecutor(max_workers=TILE_WORKERS)
+
+
+@njit(parallel=True, cache=True)
+def threading_layer_probe(values):
+    total = 0.0
+    for i in prange(values.shape[0]):
+        total += values[i]
+    return total
+
+
+def numba_threads_are_safe():
+    """
+    True if numba's threading layer lets parallel kernels be launched from
+    several threads at once (tbb or omp). The 'workqueue' fallback aborts the
+    process on concurrent launches, so callers must stay serial on it. Runs a
+    tiny parallel kernel first if no layer has been picked yet.
+    """
+    try:
+        layer = numba.threading_layer()
+    except ValueError:
+        threading_layer_probe(np.zeros(1))
+        layer = numba.threading_layer()
+    return layer != 'workqueue'
+
 
 def get_clipboard_image_via_pyside6():
     """
@@ -224,10 +315,10 @@ def prepare_image(img):
     Converts image to RGBA if not already, and returns a writable copy of the image.
     """
     if img.mode != 'RGBA':
-        img = img.convert('RGBA')
+        # convert() already returns a new image
+        return img.convert('RGBA')
     # Make a writable copy of the image
-    img = img.copy()
-    return img
+    return img.copy()
 
 
 
@@ -235,6 +326,23 @@ def prepare_image(img):
 #                   Utility and Helper Functions                              #
 ###############################################################################
 
+# Parsed color-key hex codes; the same handful of colors is parsed on every image
+HEX_RGB_CACHE = {}
+
+
+def parse_hex_rgb(hex_code):
+    """
+    Convert a hex color string ('ffe7c5' or '#ffe7c5') to an (R, G, B) tuple,
+    caching the result per string.
+    """
+    rgb = HEX_RGB_CACHE.get(hex_code)
+    if rgb is None:
+        digits = hex_code.lstrip('#')
+        rgb = tuple(int(digits[i:i + 2], 16) for i in (0, 2, 4))
+        HEX_RGB_CACHE[hex_code] = rgb
+    return rgb
+
+
 def calculate_luminance(rgb):
     """
     Calculate luminance of an RGB color using standard weights.
@@ -249,9 +357,7 @@ def extract_color_key_brightness_range(color_key_array):
     """
     color_key_luminances = []
     for color_key in color_key_array:
-        # Extract R, G, B from hex (without '#')
-        hex_code = color_key['hex'].lstrip('#')
-        rgb_tuple = tuple(int(hex_code[i:i + 2], 16) for i in (0, 2, 4))
+        rgb_tuple = parse_hex_rgb(color_key['hex'])
         color_key_luminances.append(calculate_luminance(rgb_tuple))
 
     min_brightness = min(color_key_luminances)
@@ -283,37 +389,88 @@ def get_opaque_mask_and_rgb(image, alpha_threshold):
     return has_alpha, alpha_channel, rgb_image, opaque_mask
 
 
+def masked_percentiles_uint8(image_uint8, channel, mask_uint8, percentiles):
+    """
+    Linear-interpolated percentiles (same definition as np.percentile) of one
+    uint8 channel restricted to a mask, computed from a 256-bin histogram
+    instead of sorting the masked pixels.
+    Returns a list of floats, or None if the mask selects no pixels.
+    """
+    hist = cv2.calcHist([image_uint8], [channel], mask_uint8, [256], [0, 256]).ravel()
+    # calcHist counts in float32, exact only up to 2**24; accumulate in int64
+    cumulative = np.cumsum(hist.astype(np.int64))
+    total = int(cumulative[-1])
+    if total == 0:
+        return None
+
+    values = []
+    for pct in percentiles:
+        position = (pct / 100.0) * (total - 1)
+        lower = int(math.floor(position))
+        upper = min(lower + 1, total - 1)
+        # The k-th smallest value is the first bin whose running count exceeds k
+        lower_val = float(np.searchsorted(cumulative, lower, side='right'))
+        upper_val = float(np.searchsorted(cumulative, upper, side='right'))
+        values.append(lower_val + (upper_val - lower_val) * (position - lower))
+    return values
+
+
 def global_contrast_stretch(rgb_image_uint8, opaque_mask, contrast_percentiles):
     """
     Apply global contrast stretching to each color channel using the specified percentiles.
+    Percentiles come from a per-channel histogram and the stretch is applied as a LUT.
     """
-    lower_pct, upper_pct = contrast_percentiles
+    mask_uint8 = opaque_mask.view(np.uint8) if opaque_mask.dtype == np.bool_ else opaque_mask.astype(np.uint8)
+    levels = np.arange(256, dtype=np.float64)
     for c in range(3):
-        channel = rgb_image_uint8[:, :, c]
         # Compute percentiles only on opaque pixels
-        min_val = np.percentile(channel[opaque_mask], lower_pct)
-        max_val = np.percentile(channel[opaque_mask], upper_pct)
+        bounds = masked_percentiles_uint8(rgb_image_uint8, c, mask_uint8, contrast_percentiles)
+        if bounds is None:
+            continue
+        min_val, max_val = bounds
         if max_val - min_val < 1e-5:  # avoid near-zero division
             continue
-        stretched = (channel - min_val) * (255.0 / (max_val - min_val))
-        channel = np.clip(stretched, 0, 255).astype(np.uint8)
-        rgb_image_uint8[:, :, c] = channel
+        stretched = (levels - min_val) * (255.0 / (max_val - min_val))
+        table = np.clip(stretched, 0, 255).astype(np.uint8)
+        channel = cv2.extractChannel(rgb_image_uint8, c)
+        cv2.LUT(channel, table, dst=channel)
+        cv2.insertChannel(channel, rgb_image_uint8, c)
     return rgb_image_uint8
 
 
+def build_gamma_lut(gamma):
+    """
+    Build a 256-entry uint8 gamma lookup table for the given gamma.
+    """
+    inv_gamma = 1.0 / gamma
+    return ((np.arange(256) / 255.0) ** inv_gamma * 255).astype(np.uint8)
+
+
+# Gamma tables for the gamma values the preprocessing presets use.
+GAMMA_LUTS = {gamma: build_gamma_lut(gamma) for gamma in (0.8, 0.9)}
+
+
+def get_gamma_lut(gamma):
+    """
+    Return the cached gamma lookup table for 'gamma', building it on first use.
+    """
+    table = GAMMA_LUTS.get(gamma)
+    if table is None:
+        table = build_gamma_lut(gamma)
+        GAMMA_LUTS[gamma] = table
+    return table
+
+
 def apply_gamma_correction(rgb_image_uint8, gamma):
     """
-    Apply gamma correction if gamma != 1.0.
+    Apply gamma correction if gamma != 1.0 (in place).
     """
     if abs(gamma - 1.0) > 1e-5:
-        invGamma = 1.0 / gamma
-        table = np.array([(i / 255.0) ** invGamma * 255 
-                          for i in range(256)]).astype("uint8")
-        rgb_image_uint8 = cv2.LUT(rgb_image_uint8, table)
+        cv2.LUT(rgb_image_uint8, get_gamma_lut(gamma), dst=rgb_image_uint8)
     return rgb_image_uint8
 
 def apply_unsharp_mask(
-    image,
+    rgb_image_uint8,
     unsharp_strength=1.0,
     unsharp_radius=1.0,
     edge_threshold=5
@@ -321,13 +478,16 @@ def apply_unsharp_mask(
     """
     Apply unsharp mask only on the luminance channel (Lab)
     and only where edges exceed `edge_threshold`.
+
+    Works directly on an RGB uint8 image and only touches the L plane,
+    so a/b are never split out or re-merged.
     """
     if unsharp_strength <= 0:
-        return image
+        return rgb_image_uint8
 
-    # Convert BGR → Lab
-    lab = cv2.cvtColor(image, cv2.COLOR_BGR2Lab)
-    L, A, B = cv2.split(lab)
+    # Convert RGB → Lab and pull out just the L plane
+    lab = cv2.cvtColor(rgb_image_uint8, cv2.COLOR_RGB2Lab)
+    L = cv2.extractChannel(lab, 0)
 
     # Blur just the L channel
     blurred_L = cv2.GaussianBlur(L, (0, 0), unsharp_radius)
@@ -336,18 +496,35 @@ def apply_unsharp_mask(
     diff = cv2.absdiff(L, blurred_L)
     _, edge_mask = cv2.threshold(diff, edge_threshold, 255, cv2.THRESH_BINARY)
 
-    # Sharpen L channel
+    # Sharpen L channel (reuse the blur buffer as the output)
     L_sharp = cv2.addWeighted(L, 1.0 + unsharp_strength,
-                              blurred_L, -unsharp_strength, 0)
+                              blurred_L, -unsharp_strength, 0, dst=blurred_L)
+
+    # Keep the original L where there's no significant edge
+    cv2.copyTo(L_sharp, edge_mask, L)
+
+    # Write L back into the Lab image and convert back to RGB
+    cv2.insertChannel(L, lab, 0)
+    return cv2.cvtColor(lab, cv2.COLOR_Lab2RGB)
 
-    # Combine original L where there's no significant edge
-    L_combined = np.where(edge_mask > 0, L_sharp, L).astype(np.uint8)
 
-    # Re-merge into Lab and convert back to BGR
-    lab_sharpened = cv2.merge([L_combined, A, B])
-    sharpened_bgr = cv2.cvtColor(lab_sharpened, cv2.COLOR_Lab2BGR)
+# CLAHE objects keep internal tile state, so they are cached per thread
+clahe_cache = threading.local()
 
-    return sharpened_bgr
+
+def get_clahe(clip_limit, grid_size):
+    """
+    Return a reusable CLAHE object for the given parameters, creating it on first use.
+    """
+    cache = getattr(clahe_cache, 'objects', None)
+    if cache is None:
+        cache = clahe_cache.objects = {}
+    key = (float(clip_limit), int(grid_size))
+    clahe = cache.get(key)
+    if clahe is None:
+        clahe = cv2.createCLAHE(clipLimit=key[0], tileGridSize=(key[1], key[1]))
+        cache[key] = clahe
+    return clahe
 
 
 def apply_clahe(
@@ -365,6 +542,10 @@ def apply_clahe(
       - Reduce pure black/white areas
       - Retain local contrast by applying CLAHE on L-channel in Lab space
 
+    The per-pixel steps after CLAHE (L rescale, gamma, a/b boost) are all
+    functions of a single uint8 value, so they are folded into one 3-channel
+    lookup table and applied in a single cv2.LUT pass over the Lab buffer.
+
     :param rgb_image_uint8: 3-channel image in RGB order, dtype=uint8
     :param clahe_clip_limit: Clip limit for CLAHE
     :param clahe_grid_size: TileGridSize for CLAHE
@@ -377,56 +558,47 @@ def apply_clahe(
 
     # 1) Convert from RGB to Lab
     lab_image = cv2.cvtColor(rgb_image_uint8, cv2.COLOR_RGB2LAB)
-    l_channel, a_channel, b_channel = cv2.split(lab_image)
+    l_channel = cv2.extractChannel(lab_image, 0)
 
-    # 2) Apply CLAHE on L channel
-    clahe = cv2.createCLAHE(
-        clipLimit=clahe_clip_limit,
-        tileGridSize=(clahe_grid_size, clahe_grid_size)
-    )
-    l_eq = clahe.apply(l_channel)
+    # 2) Apply CLAHE on L channel, in place
+    clahe = get_clahe(clahe_clip_limit, clahe_grid_size)
+    l_eq = clahe.apply(l_channel, dst=l_channel)
+    cv2.insertChannel(l_eq, lab_image, 0)
+
+    levels = np.arange(256, dtype=np.float32)
 
     # 3) Force L channel away from pure 0 or 255 by rescaling:
     #    - First get min and max in the L-channel after CLAHE
     L_min, L_max = float(l_eq.min()), float(l_eq.max())
     if L_max > L_min:  # avoid division-by-zero
         # clamp to actual min/max
-        l_clamped = np.clip(l_eq, L_min, L_max).astype(np.float32)
+        l_clamped = np.clip(levels, L_min, L_max)
         # scale to [range_min .. range_max]
         scale = (range_max - range_min) / (L_max - L_min)
         l_rescaled = range_min + (l_clamped - L_min) * scale
-        l_eq = np.clip(l_rescaled, 0, 255).astype(np.uint8)
+        l_lut = np.clip(l_rescaled, 0, 255).astype(np.uint8)
     else:
         # if the L channel is flat (rare), just keep it as is
-        l_eq = l_eq.astype(np.uint8)
+        l_lut = np.arange(256, dtype=np.uint8)
 
     # 4) Gamma correction on L to further avoid large dark areas (gamma<1 => brighten)
-    #    Build a LUT for [0..255].
+    #    Compose the cached gamma LUT with the rescale table.
     if abs(gamma - 1.0) > 1e-3:
-        inv_gamma = 1.0 / gamma
-        lut = np.array([
-            ( (i / 255.0) ** inv_gamma ) * 255.0 for i in range(256)
-        ]).astype("uint8")
-        l_eq = cv2.LUT(l_eq, lut)
+        l_lut = get_gamma_lut(gamma)[l_lut]
 
     # 5) Strongly boost colors in a/b channels:
     #    - Shift them around 128 (the neutral point in Lab)
     #    - Multiply to amplify saturation
     #    - Shift back, and clamp to valid [0..255]
-    a_float = a_channel.astype(np.float32) - 128.0
-    b_float = b_channel.astype(np.float32) - 128.0
-
-    a_boosted = np.clip(a_float * color_boost, -128, 127) + 128.0
-    b_boosted = np.clip(b_float * color_boost, -128, 127) + 128.0
+    ab_boosted = np.clip((levels - 128.0) * color_boost, -128, 127) + 128.0
+    ab_lut = np.clip(ab_boosted, 0, 255).astype(np.uint8)
 
-    a_boosted = np.clip(a_boosted, 0, 255).astype(np.uint8)
-    b_boosted = np.clip(b_boosted, 0, 255).astype(np.uint8)
-
-    # 6) Merge back into Lab space
-    lab_merged = cv2.merge((l_eq, a_boosted, b_boosted))
+    # 6) Apply all three channel tables in one pass over the Lab buffer
+    lab_lut = np.dstack((l_lut, ab_lut, ab_lut)).reshape(256, 1, 3)
+    cv2.LUT(lab_image, lab_lut, dst=lab_image)
 
     # 7) Convert Lab back to RGB
-    output_rgb = cv2.cvtColor(lab_merged, cv2.COLOR_LAB2RGB)
+    output_rgb = cv2.cvtColor(lab_image, cv2.COLOR_LAB2RGB)
 
     return output_rgb
 
@@ -438,7 +610,7 @@ def restore_non_opaque_pixels(rgb_image_uint8, original_rgb, opaque_mask):
     Restore the original RGB values for non-opaque pixels 
     in case transformations altered them.
     """
-    rgb_image_uint8[~opaque_mask] = original_rgb[~opaque_mask]
+    np.copyto(rgb_image_uint8, original_rgb, where=~opaque_mask[..., None])
     return rgb_image_uint8
 
 
@@ -472,8 +644,8 @@ def auto_brightness_rgb(rgb_image_uint8, opaque_mask):
         diff = np.clip(diff, 0, 50)
 
     float_img[opaque_mask] += diff
-    out = np.clip(float_img, 0, 255).astype(np.uint8)
-    return out
+    np.clip(float_img, 0, 255, out=float_img)
+    return float_img.astype(np.uint8)
 
 
 def auto_brightness_lab(rgb_image_uint8, opaque_mask):
@@ -486,7 +658,7 @@ def auto_brightness_lab(rgb_image_uint8, opaque_mask):
       - Converts back to RGB.
     """
     lab = cv2.cvtColor(rgb_image_uint8, cv2.COLOR_RGB2LAB).astype(np.float32)
-    l_channel, a_channel, b_channel = cv2.split(lab)
+    l_channel = cv2.extractChannel(lab, 0)
 
     l_opaque = l_channel[opaque_mask]
     avg_l = np.mean(l_opaque) if l_opaque.size > 0 else 128.0
@@ -499,11 +671,11 @@ def auto_brightness_lab(rgb_image_uint8, opaque_mask):
         diff = np.clip(diff, 0, 50)
 
     l_channel[opaque_mask] += diff
-    l_channel = np.clip(l_channel, 0, 255)
+    np.clip(l_channel, 0, 255, out=l_channel)
 
-    merged = cv2.merge((l_channel, a_channel, b_channel)).astype(np.uint8)
-    out = cv2.cvtColor(merged, cv2.COLOR_LAB2RGB)
-    return out
+    cv2.insertChannel(l_channel, lab, 0)
+    merged = lab.astype(np.uint8)
+    return cv2.cvtColor(merged, cv2.COLOR_LAB2RGB, dst=merged)
 
 
 ###############################################################################
@@ -655,6 +827,31 @@ def determine_dynamic_boost_and_threshold(color_key_array, rgb_image_uint8):
 #             Selective Color Boosting (Uses Dynamic Boost/Threshold)         #
 ###############################################################################
 
+@njit(parallel=True, cache=True)
+def apply_hue_boosts_numba(hsv_image, opaque_mask, palette_hue, thresholds, boosts):
+    """
+    Boost the saturation of every opaque pixel whose hue is within a target
+    color's threshold, applying the targets in order. Updates 'hsv_image' in place
+    with one pass over the pixels, regardless of how many colors are targeted.
+    """
+    height, width = hsv_image.shape[:2]
+    n_targets = palette_hue.shape[0]
+    for y in prange(height):
+        for x in range(width):
+            if not opaque_mask[y, x]:
+                continue
+            h = np.float32(hsv_image[y, x, 0])
+            s = np.float32(hsv_image[y, x, 1])
+            for k in range(n_targets):
+                hue_diff = abs(h - palette_hue[k])
+                wrapped = np.float32(180.0) - hue_diff
+                if wrapped < hue_diff:
+                    hue_diff = wrapped
+                if hue_diff < thresholds[k]:
+                    s = min(s * boosts[k], np.float32(255.0))
+            hsv_image[y, x, 1] = np.uint8(s)
+
+
 def selective_color_boost_hsv(rgb_image_uint8, opaque_mask, color_key_array, dynamic_settings):
     """
     Boost saturation for pixels close to each target color in HSV space.
@@ -663,10 +860,9 @@ def selective_color_boost_hsv(rgb_image_uint8, opaque_mask, color_key_array, dyn
     global chalks_colors
 
     hsv_image = cv2.cvtColor(rgb_image_uint8, cv2.COLOR_RGB2HSV)
-    h = hsv_image[:, :, 0].astype(np.float32)
-    s = hsv_image[:, :, 1].astype(np.float32)
-    v = hsv_image[:, :, 2].astype(np.float32)
 
+    # Collect the colors to boost and convert them to HSV in one call
+    targets = []
     for color_key in color_key_array:
         hex_code = color_key['hex'].lstrip('#').lower()
         
@@ -674,30 +870,24 @@ def selective_color_boost_hsv(rgb_image_uint8, opaque_mask, color_key_array, dyn
         if not chalks_colors:
             if hex_code in ('ffe7c5', '2a3844'):
                 continue
+        targets.append((color_key['number'], parse_hex_rgb(hex_code)))
+
+    if targets:
+        palette_rgb = np.array(
+            [rgb for _, rgb in targets],
+            dtype=np.uint8
+        ).reshape(-1, 1, 3)
+        palette_hue = cv2.cvtColor(palette_rgb, cv2.COLOR_RGB2HSV)[:, 0, 0].astype(np.float32)
+        thresholds = np.array(
+            [dynamic_settings[num]['threshold'] for num, _ in targets], dtype=np.float32
+        )
+        boosts = np.array(
+            [dynamic_settings[num]['boost'] for num, _ in targets], dtype=np.float32
+        )
+        apply_hue_boosts_numba(hsv_image, np.ascontiguousarray(opaque_mask, dtype=np.bool_),
+                               palette_hue, thresholds, boosts)
 
-        color_num = color_key['number']
-        boost = dynamic_settings[color_num]['boost']
-        threshold = dynamic_settings[color_num]['threshold']
-
-        # Convert the target color to HSV
-        color_rgb = tuple(int(hex_code[i:i + 2], 16) for i in (0, 2, 4))
-        color_hsv = cv2.cvtColor(np.uint8([[color_rgb]]), cv2.COLOR_RGB2HSV)[0, 0]
-        target_h = color_hsv[0]
-
-        # Hue difference
-        hue_diff = np.abs(h - target_h)
-        hue_diff = np.minimum(hue_diff, 180 - hue_diff)
-
-        # Mask for pixels close to the target color
-        color_mask = (hue_diff < threshold) & opaque_mask
-
-        # Boost saturation
-        s = np.where(color_mask, np.minimum(s * boost, 255), s)
-
-    hsv_image[:, :, 1] = s
-    hsv_image[:, :, 2] = v  # If you want to also adjust V, do so here
-
-    boosted_rgb = cv2.cvtColor(hsv_image.astype(np.uint8), cv2.COLOR_HSV2RGB)
+    boosted_rgb = cv2.cvtColor(hsv_image, cv2.COLOR_HSV2RGB)
     return boosted_rgb
 
 
@@ -729,8 +919,7 @@ def selective_color_boost_lab_fixed(
     # Convert to float32 for safe arithmetic.
     lab_f32 = lab_image.astype(np.float32)
 
-    # 2) Separate the three channels
-    L_channel = lab_f32[:, :, 0]
+    # 2) Views of the a and b channels (L is left unchanged)
     a_channel = lab_f32[:, :, 1]
     b_channel = lab_f32[:, :, 2]
 
@@ -738,6 +927,7 @@ def selective_color_boost_lab_fixed(
     #    L in [0..255], a in [0..255], b in [0..255]
     #    The "real" Lab often has L in [0..100], a,b in ~[-128..+128].
     #    So let's shift a,b down by 128 so that 128->0 is neutral.
+    #    a and b are views into lab_f32, so every step below works in place.
     a_channel -= 128.0
     b_channel -= 128.0
 
@@ -753,28 +943,27 @@ def selective_color_boost_lab_fixed(
     b_channel *= boost_factor
 
     # 5) Clamp a,b back into the valid [-128..127] range
-    a_channel = np.clip(a_channel, -128, 127)
-    b_channel = np.clip(b_channel, -128, 127)
+    np.clip(a_channel, -128, 127, out=a_channel)
+    np.clip(b_channel, -128, 127, out=b_channel)
 
     # 6) Shift a,b back up by +128 to restore OpenCV’s range.
     a_channel += 128.0
     b_channel += 128.0
 
-    # 7) Place the channels back, and also clamp L to [0..255].
+    # 7) Clamp L and a,b to [0..255].
     #    (Some code also remaps L to a narrower [0..100], but we’ll stay consistent with OpenCV.)
-    lab_f32[:, :, 0] = np.clip(L_channel, 0, 255)
-    lab_f32[:, :, 1] = np.clip(a_channel, 0, 255)
-    lab_f32[:, :, 2] = np.clip(b_channel, 0, 255)
+    np.clip(lab_f32, 0, 255, out=lab_f32)
 
-    # Convert back to uint8
-    lab_fixed = lab_f32.astype(np.uint8)
+    # Convert back to uint8, reusing the original Lab buffer
+    lab_fixed = lab_image
+    np.copyto(lab_fixed, lab_f32, casting='unsafe')
 
     # 8) Convert Lab -> RGB
-    boosted_rgb = cv2.cvtColor(lab_fixed, cv2.COLOR_LAB2RGB)
+    boosted_rgb = cv2.cvtColor(lab_fixed, cv2.COLOR_LAB2RGB, dst=lab_fixed)
 
     # 9) Write back only into opaque pixels, in-place.
     #    (If you prefer to modify all pixels, remove the mask indexing.)
-    rgb_image_uint8[opaque_mask] = boosted_rgb[opaque_mask]
+    np.copyto(rgb_image_uint8, boosted_rgb, where=opaque_mask[..., None])
 
     return rgb_image_uint8
 
@@ -890,11 +1079,12 @@ def preprocess_image(
             image,
             params['alpha_threshold']
         )
-        rgb_image_uint8 = rgb_image.astype(np.uint8).copy()
+        # astype() already returns a fresh contiguous buffer; no extra copy needed
+        rgb_image_uint8 = rgb_image.astype(np.uint8)
     else:
         has_alpha = False
         alpha_channel = None
-        rgb_image_uint8 = image[..., :3].astype(np.uint8).copy()
+        rgb_image_uint8 = image[..., :3].astype(np.uint8)
         opaque_mask = np.ones(rgb_image_uint8.shape[:2], dtype=bool)
 
     #--------------------------------------------------------------------------
@@ -1000,15 +1190,12 @@ def preprocess_image(
     if default_steps['unsharp_mask'] and params['unsharp_strength'] > 0:
         if callback:
             callback("Step 8: Applying unsharp masking...")
-        # Convert to BGR for unsharp, then convert back
-        bgr_for_unsharp = cv2.cvtColor(rgb_image_uint8, cv2.COLOR_RGB2BGR)
-        bgr_sharpened = apply_unsharp_mask(
-            bgr_for_unsharp,
+        rgb_image_uint8 = apply_unsharp_mask(
+            rgb_image_uint8,
             unsharp_strength=params['unsharp_strength'],
             unsharp_radius=params['unsharp_radius'],
             edge_threshold=5
         )
-        rgb_image_uint8 = cv2.cvtColor(bgr_sharpened, cv2.COLOR_BGR2RGB)
 
     #--------------------------------------------------------------------------
     # 12. Restore Non-Opaque Pixels
@@ -1024,7 +1211,9 @@ def preprocess_image(
     if default_steps['recombine_alpha'] and has_alpha:
         if callback:
             callback("Step 10: Recombining alpha channel (if present).")
-        preprocessed_image = np.dstack((rgb_image_uint8, alpha_channel))
+        preprocessed_image = np.empty(rgb_image_uint8.shape[:2] + (4,), dtype=np.uint8)
+        preprocessed_image[..., :3] = rgb_image_uint8
+        preprocessed_image[..., 3] = alpha_channel
     else:
         preprocessed_image = rgb_image_uint8
 
@@ -1062,40 +1251,51 @@ def crop_to_solid_area(image: Image.Image) -> Image.Image:
 def resize_image(img, target_size):
     """
     Resizes the image to the target size while maintaining aspect ratio.
-    Uses nearest neighbor for upscaling and LANCZOS for downscaling.
-    Handles the alpha channel separately to prevent artifacting.
+    Uses nearest neighbor for upscaling and area averaging for downscaling.
+    RGBA images are resized in a single OpenCV pass, which keeps alpha straight
+    (non-premultiplied) the same way resizing the channels separately did.
     """
     try:
         width, height = img.size
         scale_factor = target_size / float(max(width, height))
         new_width = max(1, int(width * scale_factor))
         new_height = max(1, int(height * scale_factor))
-        
-        # Choose the resampling method based on the scaling factor.
-        # Use NEAREST for upscaling (scale_factor > 1) to avoid introducing new artifacts,
-        # and LANCZOS for downscaling.
-        resample_method = Image.NEAREST if scale_factor > 1 else Image.LANCZOS
-
-        # Separate the alpha channel if present.
-        if img.mode == 'RGBA':
-            img_no_alpha = img.convert('RGB')
-            alpha = img.getchannel('A')
-
-            # Resize RGB and alpha channels separately with the chosen resample method.
-            img_no_alpha = img_no_alpha.resize((new_width, new_height), resample=resample_method)
-            alpha = alpha.resize((new_width, new_height), resample=resample_method)
 
-            # Merge the resized channels back together.
-            img = Image.merge('RGBA', (*img_no_alpha.split(), alpha))
-        else:
-            img = img.resize((new_width, new_height), resample=resample_method)
+        # Use NEAREST for upscaling (scale_factor > 1) to avoid introducing new artifacts
+        # (NEAREST_EXACT samples the same pixels as PIL), and INTER_AREA for downscaling.
+        if img.mode in ('RGBA', 'RGB', 'L'):
+            interpolation = cv2.INTER_NEAREST_EXACT if scale_factor > 1 else cv2.INTER_AREA
+            arr = np.asarray(img)
+            out = cv2.resize(arr, (new_width, new_height), interpolation=interpolation)
+            return Image.fromarray(out, img.mode)
 
-        return img
+        resample_method = Image.NEAREST if scale_factor > 1 else Image.LANCZOS
+        return img.resize((new_width, new_height), resample=resample_method)
     except Exception as e:
         raise RuntimeError(f"Failed to resize the image: {e}")
 
 
 
+def get_brightness_lut(brightness):
+    """
+    256-entry uint8 lookup table implementing adjust_brightness for one channel value.
+    """
+    levels = np.arange(256, dtype=np.float32)
+    if brightness < 0.5:
+        # For darkening: map brightness from [-0.5, 0.5] to a scale factor [0, 1].
+        # At brightness = -0.5, factor = 0 (black); at brightness = 0.5, factor = 1 (no change).
+        factor = (brightness + 0.5)  # This is linear: e.g., brightness=0.25 gives factor=0.75.
+        table = factor * levels
+    else:
+        # For brightening: map brightness from [0.5, 1.5] to a blend factor [0, 1].
+        # At brightness = 0.5, factor = 0 (no change); at brightness = 1.5, factor = 1 (white).
+        factor = (brightness - 0.5)  # For example, brightness=1.0 gives factor=0.5.
+        table = (1 - factor) * levels + factor * 255
+
+    # Ensure values are within the valid range and convert back to uint8.
+    return np.clip(table, 0, 255).astype(np.uint8)
+
+
 def adjust_brightness(image, brightness):
     """
     Adjusts the brightness of a PIL image in the RGB space.
@@ -1113,22 +1313,8 @@ def adjust_brightness(image, brightness):
     :param brightness: A float in the range [-0.5, 1.5].
     :return: A new PIL.Image with adjusted brightness.
     """
-    # Convert the PIL image to a NumPy array of type float32 for processing.
-    arr = np.array(image).astype(np.float32)
-    
-    if brightness < 0.5:
-        # For darkening: map brightness from [-0.5, 0.5] to a scale factor [0, 1].
-        # At brightness = -0.5, factor = 0 (black); at brightness = 0.5, factor = 1 (no change).
-        factor = (brightness + 0.5)  # This is linear: e.g., brightness=0.25 gives factor=0.75.
-        new_arr = factor * arr
-    else:
-        # For brightening: map brightness from [0.5, 1.5] to a blend factor [0, 1].
-        # At brightness = 0.5, factor = 0 (no change); at brightness = 1.5, factor = 1 (white).
-        factor = (brightness - 0.5)  # For example, brightness=1.0 gives factor=0.5.
-        new_arr = (1 - factor) * arr + factor * 255
-
-    # Ensure values are within the valid range and convert back to uint8.
-    new_arr = np.clip(new_arr, 0, 255).astype(np.uint8)
+    # Every channel value maps independently, so apply it as a lookup table.
+    new_arr = cv2.LUT(np.asarray(image), get_brightness_lut(brightness))
     
     # Convert the NumPy array back to a PIL Image and return it.
     return Image.fromarray(new_arr)
@@ -1192,48 +1378,27 @@ def rgb_to_lab_numba(r, g, b):
     L *= (255.0 / 100.0)
     return L, a_val, b_val
 
+def palette_index_dtype(n_colors):
+    """Smallest unsigned dtype that can index a palette of 'n_colors' colors."""
+    return np.uint8 if n_colors <= 256 else np.uint16
+
 # ------------------------------------------------------------------------------
-# map_pixels_rgb / map_pixels_lab: single definitions for entire-image mapping
+# map_pixels_lab: single definition for entire-image LAB mapping
 # ------------------------------------------------------------------------------
-@njit(parallel=True, cache=True)
-def map_pixels_rgb(pixels, palette):
+def map_pixels_lab(pixels, palette_lab):
     """
-    For each pixel in 'pixels' (H x W x 3 float32), find the closest color in palette (N x 3 float32).
-    Returns a new array of the same shape with quantized values in [0..255].
+    For each pixel in 'pixels' (H x W x 3, uint8 or float), convert to LAB, then find the closest
+    palette color using LAB distance. Returns an (H x W) array of palette indices
+    (uint8, or uint16 for palettes over 256 colors).
     """
-    H, W, _ = pixels.shape
-    out = np.empty_like(pixels)
-    n_palette = palette.shape[0]
-
-    for i in prange(H):
-        for j in range(W):
-            r = pixels[i, j, 0]
-            g = pixels[i, j, 1]
-            b = pixels[i, j, 2]
-            best_index = 0
-            best_dist = 1e10
-            for k in range(n_palette):
-                dr = r - palette[k, 0]
-                dg = g - palette[k, 1]
-                db = b - palette[k, 2]
-                dist = dr*dr + dg*dg + db*db
-                if dist < best_dist:
-                    best_dist = dist
-                    best_index = k
-            out[i, j, 0] = palette[best_index, 0]
-            out[i, j, 1] = palette[best_index, 1]
-            out[i, j, 2] = palette[best_index, 2]
+    out = np.empty(pixels.shape[:2], dtype=palette_index_dtype(palette_lab.shape[0]))
+    map_pixels_lab_numba(pixels, palette_lab, out)
     return out
 
 @njit(parallel=True, cache=True)
-def map_pixels_lab(pixels, palette_rgb, palette_lab):
-    """
-    For each pixel in 'pixels' (H x W x 3 float32), convert to LAB, then find the closest palette color
-    using LAB distance. Returns an array with quantized values in [0..255].
-    """
+def map_pixels_lab_numba(pixels, palette_lab, out):
     H, W, _ = pixels.shape
-    out = np.empty_like(pixels)
-    n_palette = palette_rgb.shape[0]
+    n_palette = palette_lab.shape[0]
 
     for i in prange(H):
         for j in range(W):
@@ -1253,102 +1418,137 @@ def map_pixels_lab(pixels, palette_rgb, palette_lab):
                     best_dist = dist
                     best_index = k
 
-            out[i, j, 0] = palette_rgb[best_index, 0]
-            out[i, j, 1] = palette_rgb[best_index, 1]
-            out[i, j, 2] = palette_rgb[best_index, 2]
-    return out
+            out[i, j] = best_index
 
 # ------------------------------------------------------------------------------
-# Numba-compiled function for error diffusion.
+# Numba-compiled error diffusion, specialized per diffusion matrix.
 # ------------------------------------------------------------------------------
-@njit(cache=True)
-def optimized_error_diffusion_dithering_numba(
-    img_array, alpha_mask, width, height, strength,
-    palette_rgb, palette_lab, diffusion_matrix, use_lab_flag
-):
-    """
-    Loops over each pixel, finds the closest palette color,
-    computes the quantization error, and distributes it.
-    """
-    n_palette = palette_rgb.shape[0]
-    n_diff = diffusion_matrix.shape[0]
+# Compiled kernels keyed by their diffusion matrix
+ERROR_DIFFUSION_KERNELS = {}
 
-    for y in range(height):
-        for x in range(width):
-            if not alpha_mask[y, x]:
-                continue
 
-            old_r = img_array[y, x, 0]
-            old_g = img_array[y, x, 1]
-            old_b = img_array[y, x, 2]
+def get_error_diffusion_kernel(diffusion_matrix):
+    """
+    Return the error diffusion kernel for 'diffusion_matrix', a sequence of
+    (dx, dy, coeff) rows with dy >= 0, compiling it on first use.
 
-            # Find the closest color in palette
-            best_index = 0
-            best_dist = 1e10
+    The matrix is baked into the kernel as constant tuples, so numba sees a
+    fixed-length neighbour loop with immediate offsets and weights. Each
+    specialization is cached on disk like the module-level kernels.
+    """
+    key = tuple((int(dx), int(dy), float(coeff)) for dx, dy, coeff in diffusion_matrix)
+    kernel = ERROR_DIFFUSION_KERNELS.get(key)
+    if kernel is None:
+        kernel = make_error_diffusion_kernel(key)
+        ERROR_DIFFUSION_KERNELS[key] = kernel
+    return kernel
+
+
+def make_error_diffusion_kernel(diffusion_matrix):
+    offsets_x = tuple(dx for dx, _, _ in diffusion_matrix)
+    offsets_y = tuple(dy for _, dy, _ in diffusion_matrix)
+    # Rounded to float32 to match the weights the generic kernel used
+    coeffs = tuple(float(np.float32(coeff)) for _, _, coeff in diffusion_matrix)
+    n_diff = len(diffusion_matrix)
+    n_rows = max(offsets_y) + 1
+
+    @njit(cache=True)
+    def error_diffusion_kernel(
+        img_array, alpha_mask, row_starts, visible_xs, width, height, strength,
+        palette_rgb, palette_lab, palette_lut, use_lab_flag
+    ):
+        """
+        Loops over each pixel, finds the closest palette color,
+        computes the quantization error, and distributes it.
+        If 'palette_lut' is non-empty, the closest color is read from that
+        RGB-cube lookup table instead of searched for.
+
+        'img_array' stays uint8 and is quantized in place. Only the rows the
+        matrix can still reach are held as float32, in a ring of max(dy) + 1 rows.
+        Row y visits only its visible pixels, visible_xs[row_starts[y]:row_starts[y + 1]].
+        """
+        n_palette = palette_rgb.shape[0]
+        use_lut = palette_lut.shape[0] > 0
 
-            if use_lab_flag:
-                L, a_val, b_val = rgb_to_lab_numba(old_r, old_g, old_b)
-                for i in range(n_palette):
-                    dL = L - palette_lab[i, 0]
-                    da = a_val - palette_lab[i, 1]
-                    db = b_val - palette_lab[i, 2]
-                    dist = dL*dL + da*da + db*db
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_index = i
-            else:
-                for i in range(n_palette):
-                    dr = old_r - palette_rgb[i, 0]
-                    dg = old_g - palette_rgb[i, 1]
-                    db = old_b - palette_rgb[i, 2]
-                    dist = dr*dr + dg*dg + db*db
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_index = i
+        rows = np.empty((n_rows, width, 3), dtype=np.float32)
+        for y in range(min(n_rows, height)):
+            for x in range(width):
+                for c in range(3):
+                    rows[y, x, c] = img_array[y, x, c]
 
-            new_r = palette_rgb[best_index, 0]
-            new_g = palette_rgb[best_index, 1]
-            new_b = palette_rgb[best_index, 2]
+        for y in range(height):
+            row = rows[y % n_rows]
+            for k in range(row_starts[y], row_starts[y + 1]):
+                x = visible_xs[k]
 
-            err_r = (old_r - new_r) * strength
-            err_g = (old_g - new_g) * strength
-            err_b = (old_b - new_b) * strength
+                old_r = row[x, 0]
+                old_g = row[x, 1]
+                old_b = row[x, 2]
 
-            # Quantize current pixel
-            img_array[y, x, 0] = new_r
-            img_array[y, x, 1] = new_g
-            img_array[y, x, 2] = new_b
+                # Find the closest color in palette
+                best_index = 0
+                best_dist = 1e10
 
-            # Distribute error
-            for i in range(n_diff):
-                dx = int(diffusion_matrix[i, 0])
-                dy = int(diffusion_matrix[i, 1])
-                coeff = diffusion_matrix[i, 2]
-                nx = x + dx
-                ny = y + dy
+                if use_lut:
+                    best_index = palette_lut[
+                        min(int(old_r), 255) >> PALETTE_LUT_SHIFT,
+                        min(int(old_g), 255) >> PALETTE_LUT_SHIFT,
+                        min(int(old_b), 255) >> PALETTE_LUT_SHIFT,
+                    ]
+                elif use_lab_flag:
+                    L, a_val, b_val = rgb_to_lab_numba(old_r, old_g, old_b)
+                    for i in range(n_palette):
+                        dL = L - palette_lab[i, 0]
+                        da = a_val - palette_lab[i, 1]
+                        db = b_val - palette_lab[i, 2]
+                        dist = dL*dL + da*da + db*db
+                        if dist < best_dist:
+                            best_dist = dist
+                            best_index = i
+                else:
+                    for i in range(n_palette):
+                        dr = old_r - palette_rgb[i, 0]
+                        dg = old_g - palette_rgb[i, 1]
+                        db = old_b - palette_rgb[i, 2]
+                        dist = dr*dr + dg*dg + db*db
+                        if dist < best_dist:
+                            best_dist = dist
+                            best_index = i
+
+                new_r = palette_rgb[best_index, 0]
+                new_g = palette_rgb[best_index, 1]
+                new_b = palette_rgb[best_index, 2]
+
+                err_r = (old_r - new_r) * strength
+                err_g = (old_g - new_g) * strength
+                err_b = (old_b - new_b) * strength
+
+                # Quantize current pixel
+                img_array[y, x, 0] = np.uint8(new_r)
+                img_array[y, x, 1] = np.uint8(new_g)
+                img_array[y, x, 2] = np.uint8(new_b)
+
+                # Distribute error
+                for i in range(n_diff):
+                    nx = x + offsets_x[i]
+                    ny = y + offsets_y[i]
+                    coeff = coeffs[i]
+
+                    if 0 <= nx < width and 0 <= ny < height and alpha_mask[ny, nx]:
+                        target = rows[ny % n_rows]
+                        # Add and clamp; min/max compiles to branch-free selects
+                        target[nx, 0] = min(max(target[nx, 0] + err_r * coeff, 0.0), 255.0)
+                        target[nx, 1] = min(max(target[nx, 1] + err_g * coeff, 0.0), 255.0)
+                        target[nx, 2] = min(max(target[nx, 2] + err_b * coeff, 0.0), 255.0)
+
+            # Row y is done; its ring slot now holds the next row to come into reach
+            next_y = y + n_rows
+            if next_y < height:
+                for x in range(width):
+                    for c in range(3):
+                        row[x, c] = img_array[next_y, x, c]
 
-                if 0 <= nx < width and 0 <= ny < height and alpha_mask[ny, nx]:
-                    r_val = img_array[ny, nx, 0] + err_r * coeff
-                    g_val = img_array[ny, nx, 1] + err_g * coeff
-                    b_val = img_array[ny, nx, 2] + err_b * coeff
-
-                    # Clamp
-                    if r_val < 0:
-                        r_val = 0.0
-                    elif r_val > 255:
-                        r_val = 255.0
-                    if g_val < 0:
-                        g_val = 0.0
-                    elif g_val > 255:
-                        g_val = 255.0
-                    if b_val < 0:
-                        b_val = 0.0
-                    elif b_val > 255:
-                        b_val = 255.0
-
-                    img_array[ny, nx, 0] = r_val
-                    img_array[ny, nx, 1] = g_val
-                    img_array[ny, nx, 2] = b_val
+    return error_diffusion_kernel
 
 # ------------------------------------------------------------------------------
 # Public error diffusion function that calls the numba-compiled core.
@@ -1356,8 +1556,8 @@ def optimized_error_diffusion_dithering_numba(
 def optimized_error_diffusion_dithering(img, color_key, strength, diffusion_matrix):
     global use_lab
 
-    img = img.copy()
-    img_array = np.array(img, dtype=np.float32)
+    # np.array() already copies, so the source image is never modified
+    img_array = np.array(img, dtype=np.uint8)
     height, width = img_array.shape[:2]
 
     # Alpha mask
@@ -1368,39 +1568,33 @@ def optimized_error_diffusion_dithering(img, color_key, strength, diffusion_matr
     else:
         alpha_mask = np.ones((height, width), dtype=np.bool_)
 
-    # Build palette
-    palette_rgb = np.array(list(color_key.values()), dtype=np.float32)
-    if use_lab:
-        n = palette_rgb.shape[0]
-        palette_lab = np.empty((n, 3), dtype=np.float32)
-        for i in range(n):
-            r = palette_rgb[i, 0]
-            g = palette_rgb[i, 1]
-            b = palette_rgb[i, 2]
-            L, a_val, b_val = rgb_to_lab_numba(r, g, b)
-            palette_lab[i, 0] = L
-            palette_lab[i, 1] = a_val
-            palette_lab[i, 2] = b_val
-    else:
-        palette_lab = np.empty((0, 3), dtype=np.float32)
+    # Visible pixels per row as a flat x list plus row offsets (CSR-style), so
+    # the kernel never walks transparent pixels
+    _, visible_xs = np.nonzero(alpha_mask)
+    visible_xs = visible_xs.astype(np.int32)
+    row_starts = np.zeros(height + 1, dtype=np.int32)
+    np.cumsum(np.count_nonzero(alpha_mask, axis=1), out=row_starts[1:])
 
-    diffusion_matrix = np.array(diffusion_matrix, dtype=np.float32)
-    optimized_error_diffusion_dithering_numba(
-        img_array, alpha_mask, width, height, strength,
-        palette_rgb, palette_lab, diffusion_matrix, use_lab
-    )
+    _, palette_rgb, palette_lab = get_palette_arrays(color_key, use_lab)
 
-    # Clamp and reassemble
-    rgb_result = np.clip(img_array[:, :, :3], 0, 255).astype(np.uint8)
-    if has_alpha:
-        alpha_result = np.array(img)[:, :, 3]
-        result_array = np.dstack((rgb_result, alpha_result))
-        mode = 'RGBA'
+    # Large palettes: look the closest color up in a cached RGB-cube table
+    if palette_rgb.shape[0] >= PALETTE_LUT_MIN_COLORS:
+        palette_lut = get_palette_lut(palette_rgb, use_lab)
     else:
-        result_array = rgb_result
-        mode = 'RGB'
+        palette_lut = np.empty((0, 0, 0), dtype=np.uint8)
+
+    # One compiled kernel per (dx, dy, coeff) matrix. The kernel only keeps
+    # rows ahead of the current one, so dy must be >= 0.
+    kernel = get_error_diffusion_kernel(diffusion_matrix)
+    kernel(
+        img_array, alpha_mask, row_starts, visible_xs, width, height, strength,
+        palette_rgb, palette_lab, palette_lut, use_lab
+    )
 
-    return Image.fromarray(result_array, mode)
+    # The kernel never touches the alpha plane
+    if has_alpha:
+        return Image.fromarray(img_array, 'RGBA')
+    return Image.fromarray(img_array[:, :, :3], 'RGB')
 
 # ------------------------------------------------------------------------------
 # Single-pixel palette lookup: finds the one closest color in either LAB or RGB
@@ -1430,28 +1624,159 @@ def find_closest_color_numba(pixel, palette_rgb, palette_lab, use_lab_flag):
                 best_index = i
     return best_index
 
+def build_palette_lab(palette_rgb):
+    """
+    Convert a float32 (K x 3) RGB palette to LAB with rgb_to_lab_numba.
+    """
+    n = palette_rgb.shape[0]
+    palette_lab = np.empty((n, 3), dtype=np.float32)
+    for i in range(n):
+        r = palette_rgb[i, 0]
+        g = palette_rgb[i, 1]
+        b = palette_rgb[i, 2]
+        L, a_val, b_val = rgb_to_lab_numba(r, g, b)
+        palette_lab[i, 0] = L
+        palette_lab[i, 1] = a_val
+        palette_lab[i, 2] = b_val
+    return palette_lab
+
+# Palette arrays built from a color_key, keyed by (color_key items, lab_flag)
+PALETTE_ARRAYS = {}
+
+
+def get_palette_arrays(color_key, lab_flag):
+    """
+    Return (color_nums, palette_rgb, palette_lab) for a color_key dict:
+    the color numbers in order, a float32 (K x 3) RGB palette and its LAB
+    conversion (an empty (0, 3) array unless 'lab_flag').
+
+    The arrays are cached and shared between callers, so never modify them.
+    """
+    key = (tuple(color_key.items()), bool(lab_flag))
+    cached = PALETTE_ARRAYS.get(key)
+    if cached is None:
+        palette_rgb = np.array(list(color_key.values()), dtype=np.float32)
+        if lab_flag:
+            palette_lab = build_palette_lab(palette_rgb)
+        else:
+            palette_lab = np.empty((0, 3), dtype=np.float32)
+        if len(PALETTE_ARRAYS) >= 8:
+            PALETTE_ARRAYS.clear()
+        cached = (list(color_key.keys()), palette_rgb, palette_lab)
+        PALETTE_ARRAYS[key] = cached
+    return cached
+
+
 def find_closest_color(pixel, color_key):
     global use_lab
+    color_nums, palette_rgb, palette_lab = get_palette_arrays(color_key, use_lab)
+
     pixel_arr = np.array(pixel, dtype=np.float32)
-    palette_rgb = np.array(list(color_key.values()), dtype=np.float32)
-    color_nums = list(color_key.keys())
+    idx = find_closest_color_numba(pixel_arr, palette_rgb, palette_lab, use_lab)
+    return color_nums[idx]
 
+def find_closest_colors(rgb_flat, color_key):
+    """
+    Batched find_closest_color: map each row of 'rgb_flat' (N x 3, uint8) to
+    the number of its closest color in 'color_key' (LAB if use_lab is set).
+    """
+    color_nums, palette_rgb, palette_lab = get_palette_arrays(color_key, use_lab)
     if use_lab:
-        n = palette_rgb.shape[0]
-        palette_lab = np.empty((n, 3), dtype=np.float32)
-        for i in range(n):
-            r = palette_rgb[i, 0]
-            g = palette_rgb[i, 1]
-            b = palette_rgb[i, 2]
-            L, a_val, b_val = rgb_to_lab_numba(r, g, b)
-            palette_lab[i, 0] = L
-            palette_lab[i, 1] = a_val
-            palette_lab[i, 2] = b_val
+        indices = map_pixels_lab(np.ascontiguousarray(rgb_flat).reshape(-1, 1, 3), palette_lab)[:, 0]
     else:
-        palette_lab = np.empty((0, 3), dtype=np.float32)
+        indices = find_closest_indices_rgb(rgb_flat, palette_rgb)
+    return np.array(color_nums)[indices]
+
+# ------------------------------------------------------------------------------
+# Vectorized palette lookup: one squared-L2 argmin over the whole pixel set.
+# ------------------------------------------------------------------------------
+# Above this many colors a KD-tree query (log K per pixel) beats the N x K
+# distance matrix
+PALETTE_KDTREE_MIN_COLORS = 257
+
+
+def _closest_indices_stripe(pixels, palette):
+    """
+    Squared-distance argmin of float32 'pixels' (N x 3) against 'palette'
+    (K x 3). Never touches tile_executor, so stripes of it can run there.
+    """
+    if palette.shape[0] <= 4:
+        # Tiny palettes: a direct broadcast is cheaper than the matmul setup.
+        diff = pixels[:, None, :] - palette[None, :, :]
+        dist = np.einsum('nkc,nkc->nk', diff, diff)
+    else:
+        dist = (palette * palette).sum(axis=1) - 2.0 * np.dot(pixels, palette.T)
+
+    return dist.argmin(axis=1).astype(palette_index_dtype(palette.shape[0]))
 
-    idx = find_closest_color_numba(pixel_arr, palette_rgb, palette_lab, use_lab)
-    return color_nums[idx]
+
+def find_closest_indices_rgb(rgb_flat, palette_rgb):
+    """
+    For each row of 'rgb_flat' (N x 3), return the index of the closest color in
+    'palette_rgb' (K x 3) by squared RGB distance, as a uint8 (uint16 above 256
+    colors) index array.
+
+    Uses ||p - c||^2 = ||p||^2 + ||c||^2 - 2 p.c, dropping the per-pixel ||p||^2
+    term since it does not change the argmin. With 8-bit inputs every term is an
+    exact integer in float32, so ties resolve exactly like the scalar loops.
+    """
+    pixels = np.asarray(rgb_flat, dtype=np.float32).reshape(-1, 3)
+    palette = np.asarray(palette_rgb, dtype=np.float32).reshape(-1, 3)
+
+    # Very large palettes: nearest-neighbour query on a KD-tree (already
+    # threaded through 'workers', so no row stripes)
+    if palette.shape[0] >= PALETTE_KDTREE_MIN_COLORS:
+        _, indices = cKDTree(palette).query(pixels, k=1, workers=-1)
+        return indices.astype(palette_index_dtype(palette.shape[0]))
+
+    # Large inputs: run row stripes concurrently (np.dot/argmin release the GIL).
+    # The stripes call the helper directly; a stripe that waited on the pool
+    # again would deadlock it. At most TILE_MIN_PIXELS rows per stripe also
+    # bounds the (N x K) distance matrix each one builds
+    if TILE_WORKERS > 1 and pixels.shape[0] >= TILE_MIN_PIXELS:
+        stripe_count = max(TILE_WORKERS, math.ceil(pixels.shape[0] / TILE_MIN_PIXELS))
+        stripes = np.array_split(pixels, stripe_count)
+        results = tile_executor.map(lambda stripe: _closest_indices_stripe(stripe, palette), stripes)
+        return np.concatenate(list(results))
+
+    return _closest_indices_stripe(pixels, palette)
+
+# ------------------------------------------------------------------------------
+# RGB-cube palette lookup tables: nearest palette index per 4x4x4 cell
+# ------------------------------------------------------------------------------
+PALETTE_LUT_SHIFT = 2
+PALETTE_LUT_SIZE = 256 >> PALETTE_LUT_SHIFT
+# Below this many colors the direct search is as cheap as the table lookup
+PALETTE_LUT_MIN_COLORS = 16
+PALETTE_LUTS = {}
+
+
+def get_palette_lut(palette_rgb, lab_flag):
+    """
+    Return a (64, 64, 64) index table mapping each RGB cube cell to the index
+    of the palette color closest to the cell center (in LAB if 'lab_flag'),
+    building and caching it per palette on first use.
+    """
+    palette_rgb = np.asarray(palette_rgb, dtype=np.float32)
+    key = (palette_rgb.tobytes(), bool(lab_flag))
+    lut = PALETTE_LUTS.get(key)
+    if lut is not None:
+        return lut
+
+    step = 1 << PALETTE_LUT_SHIFT
+    centers = np.arange(PALETTE_LUT_SIZE, dtype=np.float32) * step + (step - 1) / 2.0
+    grid = np.stack(np.meshgrid(centers, centers, centers, indexing='ij'), axis=-1)
+    if lab_flag:
+        cells = grid.reshape(PALETTE_LUT_SIZE * PALETTE_LUT_SIZE, PALETTE_LUT_SIZE, 3)
+        indices = map_pixels_lab(cells, build_palette_lab(palette_rgb))
+    else:
+        indices = find_closest_indices_rgb(grid.reshape(-1, 3), palette_rgb)
+    lut = indices.reshape(PALETTE_LUT_SIZE, PALETTE_LUT_SIZE, PALETTE_LUT_SIZE)
+
+    if len(PALETTE_LUTS) >= 8:
+        PALETTE_LUTS.clear()
+    PALETTE_LUTS[key] = lut
+    return lut
 
 # ------------------------------------------------------------------------------
 # Map an entire image’s pixels to the nearest palette color.
@@ -1467,51 +1792,30 @@ def find_closest_colors_image(image_array, color_key):
     else:
         rgb_data = image_array
 
-    palette_rgb = np.array(list(color_key.values()), dtype=np.uint8)
+    _, palette_float, palette_lab = get_palette_arrays(color_key, use_lab)
+    palette_rgb = palette_float.astype(np.uint8)
 
+    # Both branches produce palette indices; the uint8 palette is gathered once
     if use_lab:
-        # Precompute LAB for palette
-        n = palette_rgb.shape[0]
-        palette_lab = np.empty((n, 3), dtype=np.float32)
-        for i in range(n):
-            r = palette_rgb[i, 0]
-            g = palette_rgb[i, 1]
-            b = palette_rgb[i, 2]
-            L, a_val, b_val = rgb_to_lab_numba(r, g, b)
-            palette_lab[i, 0] = L
-            palette_lab[i, 1] = a_val
-            palette_lab[i, 2] = b_val
-        mapped_rgb = map_pixels_lab(rgb_data.astype(np.float32), palette_rgb.astype(np.float32), palette_lab)
+        indices = map_pixels_lab(np.ascontiguousarray(rgb_data), palette_lab)
     else:
-        mapped_rgb = map_pixels_rgb(rgb_data.astype(np.float32), palette_rgb.astype(np.float32))
-
-    mapped_rgb_uint8 = np.clip(mapped_rgb, 0, 255).astype(np.uint8)
+        indices = find_closest_indices_rgb(rgb_data.reshape(-1, 3), palette_rgb)
+        indices = indices.reshape(rgb_data.shape[:2])
 
     if has_alpha:
-        mapped_data = np.dstack((mapped_rgb_uint8, alpha_channel))
+        mapped_data = np.empty(image_array.shape, dtype=np.uint8)
+        mapped_data[:, :, :3] = palette_rgb[indices]
+        mapped_data[:, :, 3] = alpha_channel
     else:
-        mapped_data = mapped_rgb_uint8
+        mapped_data = palette_rgb[indices]
 
     return mapped_data
 
 
-def rgb_to_lab_single(rgb):
-    arr = np.uint8([[rgb]])
-    lab = cv2.cvtColor(arr, cv2.COLOR_RGB2LAB)[0, 0]
-    return lab
-
-def rgb_palette_to_lab(color_key):
-    rgb_vals = np.array(list(color_key.values()), dtype=np.uint8).reshape(-1, 1, 3)
-    lab_vals = cv2.cvtColor(rgb_vals, cv2.COLOR_RGB2LAB)
-    return lab_vals.reshape(-1, 3)
-
 def build_color_key(color_key_array):
     color_key = {}
     for item in color_key_array:
-        color_num = item['number']
-        hex_code = item['hex'].lstrip('#')
-        rgb = tuple(int(hex_code[i:i+2], 16) for i in (0, 2, 4))
-        color_key[color_num] = rgb
+        color_key[item['number']] = parse_hex_rgb(item['hex'])
     return color_key
 
 # ------------------------------------------------------------------------------
@@ -1551,43 +1855,61 @@ def color_matching(img, color_key, params):
 )
 def simple_k_means_palette_mapping(img, color_key, params):
     has_alpha = (img.mode == 'RGBA')
+    # Slice RGB and alpha out of one array view instead of converting the image
+    img_array = np.asarray(img)
     if has_alpha:
-        alpha_channel = np.array(img.getchannel('A'))
-        rgb_img = img.convert('RGB')
+        alpha_channel = img_array[:, :, 3]
+        data = img_array[:, :, :3]
     else:
         alpha_channel = None
-        rgb_img = img
+        data = img_array
 
-    data = np.array(rgb_img)
-    data_flat = data.reshape((-1, 3))
+    data_flat = data.reshape((-1, 3)).astype(np.float32)
 
     clusters = params['Clusters']
     if clusters == 16:
         clusters = 24  # special tweak
 
+    # Fit on a random sample of pixels; the centroids barely move past ~50k samples
+    max_samples = 50000
+    if data_flat.shape[0] > max_samples:
+        sample_idx = np.random.default_rng(0).choice(data_flat.shape[0], max_samples, replace=False)
+        sample = data_flat[sample_idx]
+    else:
+        sample = data_flat
+
     with parallel_backend('threading', n_jobs=1):
-        kmeans = KMeans(
+        kmeans = MiniBatchKMeans(
             n_clusters=clusters,
             init="k-means++",
-            n_init=10,
+            n_init=3,
+            batch_size=4096,
             random_state=0
-        ).fit(data_flat)
+        ).fit(sample)
 
     cluster_centers = kmeans.cluster_centers_
-    labels = kmeans.labels_
+    labels = kmeans.predict(data_flat)
 
-    # Map cluster centers individually
-    cluster_map = {}
-    for i, center in enumerate(cluster_centers):
-        center_rgb = tuple(center.astype(np.uint8))
-        c_idx = find_closest_color(center_rgb, color_key)
-        cluster_map[i] = color_key[c_idx]
+    # Map every cluster center to the palette in one go, then gather through
+    # the resulting per-cluster LUT
+    _, palette_rgb, palette_lab = get_palette_arrays(color_key, use_lab)
+    centers_rgb = cluster_centers.astype(np.uint8)
+    if use_lab:
+        center_idx = [
+            find_closest_color_numba(center.astype(np.float32), palette_rgb, palette_lab, True)
+            for center in centers_rgb
+        ]
+    else:
+        center_idx = find_closest_indices_rgb(centers_rgb, palette_rgb)
+    cluster_lut = palette_rgb.astype(np.uint8)[center_idx]
 
-    mapped_flat = np.array([cluster_map[label] for label in labels], dtype=np.uint8)
+    mapped_flat = cluster_lut[labels]
     mapped_data = mapped_flat.reshape(data.shape)
 
     if has_alpha:
-        rgba_data = np.dstack((mapped_data, alpha_channel))
+        rgba_data = np.empty(img_array.shape, dtype=np.uint8)
+        rgba_data[:, :, :3] = mapped_data
+        rgba_data[:, :, 3] = alpha_channel
         result_img = Image.fromarray(rgba_data, 'RGBA')
     else:
         result_img = Image.fromarray(mapped_data, 'RGB')
@@ -1689,9 +2011,10 @@ def find_closest_color_numba(pixel, palette_rgb, palette_lab, use_lab_flag):
 #   strength       : float, multiplier for quantization error.
 # ---------------------------------------------------------------------------
 @njit(cache=True)
-def hybrid_dither_numba(img_array, saliency_array, alpha_mask, palette_rgb, palette_lab, use_lab_flag, atkinson_matrix, floyd_matrix, strength):
+def hybrid_dither_numba(img_array, saliency_array, alpha_mask, palette_rgb, palette_int, palette_lab, use_lab_flag, atkinson_matrix, floyd_matrix, strength):
     height = img_array.shape[0]
     width = img_array.shape[1]
+    n_palette = palette_rgb.shape[0]
     for y in range(height):
         for x in range(width):
             if not alpha_mask[y, x]:
@@ -1700,13 +2023,35 @@ def hybrid_dither_numba(img_array, saliency_array, alpha_mask, palette_rgb, pale
             old_r = img_array[y, x, 0]
             old_g = img_array[y, x, 1]
             old_b = img_array[y, x, 2]
-            # Build a temporary 3-element array for palette matching.
-            temp = np.empty(3, dtype=np.float32)
-            temp[0] = old_r
-            temp[1] = old_g
-            temp[2] = old_b
-            # Find the index of the nearest palette color.
-            idx = find_closest_color_numba(temp, palette_rgb, palette_lab, use_lab_flag)
+            # Find the index of the nearest palette color inline, so no
+            # per-pixel array is allocated.
+            idx = 0
+            best_dist = 1e10
+            if use_lab_flag:
+                L, a_val, b_val = rgb_to_lab_numba(old_r, old_g, old_b)
+                for k in range(n_palette):
+                    dL = L - palette_lab[k, 0]
+                    da = a_val - palette_lab[k, 1]
+                    db = b_val - palette_lab[k, 2]
+                    dist = dL * dL + da * da + db * db
+                    if dist < best_dist:
+                        best_dist = dist
+                        idx = k
+            else:
+                # Integer search: round the diffused pixel once and compare
+                # against the int32 palette, so the inner loop has no float math.
+                pr = np.int32(np.floor(old_r + 0.5))
+                pg = np.int32(np.floor(old_g + 0.5))
+                pb = np.int32(np.floor(old_b + 0.5))
+                best_int = np.int32(2147483647)
+                for k in range(n_palette):
+                    dr = pr - palette_int[k, 0]
+                    dg = pg - palette_int[k, 1]
+                    db = pb - palette_int[k, 2]
+                    dist_int = dr * dr + dg * dg + db * db
+                    if dist_int < best_int:
+                        best_int = dist_int
+                        idx = k
             new_r = palette_rgb[idx, 0]
             new_g = palette_rgb[idx, 1]
             new_b = palette_rgb[idx, 2]
@@ -1749,6 +2094,12 @@ def hybrid_dither_numba(img_array, saliency_array, alpha_mask, palette_rgb, pale
 #  5. Calls the numba‑jitted hybrid_dither_numba function.
 #  6. Clips and converts the result back to a PIL image.
 # ---------------------------------------------------------------------------
+FIND_EDGES_KERNEL = np.array([
+    [-1, -1, -1],
+    [-1,  8, -1],
+    [-1, -1, -1],
+], dtype=np.float32)
+
 @register_processing_method(
     'Hybrid Dither',
     default_params={'strength': 1.0},
@@ -1759,10 +2110,16 @@ def hybrid_dithering(img, color_key, params):
     strength = params.get('strength', 0.75)
     
     # Generate a saliency map using edge detection and Gaussian blur.
-    gray_img = img.convert('L')
-    edges = gray_img.filter(ImageFilter.FIND_EDGES)
-    saliency_map = edges.filter(ImageFilter.GaussianBlur(1.5))
-    saliency_array = np.array(saliency_map, dtype=np.float32) / 255.0
+    # Same 3x3 kernel as PIL's FIND_EDGES (border pixels left unfiltered), then
+    # OpenCV's separable Gaussian instead of PIL's multi-pass box blur.
+    gray = np.asarray(img.convert('L'))
+    edges = cv2.filter2D(gray, -1, FIND_EDGES_KERNEL, borderType=cv2.BORDER_REPLICATE)
+    edges[0, :] = gray[0, :]
+    edges[-1, :] = gray[-1, :]
+    edges[:, 0] = gray[:, 0]
+    edges[:, -1] = gray[:, -1]
+    cv2.GaussianBlur(edges, (0, 0), 1.5, dst=edges)
+    saliency_array = edges.astype(np.float32) / 255.0
 
     # Prepare image and alpha mask.
     has_alpha = (img.mode == 'RGBA')
@@ -1775,23 +2132,9 @@ def hybrid_dithering(img, color_key, params):
     else:
         alpha_mask = np.ones((height, width), dtype=np.bool_)
 
-    # Precompute the palette in RGB.
-    palette_rgb = np.array(list(color_key.values()), dtype=np.float32)
-    
-    # Precompute the LAB palette if needed.
-    if use_lab:
-        n = palette_rgb.shape[0]
-        palette_lab = np.empty((n, 3), dtype=np.float32)
-        for i in range(n):
-            r = palette_rgb[i, 0]
-            g = palette_rgb[i, 1]
-            b = palette_rgb[i, 2]
-            L, a_val, b_val = rgb_to_lab_numba(r, g, b)
-            palette_lab[i, 0] = L
-            palette_lab[i, 1] = a_val
-            palette_lab[i, 2] = b_val
-    else:
-        palette_lab = np.empty((0, 3), dtype=np.float32)
+    # Palette in RGB (float for error diffusion, int32 for the RGB search) and LAB
+    _, palette_rgb, palette_lab = get_palette_arrays(color_key, use_lab)
+    palette_int = palette_rgb.astype(np.int32)
     
     # Define diffusion matrices.
     # Atkinson (typically diffuses to 6 neighbors)
@@ -1813,7 +2156,7 @@ def hybrid_dithering(img, color_key, params):
     
     # Call the numba‑accelerated hybrid dithering routine.
     hybrid_dither_numba(img_array, saliency_array, alpha_mask,
-                        palette_rgb, palette_lab, use_lab,
+                        palette_rgb, palette_int, palette_lab, use_lab,
                         atkinson, floyd, strength)
     
     # Clip the RGB channels to [0,255] and convert to uint8.
@@ -1830,169 +2173,154 @@ def hybrid_dithering(img, color_key, params):
 
 
 
-@register_processing_method(
-    'Pattern Dither',
-    default_params={'strength': 0.33},
-    description="Uses an 8x8 Bayer matrix to apply dithering in a pattern. Pretty :3"
-)
-def ordered_dithering(img, color_key, params):
-    global use_lab
-    strength = params.get('strength', 1.0)
-    adjustment_factor = 0.3 * strength
-
-    # 8x8 Bayer matrix
-    bayer_8x8 = np.array([
-        [0, 32, 8, 40, 2, 34, 10, 42],
-        [48, 16, 56, 24, 50, 18, 58, 26],
-        [12, 44, 4, 36, 14, 46, 6, 38],
-        [60, 28, 52, 20, 62, 30, 54, 22],
-        [3, 35, 11, 43, 1, 33, 9, 41],
-        [51, 19, 59, 27, 49, 17, 57, 25],
-        [15, 47, 7, 39, 13, 45, 5, 37],
-        [63, 31, 55, 23, 61, 29, 53, 21]
-    ], dtype=np.float32) / 64.0
+# ------------------------------------------------------------------------------
+# Ordered (Bayer) dithering kernels, one specialized routine per color space.
+# Each pixel is independent, so they read and write the uint8 image in place.
+# The 8x8 threshold matrix is indexed periodically ([y & 7, x & 7]) rather
+# than tiled to the image size.
+# ------------------------------------------------------------------------------
+BAYER_8X8 = np.array([
+    [0, 32, 8, 40, 2, 34, 10, 42],
+    [48, 16, 56, 24, 50, 18, 58, 26],
+    [12, 44, 4, 36, 14, 46, 6, 38],
+    [60, 28, 52, 20, 62, 30, 54, 22],
+    [3, 35, 11, 43, 1, 33, 9, 41],
+    [51, 19, 59, 27, 49, 17, 57, 25],
+    [15, 47, 7, 39, 13, 45, 5, 37],
+    [63, 31, 55, 23, 61, 29, 53, 21]
+], dtype=np.float32) / 64.0
 
-    img = img.copy()
-    img_array = np.array(img, dtype=np.uint8)
-    has_alpha = (img.mode == 'RGBA')
-    if has_alpha:
-        alpha_channel = img_array[:, :, 3]
-        alpha_mask = alpha_channel > 0
-    else:
-        alpha_mask = np.ones((img_array.shape[0], img_array.shape[1]), dtype=np.bool_)
+@njit(parallel=True, cache=True)
+def ordered_dithering_rgb(image, alpha_mask, bayer, adjustment_factor, palette_rgb):
+    h, w = image.shape[:2]
+    n_palette = palette_rgb.shape[0]
+    for y in prange(h):
+        for x in range(w):
+            if not alpha_mask[y, x]:
+                continue
+            r = image[y, x, 0]
+            g = image[y, x, 1]
+            b = image[y, x, 2]
+            brightness = (r + g + b) / 765.0
+            threshold = bayer[y & 7, x & 7]
+            if brightness < threshold:
+                factor = 1.0 - adjustment_factor
+            else:
+                factor = 1.0 + adjustment_factor
 
-    height, width = img_array.shape[:2]
+            r_adj = max(0, min(r * factor, 255))
+            g_adj = max(0, min(g * factor, 255))
+            b_adj = max(0, min(b * factor, 255))
 
-    # Build palette
-    palette_rgb = np.array(list(color_key.values()), dtype=np.uint8)
-    if use_lab:
-        n_palette = palette_rgb.shape[0]
-        palette_lab = np.empty((n_palette, 3), dtype=np.float32)
-        for i in range(n_palette):
-            r, g, b = palette_rgb[i]
-            L, a_val, b_val = rgb_to_lab_numba(r, g, b)
-            palette_lab[i, 0] = L
-            palette_lab[i, 1] = a_val
-            palette_lab[i, 2] = b_val
-    else:
-        palette_lab = np.empty((0, 3), dtype=np.float32)
+            best_idx = 0
+            best_dist = 1e10
+            for i in range(n_palette):
+                dr = r_adj - palette_rgb[i, 0]
+                dg = g_adj - palette_rgb[i, 1]
+                db = b_adj - palette_rgb[i, 2]
+                dist = dr*dr + dg*dg + db*db
+                if dist < best_dist:
+                    best_dist = dist
+                    best_idx = i
 
-    # Tile the Bayer matrix
-    tiled_bayer = np.tile(bayer_8x8, (height // 8 + 1, width // 8 + 1))
-    tiled_bayer = tiled_bayer[:height, :width].astype(np.float32)
+            image[y, x, 0] = palette_rgb[best_idx, 0]
+            image[y, x, 1] = palette_rgb[best_idx, 1]
+            image[y, x, 2] = palette_rgb[best_idx, 2]
 
-    # We'll separate into two specialized routines for clarity
-    @njit(parallel=True, cache=True)
-    def ordered_dithering_rgb(image, alpha_mask, tiled_bayer, adjustment_factor, palette_rgb):
-        h, w = image.shape[:2]
-        n_palette = palette_rgb.shape[0]
-        for y in prange(h):
-            for x in range(w):
-                if not alpha_mask[y, x]:
-                    continue
-                r = image[y, x, 0]
-                g = image[y, x, 1]
-                b = image[y, x, 2]
-                brightness = (r + g + b) / 765.0
-                threshold = tiled_bayer[y, x]
-                if brightness < threshold:
-                    factor = 1.0 - adjustment_factor
-                else:
-                    factor = 1.0 + adjustment_factor
+@njit(parallel=True, cache=True)
+def ordered_dithering_lab(image, alpha_mask, bayer, adjustment_factor, palette_rgb, palette_lab):
+    h, w = image.shape[:2]
+    n_palette = palette_rgb.shape[0]
+    for y in prange(h):
+        for x in range(w):
+            if not alpha_mask[y, x]:
+                continue
+            r = image[y, x, 0]
+            g = image[y, x, 1]
+            b = image[y, x, 2]
+            L, a_val, b_val = rgb_to_lab_numba(r, g, b)
+            L_norm = L / 255.0
+            threshold = bayer[y & 7, x & 7]
+            if L_norm < threshold:
+                L_adj = L_norm - adjustment_factor
+                if L_adj < 0.0:
+                    L_adj = 0.0
+            else:
+                L_adj = L_norm + adjustment_factor
+                if L_adj > 1.0:
+                    L_adj = 1.0
+            L_new = L_adj * 255.0
 
-                r_adj = max(0, min(r * factor, 255))
-                g_adj = max(0, min(g * factor, 255))
-                b_adj = max(0, min(b * factor, 255))
+            best_idx = 0
+            best_dist = 1e10
+            for i in range(n_palette):
+                dL = L_new - palette_lab[i, 0]
+                da = a_val - palette_lab[i, 1]
+                db = b_val - palette_lab[i, 2]
+                dist = dL*dL + da*da + db*db
+                if dist < best_dist:
+                    best_dist = dist
+                    best_idx = i
 
-                best_idx = 0
-                best_dist = 1e10
-                for i in range(n_palette):
-                    dr = r_adj - palette_rgb[i, 0]
-                    dg = g_adj - palette_rgb[i, 1]
-                    db = b_adj - palette_rgb[i, 2]
-                    dist = dr*dr + dg*dg + db*db
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_idx = i
+            image[y, x, 0] = palette_rgb[best_idx, 0]
+            image[y, x, 1] = palette_rgb[best_idx, 1]
+            image[y, x, 2] = palette_rgb[best_idx, 2]
 
-                image[y, x, 0] = palette_rgb[best_idx, 0]
-                image[y, x, 1] = palette_rgb[best_idx, 1]
-                image[y, x, 2] = palette_rgb[best_idx, 2]
 
-    @njit(parallel=True, cache=True)
-    def ordered_dithering_lab(image, alpha_mask, tiled_bayer, adjustment_factor, palette_rgb, palette_lab):
-        h, w = image.shape[:2]
-        n_palette = palette_rgb.shape[0]
-        for y in prange(h):
-            for x in range(w):
-                if not alpha_mask[y, x]:
-                    continue
-                r = image[y, x, 0]
-                g = image[y, x, 1]
-                b = image[y, x, 2]
-                L, a_val, b_val = rgb_to_lab_numba(r, g, b)
-                L_norm = L / 255.0
-                threshold = tiled_bayer[y, x]
-                if L_norm < threshold:
-                    L_adj = L_norm - adjustment_factor
-                    if L_adj < 0.0:
-                        L_adj = 0.0
-                else:
-                    L_adj = L_norm + adjustment_factor
-                    if L_adj > 1.0:
-                        L_adj = 1.0
-                L_new = L_adj * 255.0
+@register_processing_method(
+    'Pattern Dither',
+    default_params={'strength': 0.33},
+    description="Uses an 8x8 Bayer matrix to apply dithering in a pattern. Pretty :3"
+)
+def ordered_dithering(img, color_key, params):
+    global use_lab
+    strength = params.get('strength', 1.0)
+    adjustment_factor = 0.3 * strength
 
-                best_idx = 0
-                best_dist = 1e10
-                for i in range(n_palette):
-                    dL = L_new - palette_lab[i, 0]
-                    da = a_val - palette_lab[i, 1]
-                    db = b_val - palette_lab[i, 2]
-                    dist = dL*dL + da*da + db*db
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_idx = i
+    # np.array() copies, so the kernels can quantize this buffer in place
+    img_array = np.array(img, dtype=np.uint8)
+    has_alpha = (img.mode == 'RGBA')
+    if has_alpha:
+        alpha_channel = img_array[:, :, 3]
+        alpha_mask = alpha_channel > 0
+    else:
+        alpha_mask = np.ones((img_array.shape[0], img_array.shape[1]), dtype=np.bool_)
 
-                image[y, x, 0] = palette_rgb[best_idx, 0]
-                image[y, x, 1] = palette_rgb[best_idx, 1]
-                image[y, x, 2] = palette_rgb[best_idx, 2]
+    _, palette_rgb, palette_lab = get_palette_arrays(color_key, use_lab)
 
-    proc_img = img_array.astype(np.float32)
     if use_lab and palette_lab.shape[0] > 0:
-        ordered_dithering_lab(proc_img, alpha_mask, tiled_bayer, adjustment_factor, palette_rgb.astype(np.float32), palette_lab)
+        ordered_dithering_lab(img_array, alpha_mask, BAYER_8X8, adjustment_factor, palette_rgb, palette_lab)
     else:
-        ordered_dithering_rgb(proc_img, alpha_mask, tiled_bayer, adjustment_factor, palette_rgb.astype(np.float32))
+        ordered_dithering_rgb(img_array, alpha_mask, BAYER_8X8, adjustment_factor, palette_rgb)
 
-    proc_img = np.clip(proc_img, 0, 255).astype(np.uint8)
     if has_alpha:
-        img_array[:, :, :3] = proc_img[:, :, :3]
-        result_img = Image.fromarray(img_array, 'RGBA')
-    else:
-        result_img = Image.fromarray(proc_img[:, :, :3], 'RGB')
-
-    return result_img
+        return Image.fromarray(img_array, 'RGBA')
+    return Image.fromarray(img_array[:, :, :3], 'RGB')
 
 
 
 @njit
-def find_nearest_color(px, palette):
+def find_nearest_color(r, g, b, palette):
     """
-    px: float32[3] - a single pixel (R,G,B) in float
+    r, g, b: float32 - a single pixel (R,G,B) in float
     palette: float32[n,3] - palette of colors
-    Returns the (R,G,B) of the nearest color in palette.
+    Returns the index of the nearest color in palette.
     """
     best_index = 0
     best_dist = 1e12
     for i in range(palette.shape[0]):
-        dr = px[0] - palette[i, 0]
-        dg = px[1] - palette[i, 1]
-        db = px[2] - palette[i, 2]
+        dr = r - palette[i, 0]
+        dg = g - palette[i, 1]
+        db = b - palette[i, 2]
         dist = dr * dr + dg * dg + db * db
         if dist < best_dist:
             best_dist = dist
             best_index = i
-    return palette[best_index]
+    return best_index
+
+# Noise source for random_dither (PCG64; Generator methods hold the bit
+# generator's lock, so concurrent frames can share it)
+DITHER_RNG = np.random.default_rng()
 
 ##############################################################################
 # 2) The main dithering loop, compiled by Numba
@@ -2004,56 +2332,23 @@ def dither_loop(arr, rand_offs, palette, strength):
     rand_offs: float32 array [H,W,3] (precomputed random offsets)
     palette: float32 array [N,3]
     strength: float
+
+    Works channel by channel on scalars so no per-pixel arrays are allocated.
     """
-    error_scale = 0.2 * strength
     height, width, _ = arr.shape
 
     for y in prange(height):
         for x in range(width):
-            old_pixel = arr[y, x]
-
-            # Add random offset
-            noisy_pixel = old_pixel + rand_offs[y, x]
-
-            # Clamp to [0..255]
-            for c in range(3):
-                if noisy_pixel[c] < 0:
-                    noisy_pixel[c] = 0
-                elif noisy_pixel[c] > 255:
-                    noisy_pixel[c] = 255
+            # Add random offset, clamped to [0..255]
+            noisy_r = np.float32(min(max(arr[y, x, 0] + rand_offs[y, x, 0], 0.0), 255.0))
+            noisy_g = np.float32(min(max(arr[y, x, 1] + rand_offs[y, x, 1], 0.0), 255.0))
+            noisy_b = np.float32(min(max(arr[y, x, 2] + rand_offs[y, x, 2], 0.0), 255.0))
 
             # Quantize to nearest color
-            new_pixel = find_nearest_color(noisy_pixel, palette)
-            arr[y, x] = new_pixel
-
-            # Compute error
-            quant_error = old_pixel - new_pixel
-
-            # Potential neighbors
-            neighbors = []
-            if x + 1 < width:
-                neighbors.append((y, x + 1))
-            if y + 1 < height:
-                neighbors.append((y + 1, x))
-            if (x + 1 < width) and (y + 1 < height):
-                neighbors.append((y + 1, x + 1))
-            if (x - 1 >= 0) and (y + 1 < height):
-                neighbors.append((y + 1, x - 1))
-
-            # Distribute error to up to 2 neighbors
-            n_count = min(len(neighbors), 2)
-            for i in range(n_count):
-                ny = int(neighbors[i][0])
-                nx = int(neighbors[i][1])
-
-                arr[ny, nx] += quant_error * error_scale
-
-                # Clamp neighbors
-                for c in range(3):
-                    if arr[ny, nx, c] < 0:
-                        arr[ny, nx, c] = 0
-                    elif arr[ny, nx, c] > 255:
-                        arr[ny, nx, c] = 255
+            idx = find_nearest_color(noisy_r, noisy_g, noisy_b, palette)
+            arr[y, x, 0] = palette[idx, 0]
+            arr[y, x, 1] = palette[idx, 1]
+            arr[y, x, 2] = palette[idx, 2]
 
 ##############################################################################
 # 3) The high-level function your code calls
@@ -2080,11 +2375,10 @@ def random_dither(img, color_key, params):
     strength = params.get('strength', 1.0)
 
     # Convert color_key (dict) -> array of shape (N,3)
-    color_array = np.array(list(color_key.values()), dtype=np.float32)
+    _, color_array, _ = get_palette_arrays(color_key, False)
 
-    # Separate alpha if needed
+    # Separate alpha if needed (np.array copies, so img itself is untouched)
     has_alpha = (img.mode == 'RGBA')
-    img = img.copy()
     if has_alpha:
         rgba_data = np.array(img, dtype=np.float32)
         alpha_channel = rgba_data[:, :, 3].copy()  # preserve alpha
@@ -2096,11 +2390,13 @@ def random_dither(img, color_key, params):
 
     # Precompute random offsets in Python (Numba's random is limited)
     amplitude = 30.0 * strength
-    # shape (h, w, 3) each in [-amplitude, amplitude]
-    random_offsets = (2.0 * np.random.rand(h, w, 3) - 1.0) * amplitude
+    # shape (h, w, 3) each in [-amplitude, amplitude), drawn straight as float32
+    random_offsets = DITHER_RNG.random((h, w, 3), dtype=np.float32)
+    random_offsets *= 2.0 * amplitude
+    random_offsets -= amplitude
 
     # Run dithering
-    dither_loop(work_array, random_offsets.astype(np.float32), color_array, strength)
+    dither_loop(work_array, random_offsets, color_array, strength)
 
     # Convert to uint8
     work_array = np.clip(work_array, 0, 255).astype(np.uint8)
@@ -2230,19 +2526,24 @@ def process_and_save_image(img, target_size, process_mode, use_lab_flag, process
                 message_callback("Keeping original image dimensions.")
 
 
-        # Preprocess the image if needed
+        # Preprocessing and brightness both work on the numpy array; only
+        # convert back to PIL once at the end.
+        img_np = None
         if preprocess_flag:
-            img_np = np.array(img)
-            img_np = preprocess_image(img_np, color_key_array, message_callback)
+            img_np = preprocess_image(np.asarray(img), color_key_array, message_callback)
             if message_callback:
                 message_callback("Image preprocessed.")
-            img = Image.fromarray(img_np, 'RGBA')
 
         global brightness
         if brightness != 0.5:
-            img = adjust_brightness(img, brightness)
+            if img_np is None:
+                img_np = np.asarray(img)
+            img_np = cv2.LUT(img_np, get_brightness_lut(brightness))
             if message_callback:
                 message_callback("Manual Brightness Adjusted")
+
+        if img_np is not None:
+            img = Image.fromarray(img_np, 'RGBA')
         # Construct color_key from color_key_array
         color_key = build_color_key(color_key_array)
         
@@ -2255,20 +2556,25 @@ def process_and_save_image(img, target_size, process_mode, use_lab_flag, process
         # Save a preview of the processed image in 'preview' folder
         create_and_clear_preview_folder(message_callback)
 
-        # Apply transparency filtering for the preview
-        img = img.copy()
-        pixels = img.load()
-        width, height = img.size
-        for y in range(height):
-            for x in range(width):
-                pixel = pixels[x, y]
-                if len(pixel) == 4 and pixel[3] <= 191:  # RGBA and alpha <= 191
-                    pixels[x, y] = (0, 0, 0, 0)  # Make fully transparent
+        # Apply transparency filtering for the preview and crop to the solid
+        # area, both on one array
+        if img.mode == 'RGBA':
+            img_arr = np.array(img)
+            alpha = img_arr[:, :, 3]
+            img_arr[alpha <= 191] = 0  # Make alpha <= 191 fully transparent
+            rows = np.flatnonzero(alpha.any(axis=1))
+            cols = np.flatnonzero(alpha.any(axis=0))
+            if rows.size:
+                img_arr = img_arr[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+                img = Image.fromarray(img_arr, 'RGBA')
+            else:
+                img = Image.new("RGBA", (1, 1), (0, 0, 0, 0))
+        else:
+            img = crop_to_solid_area(img)
 
         # Save the preview image
-        img = crop_to_solid_area(img)
         
-        preview_path = exe_path_fs('game_data/stamp_preview/preview.png')
+        preview_path = PREVIEW_PNG_PATH
         save_image(img, preview_path, color_key_array)
         if message_callback:
             message_callback(f"Preview saved at: {preview_path}")
@@ -2278,9 +2584,9 @@ def process_and_save_image(img, target_size, process_mode, use_lab_flag, process
         scaled_width = round(width * 0.1, 1)
         scaled_height = round(height * 0.1, 1)
 
-        current_dir = exe_path_fs('game_data/current_stamp_data')
+        current_dir = CURRENT_STAMP_DIR
         os.makedirs(current_dir, exist_ok=True)  # Ensure the directory exists
-        output_file_path = exe_path_fs('game_data/current_stamp_data/stamp.txt')
+        output_file_path = CURRENT_STAMP_DIR / 'stamp.txt'
 
         with open(output_file_path, 'w') as f:
             # Write the first line with scaled width, height, and 'img'
@@ -2288,38 +2594,18 @@ def process_and_save_image(img, target_size, process_mode, use_lab_flag, process
             if message_callback:
                 message_callback(f"Scaled dimensions written: {scaled_width},{scaled_height},img")
 
-            # Process each pixel
-            pixels = img.load()
-            for y in range(height - 1, -1, -1):  # Process from bottom to top
-                for x in range(width):
-                    try:
-                        pixel = pixels[x, y]
-
-                        # Handle both RGB and RGBA images
-                        if len(pixel) == 4:  # RGBA
-                            r, g, b, a = pixel
-                        elif len(pixel) == 3:  # RGB
-                            r, g, b = pixel
-                            a = 255  # Assume fully opaque
-                        else:
-                            raise ValueError(f"Unexpected pixel format at ({x}, {y}): {pixel}")
-
-                        if a <= 191:  # Skip pixels with alpha <= 191 (75% opacity)
-                            continue
-
-                        # Map the pixel to the closest color
-                        closest_color_num = find_closest_color((r, g, b), color_key)
-
-                        # Scale the coordinates
-                        scaled_x = round(x * 0.1, 1)
-                        scaled_y = round((height - 1 - y) * 0.1, 1)
-
-                        # Write to the file
-                        f.write(f"{scaled_x},{scaled_y},{closest_color_num}\n")
+            # Rows are written bottom to top, so work on the vertically flipped
+            # array: row r of it is scaled_y = r * 0.1
+            img_arr = np.asarray(img if img.mode in ('RGB', 'RGBA') else img.convert('RGBA'))[::-1]
+            if img_arr.shape[2] == 4:
+                opaque = img_arr[:, :, 3] > 191  # Skip pixels with alpha <= 191 (75% opacity)
+            else:
+                opaque = np.ones(img_arr.shape[:2], dtype=np.bool_)
+            rows, xs = np.nonzero(opaque)
 
-                    except Exception as e:
-                        if message_callback:
-                            message_callback(f"Error processing pixel at ({x}, {y}): {e}")
+            # Map every written pixel to its closest color at once
+            color_nums = find_closest_colors(img_arr[:, :, :3][opaque], color_key)
+            f.write(format_pixel_lines(xs, rows, color_nums))
 
         if message_callback:
             message_callback(f"Processing complete! Output saved to: {output_file_path}")
@@ -2328,18 +2614,19 @@ def process_and_save_image(img, target_size, process_mode, use_lab_flag, process
         if error_callback:
             error_callback(f"An error occurred: {e}")
 
-def save_image(img, preview_path, color_key_array):
+def save_image(img, preview_path, color_key_array, compress_level=6):
     """
     Processes an RGBA PIL image by mapping pixels to colors based on a color key array
     and a predefined COLOR key, then saves the result as a PNG.
 
     Parameters:
-    - img: Input image as a PIL RGBA image.
+    - img: Input image as a PIL RGBA image or an (H, W, 4) uint8 array.
     - preview_path: Path to save the processed image.
     - color_key_array: List of dictionaries with color information to match and transform.
+    - compress_level: zlib level used for the PNG (0-9).
 
     Returns:
-    - None
+    - The saved RGBA PIL image.
     """
     # Define the COLOR key mapping numbers to new colors
 
@@ -2413,7 +2700,7 @@ def save_image(img, preview_path, color_key_array):
     hex_to_number = {entry['hex']: entry['number'] for entry in color_key_array}
 
     # Convert the image to a NumPy array for processing
-    img_array = np.array(img)  # Shape: (H, W, 4) for RGBA
+    img_array = np.asarray(img)  # Shape: (H, W, 4) for RGBA; arrays are read in place
 
     # Separate alpha channel for transparency handling
     rgb_array = img_array[:, :, :3]
@@ -2444,7 +2731,8 @@ def save_image(img, preview_path, color_key_array):
     output_img = Image.fromarray(output_array, mode='RGBA')
 
     # Save the processed image to the preview path
-    output_img.save(preview_path, format='PNG')
+    output_img.save(preview_path, format='PNG', compress_level=compress_level)
+    return output_img
 
 
 
@@ -2462,7 +2750,7 @@ def hex_to_rgb(hex_str):
         tuple: A tuple of integers representing the RGB values, e.g., (255, 231, 197).
     """
     try:
-        return tuple(int(hex_str[i:i+2], 16) for i in (0, 2, 4))
+        return parse_hex_rgb(hex_str)
     except Exception:
         return (0, 0, 0)  # Default to black on error
 
@@ -2495,6 +2783,57 @@ def find_closest_color2(pixel, color_key_array, color_key_numbers):
     else:
         return -1  # Indicates no match found
 
+
+def closest_color_numbers(frame_array, color_key_rgb, color_key_numbers):
+    """
+    Map every opaque pixel (alpha > 191) of an RGBA frame array to the number of
+    its closest color key in one batched lookup.
+
+    Returns:
+        np.ndarray: int16 (H, W) array of color numbers, -1 where transparent.
+    """
+    mask = frame_array[:, :, 3] > 191
+    numbers = np.full(mask.shape, -1, dtype=np.int16)
+    indices = find_closest_indices_rgb(frame_array[:, :, :3][mask], color_key_rgb)
+    numbers[mask] = color_key_numbers[indices]
+    return numbers
+
+def load_frame_color_numbers(frame, color_key_rgb, color_key_numbers):
+    """
+    Map a saved frame, given as a PIL image or the path to its PNG, with
+    closest_color_numbers. Returns None if the frame file does not exist.
+    """
+    if isinstance(frame, Image.Image):
+        return closest_color_numbers(np.asarray(frame.convert('RGBA')), color_key_rgb, color_key_numbers)
+    if not os.path.exists(frame):
+        return None
+    with Image.open(frame) as frame_img:
+        frame_array = np.array(frame_img.convert('RGBA'))
+    return closest_color_numbers(frame_array, color_key_rgb, color_key_numbers)
+
+# str(round(i * 0.1, 1)) for every pixel index seen so far; grown on demand
+SCALED_COORD_STRINGS = []
+
+
+def format_pixel_lines(xs, ys, colors):
+    """
+    Build the "x,y,color" lines for stamp.txt / frames.txt in one string so the
+    caller can write them with a single f.write. Coordinates are scaled by 0.1
+    and rounded to one decimal, exactly as round(v * 0.1, 1) prints.
+    """
+    if len(xs) == 0:
+        return ""
+    needed = int(max(xs.max(), ys.max())) + 1
+    if len(SCALED_COORD_STRINGS) < needed:
+        SCALED_COORD_STRINGS.extend(
+            str(round(i * 0.1, 1)) for i in range(len(SCALED_COORD_STRINGS), needed)
+        )
+    coords = SCALED_COORD_STRINGS
+    return "".join([
+        f"{coords[x]},{coords[y]},{c}\n"
+        for x, y, c in zip(xs.tolist(), ys.tolist(), colors.tolist())
+    ])
+
 def process_and_save_gif(
     image_path,
     target_size,
@@ -2529,7 +2868,7 @@ def process_and_save_gif(
         set_gif_ready_false()
 
         # Open frames.txt and clear its contents
-        current_dir = exe_path_fs('game_data/current_stamp_data')
+        current_dir = CURRENT_STAMP_DIR
         os.makedirs(current_dir, exist_ok=True)  # Ensure the directory exists
         frames_txt_path = os.path.join(current_dir, 'frames.txt')
         with open(frames_txt_path, 'w'):
@@ -2553,8 +2892,9 @@ def process_and_save_gif(
         # Determine delay uniformity
         uniform_delay = delays[0] if all(d == delays[0] for d in delays) else -1
 
-        # Save frames to 'Frames' directory (and clear it first)
-        save_frames(
+        # Save frames to 'Frames' directory (and clear it first); the saved
+        # images are kept so later steps don't decode the PNGs again
+        saved_frames = save_frames(
             img,
             target_size,
             process_mode,
@@ -2573,10 +2913,10 @@ def process_and_save_gif(
 
         # Construct color_key_rgb and color_key_numbers from color_key_array
         color_key_rgb = np.array([hex_to_rgb(color['hex']) for color in color_key_array], dtype=np.float32)
-        color_key_numbers = np.array([color['number'] for color in color_key_array], dtype=np.int32)
+        color_key_numbers = np.array([color['number'] for color in color_key_array], dtype=np.int16)
 
         # Load the first frame
-        first_frame_path = exe_path_fs('game_data/frames/frame_1.png')
+        first_frame_path = FRAMES_DIR / 'frame_1.png'
 
         if not os.path.exists(first_frame_path):
             error_message = f"First frame not found at {first_frame_path}"
@@ -2598,59 +2938,42 @@ def process_and_save_gif(
                 if message_callback:
                     message_callback(f"Header written to stamp.txt: {scaled_width},{scaled_height},gif,{total_frames},{uniform_delay}")
 
-                # Convert frame to NumPy array
+                # Map the whole frame to color numbers (-1 = transparent) at once
                 frame_array = np.array(first_frame.convert('RGBA'))
-                alpha_channel = frame_array[:, :, 3]
-                mask = alpha_channel > 191  # Opaque pixels
-                rgb_array = frame_array[:, :, :3].astype(np.float32)
-
-                # Initialize Frame1Array and first_frame_pixels as 2D arrays
-                Frame1Array = -1 * np.ones((height, width), dtype=np.int32)
-                first_frame_pixels = -1 * np.ones((height, width), dtype=np.int32)
+                first_frame_pixels = closest_color_numbers(frame_array, color_key_rgb, color_key_numbers)
+                # Neither array is modified in place, so they can share the buffer
+                Frame1Array = first_frame_pixels
 
-                for y in range(height):
-                    for x in range(width):
-                        if mask[y, x]:
-                            pixel = rgb_array[y, x]
-                            color_num = find_closest_color2(pixel, color_key_rgb, color_key_numbers)
-                            Frame1Array[y, x] = color_num
-                            first_frame_pixels[y, x] = color_num
-
-                            # Scale the coordinates
-                            scaled_x = round(x * 0.1, 1)
-                            scaled_y = round(y * 0.1, 1)
-
-                            # Write to stamp.txt
-                            stamp_file.write(f"{scaled_x},{scaled_y},{color_num}\n")
+                opaque = first_frame_pixels >= 0
+                ys, xs = np.nonzero(opaque)
+                stamp_file.write(format_pixel_lines(xs, ys, first_frame_pixels[opaque]))
 
         # Process subsequent frames
         header_frame_number = 1  # Start header numbering from 1
 
-        for frame_number in range(2, total_frames + 1):  # Start from frame 2
-            frame_path = exe_path_fs(f'game_data/frames/frame_{frame_number}.png')
-            if not os.path.exists(frame_path):
-                if message_callback:
-                    message_callback(f"Frame {frame_number} not found at {frame_path}")
-                continue
-
-            with Image.open(frame_path) as frame:
-                frame_array = np.array(frame.convert('RGBA'))
-                alpha_channel = frame_array[:, :, 3]
-                mask = alpha_channel > 191  # Opaque pixels
-                rgb_array = frame_array[:, :, :3].astype(np.float32)
-
-                # Initialize CurrentFrameArray
-                CurrentFrameArray = -1 * np.ones((height, width), dtype=np.int32)
-
-                for y in range(height):
-                    for x in range(width):
-                        if mask[y, x]:
-                            pixel = rgb_array[y, x]
-                            color_num = find_closest_color2(pixel, color_key_rgb, color_key_numbers)
-                            CurrentFrameArray[y, x] = color_num
+        # Frames map to color numbers independently, so decode and map them on
+        # a pool; only the diff against the previous frame runs in order.
+        frame_numbers = range(2, total_frames + 1)  # Start from frame 2
+        frames_dir_str = os.fspath(FRAMES_DIR)
+        frame_paths = [os.path.join(frames_dir_str, f'frame_{n}.png') for n in frame_numbers]
+        # Prefer the in-memory frames from save_frames over the PNGs on disk
+        frame_sources = saved_frames[1:] if saved_frames else frame_paths
+
+        with ThreadPoolExecutor(max_workers=TILE_WORKERS) as frame_executor:
+            mapped_frames = frame_executor.map(
+                lambda frame: load_frame_color_numbers(frame, color_key_rgb, color_key_numbers),
+                frame_sources
+            )
+            for frame_number, frame_path, CurrentFrameArray in zip(frame_numbers, frame_paths, mapped_frames):
+                if CurrentFrameArray is None:
+                    if message_callback:
+                        message_callback(f"Frame {frame_number} not found at {frame_path}")
+                    continue
 
                 # Find differences between CurrentFrameArray and Frame1Array
-                diffs = np.argwhere(CurrentFrameArray != Frame1Array)
+                changed = CurrentFrameArray != Frame1Array
+                ys, xs = np.nonzero(changed)
+                colors = CurrentFrameArray[changed]
 
                 # Write header and diffs to frames.txt
                 with open(frames_txt_path, 'a') as frames_file:
@@ -2661,15 +2984,10 @@ def process_and_save_gif(
                     else:
                         frames_file.write(f"frame,{header_frame_number}\n")
 
-                    for y, x in diffs:
-                        color_num = CurrentFrameArray[y, x]
-                        # Scale coordinates by multiplying by 0.1
-                        scaled_x = round(x * 0.1, 1)
-                        scaled_y = round(y * 0.1, 1)
-                        frames_file.write(f"{scaled_x},{scaled_y},{color_num}\n")
+                    frames_file.write(format_pixel_lines(xs, ys, colors))
 
-                # Update Frame1Array
-                Frame1Array = CurrentFrameArray.copy()
+                # Update Frame1Array (a fresh array every frame, so no copy needed)
+                Frame1Array = CurrentFrameArray
 
                 # Update progress
                 if progress_callback:
@@ -2679,7 +2997,9 @@ def process_and_save_gif(
                 header_frame_number += 1  # Increment header frame number
 
         # After processing all frames, compare last frame to first frame to complete the loop
-        diffs = np.argwhere(Frame1Array != first_frame_pixels)
+        changed = Frame1Array != first_frame_pixels
+        ys, xs = np.nonzero(changed)
+        colors = first_frame_pixels[changed]
 
         # Write header and diffs to frames.txt for the final loop
         with open(frames_txt_path, 'a') as frames_file:
@@ -2691,12 +3011,7 @@ def process_and_save_gif(
             else:
                 frames_file.write(f"frame,{final_frame_number}\n")
 
-            for y, x in diffs:
-                color_num = first_frame_pixels[y, x]
-                # Scale coordinates by multiplying by 0.1
-                scaled_x = round(x * 0.1, 1)
-                scaled_y = round(y * 0.1, 1)
-                frames_file.write(f"{scaled_x},{scaled_y},{color_num}\n")
+            frames_file.write(format_pixel_lines(xs, ys, colors))
 
         if message_callback:
             message_callback(f"Processing of animated image frames complete! Data saved to: {frames_txt_path}")
@@ -2709,7 +3024,8 @@ def process_and_save_gif(
             color_key_array,
             progress_callback,
             message_callback,
-            error_callback
+            error_callback,
+            frames=saved_frames
         )
         set_gif_ready_true()
         img.close()  # Close the image after processing
@@ -2761,7 +3077,7 @@ def process_and_save_video(
         # ---------------------------------------------------------------------
         set_gif_ready_false()
 
-        current_dir = exe_path_fs('game_data/current_stamp_data')
+        current_dir = CURRENT_STAMP_DIR
         os.makedirs(current_dir, exist_ok=True)
 
         frames_txt_path = os.path.join(current_dir, 'frames.txt')
@@ -2770,10 +3086,8 @@ def process_and_save_video(
             pass
 
         # Clear and prepare 'Frames' directory
-        frames_dir = exe_path_fs('game_data/frames')
-        if os.path.exists(frames_dir):
-            shutil.rmtree(frames_dir)
-        os.makedirs(frames_dir, exist_ok=True)
+        frames_dir = FRAMES_DIR
+        clear_folder(frames_dir, message_callback)
 
         # Create and clear 'preview' folder
         preview_folder = create_and_clear_preview_folder(message_callback)
@@ -2858,23 +3172,18 @@ def process_and_save_video(
                 # Ensure RGBA
                 if frame.mode != 'RGBA':
                     frame = frame.convert('RGBA')
-                else:
-                    frame = frame.copy()
 
-                # Make fully transparent any pixels with <80% opacity
-                pixels = frame.load()
-                width, height = frame.size
+                # Make fully transparent any pixels with <80% opacity, on a
+                # NumPy copy instead of per-pixel PixelAccess writes
                 opacity_threshold = 204  # 80% of 255
-                for y in range(height):
-                    for x in range(width):
-                        r, g, b, a = pixels[x, y]
-                        if a < opacity_threshold:
-                            pixels[x, y] = (0, 0, 0, 0)
+                frame_arr = np.array(frame)
+                frame_arr[frame_arr[:, :, 3] < opacity_threshold] = 0
+                frame = Image.fromarray(frame_arr, 'RGBA')
 
                 # Save as PNG
                 frame_filename = f"frame_{kept_count}.png"
                 frame_path = os.path.join(frames_dir, frame_filename)
-                frame.save(frame_path)
+                frame.save(frame_path, compress_level=FRAME_PNG_COMPRESS_LEVEL)
                 kept_frames_paths.append(frame_path)
 
                 # Progress callback
@@ -2911,7 +3220,7 @@ def process_and_save_video(
 
         # Convert color_key_array for fast color matching
         color_key_rgb = np.array([hex_to_rgb(color['hex']) for color in color_key_array], dtype=np.float32)
-        color_key_numbers = np.array([color['number'] for color in color_key_array], dtype=np.int32)
+        color_key_numbers = np.array([color['number'] for color in color_key_array], dtype=np.int16)
 
         stamp_txt_path = os.path.join(current_dir, 'stamp.txt')
         with open(stamp_txt_path, 'w') as stamp_file:
@@ -2926,52 +3235,35 @@ def process_and_save_video(
                 if message_callback:
                     message_callback(f"Header => {scaled_width},{scaled_height},gif,{total_kept_frames},{uniform_delay}")
 
-                # Convert to RGBA and extract pixel data
+                # Convert to RGBA and map to color numbers (-1 = transparent)
                 frame_array = np.array(first_frame.convert('RGBA'))
-                alpha_channel = frame_array[:, :, 3]
-                mask = alpha_channel > 191  # Opaque
-                rgb_array = frame_array[:, :, :3].astype(np.float32)
-
-                # Arrays to track the reference and store original
-                Frame1Array = -1 * np.ones((height, width), dtype=np.int32)
-                first_frame_pixels = -1 * np.ones((height, width), dtype=np.int32)
-
-                for y in range(height):
-                    for x in range(width):
-                        if mask[y, x]:
-                            pixel = rgb_array[y, x]
-                            color_num = find_closest_color2(pixel, color_key_rgb, color_key_numbers)
-                            Frame1Array[y, x] = color_num
-                            first_frame_pixels[y, x] = color_num
-
-                            # Write scaled pixel coords + color
-                            scaled_x = round(x * 0.1, 1)
-                            scaled_y = round(y * 0.1, 1)
-                            stamp_file.write(f"{scaled_x},{scaled_y},{color_num}\n")
+                first_frame_pixels = closest_color_numbers(frame_array, color_key_rgb, color_key_numbers)
+                # Reference array; never modified in place, so it can share the buffer
+                Frame1Array = first_frame_pixels
+
+                opaque = first_frame_pixels >= 0
+                ys, xs = np.nonzero(opaque)
+                stamp_file.write(format_pixel_lines(xs, ys, first_frame_pixels[opaque]))
 
         # ---------------------------------------------------------------------
         # 6) Build 'frames.txt'
         # ---------------------------------------------------------------------
         header_frame_number = 1
 
-        for idx in range(1, total_kept_frames):
-            current_path = kept_frames_paths[idx]
-            with Image.open(current_path) as frame:
-                frame_array = np.array(frame.convert('RGBA'))
-                alpha_channel = frame_array[:, :, 3]
-                mask = alpha_channel > 191
-                rgb_array = frame_array[:, :, :3].astype(np.float32)
-
-                CurrentFrameArray = -1 * np.ones((height, width), dtype=np.int32)
-                for y in range(height):
-                    for x in range(width):
-                        if mask[y, x]:
-                            pixel = rgb_array[y, x]
-                            color_num = find_closest_color2(pixel, color_key_rgb, color_key_numbers)
-                            CurrentFrameArray[y, x] = color_num
+        # Map frames on a pool; diffs against the reference stay in order
+        with ThreadPoolExecutor(max_workers=TILE_WORKERS) as frame_executor:
+            mapped_frames = frame_executor.map(
+                lambda path: load_frame_color_numbers(path, color_key_rgb, color_key_numbers),
+                kept_frames_paths[1:]
+            )
+            for idx, CurrentFrameArray in enumerate(mapped_frames, start=1):
+                if CurrentFrameArray is None:
+                    raise FileNotFoundError(f"Frame not found at {kept_frames_paths[idx]}")
 
                 # Differences from reference
-                diffs = np.argwhere(CurrentFrameArray != Frame1Array)
+                changed = CurrentFrameArray != Frame1Array
+                ys, xs = np.nonzero(changed)
+                colors = CurrentFrameArray[changed]
 
                 with open(frames_txt_path, 'a') as frames_file:
                     # Write frame header
@@ -2982,14 +3274,10 @@ def process_and_save_video(
                     else:
                         frames_file.write(f"frame,{header_frame_number}\n")
 
-                    for (dy, dx) in diffs:
-                        color_num = CurrentFrameArray[dy, dx]
-                        scaled_x = round(dx * 0.1, 1)
-                        scaled_y = round(dy * 0.1, 1)
-                        frames_file.write(f"{scaled_x},{scaled_y},{color_num}\n")
+                    frames_file.write(format_pixel_lines(xs, ys, colors))
 
-                # Update reference
-                Frame1Array = CurrentFrameArray.copy()
+                # Update reference (freshly allocated each frame)
+                Frame1Array = CurrentFrameArray
 
                 if progress_callback:
                     progress = (idx / total_kept_frames) * 100
@@ -3000,7 +3288,9 @@ def process_and_save_video(
         # ---------------------------------------------------------------------
         # 7) Compare final frame to first frame => "close the loop"
         # ---------------------------------------------------------------------
-        diffs = np.argwhere(Frame1Array != first_frame_pixels)
+        changed = Frame1Array != first_frame_pixels
+        ys, xs = np.nonzero(changed)
+        colors = first_frame_pixels[changed]
         with open(frames_txt_path, 'a') as frames_file:
             final_frame_number = header_frame_number
             if uniform_delay == -1:
@@ -3009,11 +3299,7 @@ def process_and_save_video(
             else:
                 frames_file.write(f"frame,{final_frame_number}\n")
 
-            for (dy, dx) in diffs:
-                color_num = first_frame_pixels[dy, dx]
-                scaled_x = round(dx * 0.1, 1)
-                scaled_y = round(dy * 0.1, 1)
-                frames_file.write(f"{scaled_x},{scaled_y},{color_num}\n")
+            frames_file.write(format_pixel_lines(xs, ys, colors))
 
         if message_callback:
             message_callback(f"Video frames processed! Data saved to: {frames_txt_path}")
@@ -3149,21 +3435,16 @@ def save_frames(img, target_size, process_mode, use_lab_flag, process_params, re
                 progress_callback, message_callback, error_callback):
     """
     Saves each frame of the animated image to the 'Frames' directory after preprocessing, resizing, and applying the selected processing method.
+    Returns the saved frames as a list of RGBA PIL images (None on error), so
+    callers can use them without decoding the PNGs again.
     """
     try:
 
-        output_folder = exe_path_fs("game_data/frames")
-        os.makedirs(output_folder, exist_ok=True)
-
         # Delete the contents of the 'Frames' folder before starting
-        for filename in os.listdir(output_folder):
-            file_path = output_folder / filename
-            try:
-                if os.path.isfile(file_path) or os.path.islink(file_path):
-                    os.unlink(file_path)
-            except Exception as e:
-                if message_callback:
-                    message_callback(f'Failed to delete {file_path}. Reason: {e}')
+        output_folder = FRAMES_DIR
+        # Plain string joins; building a Path per frame is measurably slower
+        output_folder_str = os.fspath(output_folder)
+        clear_folder(output_folder, message_callback)
 
         total_frames = img.n_frames
         if message_callback:
@@ -3171,17 +3452,8 @@ def save_frames(img, target_size, process_mode, use_lab_flag, process_params, re
 
         # Construct color_key from color_key_array
         color_key = build_color_key(color_key_array)
-     
-        
-
-        for frame_number in range(1, total_frames + 1):  # Start frame numbering from 1
-            img.seek(frame_number - 1)
-            frame = img.copy()  # Ensure we have a writable copy of the frame
-
-            # Prepare the image (convert to RGBA if needed)
-            frame = prepare_image(frame)
-
 
+        def process_and_save_frame(frame_number, frame):
             # Resize the image if needed
             if target_size is not None:
                 frame = resize_image(frame, target_size)
@@ -3199,100 +3471,163 @@ def save_frames(img, target_size, process_mode, use_lab_flag, process_params, re
                     message_callback("Manual Brightness Adjusted")
             # Apply the processing method to the frame
             frame = process_image(frame, color_key, process_mode, process_params)
-            # Handle translucent pixels by creating a writable copy
+            # Ensure image is in RGBA mode; np.array below makes the one
+            # writable copy the threshold needs
             if frame.mode != 'RGBA':
-                frame = frame.convert('RGBA')  # Ensure image is in RGBA mode
-            else:
-                frame = frame.copy()  # Make a writable copy if it's already RGBA
+                frame = frame.convert('RGBA')
 
-            pixels = frame.load()
-            width, height = frame.size
             opacity_threshold = 204  # 80% opacity (255 * 0.8)
 
-            for y in range(height):
-                for x in range(width):
-                    r, g, b, a = pixels[x, y]
-                    if a < opacity_threshold:
-                        pixels[x, y] = (0, 0, 0, 0)  # Fully transparent pixel
+            # Make every pixel under the threshold fully transparent in one pass
+            frame_arr = np.array(frame)
+            frame_arr[frame_arr[:, :, 3] < opacity_threshold] = 0
+
+            # Save the frame; save_image reads the array as is, so it isn't
+            # wrapped back into an image and copied out again
+            frame_file = os.path.join(output_folder_str, f"frame_{frame_number}.png")
+            return save_image(frame_arr, frame_file, color_key_array, FRAME_PNG_COMPRESS_LEVEL)
+
+        # PIL's multi-frame decoder isn't thread-safe, so snapshot every frame
+        # serially first. prepare_image's RGBA conversion already detaches the
+        # frame from the decoder, so palette frames aren't copied twice
+        raw_frames = []
+        for frame_number in range(1, total_frames + 1):  # Start frame numbering from 1
+            img.seek(frame_number - 1)
+            raw_frames.append(prepare_image(img))
+
+        # Frames are independent, so run the whole chain for each on a pool and
+        # collect the results in order
+        frame_numbers = range(1, total_frames + 1)
+        if TILE_WORKERS > 1 and total_frames > 1 and numba_threads_are_safe():
+            frame_executor = ThreadPoolExecutor(max_workers=TILE_WORKERS)
+            results = frame_executor.map(process_and_save_frame, frame_numbers, raw_frames)
+        else:
+            frame_executor = None
+            results = map(process_and_save_frame, frame_numbers, raw_frames)
 
-            # Save the frame
-            frame_file = output_folder / f"frame_{frame_number}.png"
-            save_image(frame, frame_file, color_key_array)
+        saved_frames = []
+        try:
+            for frame_number, saved_frame in zip(frame_numbers, results):
+                saved_frames.append(saved_frame)
 
-            if progress_callback:
-                progress = frame_number / total_frames * 100
-                progress_callback(progress)
+                if progress_callback:
+                    progress = frame_number / total_frames * 100
+                    progress_callback(progress)
+        finally:
+            if frame_executor is not None:
+                frame_executor.shutdown(cancel_futures=True)
 
         if message_callback:
             message_callback(f"All frames processed and saved to '{output_folder}'.")
+        return saved_frames
 
     except Exception as e:
         if error_callback:
             error_callback(f"An error occurred while saving frames: {e}")
+        return None
 
-def create_preview_gif(total_frames, delays, preview_folder, color_key_array, progress_callback=None, message_callback=None, error_callback=None):
+def create_preview_gif(total_frames, delays, preview_folder, color_key_array, progress_callback=None, message_callback=None, error_callback=None, frames=None):
     """
     Creates a new GIF using the frames in the 'Frames' directory and the delay data,
     then saves it as 'preview.gif' in the 'preview' folder.
+    If 'frames' (the images save_frames returned) is given, those are used
+    instead of reading the PNGs back from disk.
     """
     try:
-        frames_folder = exe_path_fs('game_data/frames')
-        output_gif_path = exe_path_fs('game_data/stamp_preview/preview.gif')
+        frames_folder = os.fspath(FRAMES_DIR)
+        output_gif_path = PREVIEW_GIF_PATH
         color_key_array = 1
 
-        frames = []
         frame_durations = []
 
-        # Ensure we process exactly 500 frames if more are available
-        frame_paths = [frames_folder / f"frame_{i}.png" for i in range(1, total_frames + 1)]
-        valid_frame_paths = [path for path in frame_paths if os.path.exists(path)]
-        valid_frame_paths = valid_frame_paths[:500]
+        if frames is not None:
+            # Ensure we process exactly 500 frames if more are available
+            frames = [frame.convert('RGBA') for frame in frames[:500]]
+            frame_durations = list(delays[:len(frames)])  # Duration in ms
+        else:
+            frames = []
+
+            # Ensure we process exactly 500 frames if more are available
+            frame_paths = [os.path.join(frames_folder, f"frame_{i}.png") for i in range(1, total_frames + 1)]
+            valid_frame_paths = [path for path in frame_paths if os.path.isfile(path)]
+            valid_frame_paths = valid_frame_paths[:500]
 
-        for frame_number, frame_path in enumerate(valid_frame_paths, start=1):
-            frame = Image.open(frame_path).convert('RGBA')
-            frames.append(frame)
-            frame_durations.append(delays[frame_number - 1])  # Duration in ms
+            for frame_number, frame_path in enumerate(valid_frame_paths, start=1):
+                frame = Image.open(frame_path).convert('RGBA')
+                frames.append(frame)
+                frame_durations.append(delays[frame_number - 1])  # Duration in ms
 
         if not frames:
             if error_callback:
                 error_callback("No frames found to create preview GIF.")
             return
 
-        # Prepare frames for GIF with transparency
-        converted_frames = []
-        for frame in frames:
-            # Ensure the frame has an alpha channel
-            frame = frame.convert('RGBA')
-
-            # Create a transparent background
-            background = Image.new('RGBA', frame.size, (0, 0, 0, 0))  # Transparent background
-
-            # Composite the frame onto the background
-            combined = Image.alpha_composite(background, frame)
-
-            # Convert to 'P' mode (palette) with an adaptive palette
-            # The 'transparency' parameter will handle the transparent color
-            combined_p = combined.convert('P', palette=Image.ADAPTIVE, colors=255)
-
-            # Find the color index that should be transparent
-            # Here, we assume that the first color in the palette is transparent
-            # Alternatively, you can search for a specific color
-            # For robustness, let's search for the color with alpha=0
-            transparent_color = None
-            for idx, color in enumerate(combined_p.getpalette()[::3]):
-                r = combined_p.getpalette()[idx * 3]
-                g = combined_p.getpalette()[idx * 3 + 1]
-                b = combined_p.getpalette()[idx * 3 + 2]
-                # Check if this color is used for transparency in the original image
-                # This is a simplistic check; for complex images, more logic may be needed
-                if (r, g, b) == (0, 0, 0):  # Assuming black is the transparent color
-                    transparent_color = idx
-                    break
+        # Prepare frames for GIF with transparency. The entry after the last
+        # real color is reserved as the transparency sentinel, so opaque black
+        # pixels stay visible and every frame shares the same transparency index
+        max_colors = 255
+
+        # Frames are independent until the GIF container is written, so the
+        # per-frame NumPy work below is spread over the tile pool
+        def pack_frame(frame):
+            # Pack RGB into one integer per pixel so colors compare as scalars
+            frame_array = np.asarray(frame.convert('RGBA'))
+            packed = (
+                (frame_array[:, :, 0].astype(np.uint32) << 16)
+                | (frame_array[:, :, 1].astype(np.uint32) << 8)
+                | frame_array[:, :, 2]
+            )
+            return frame_array, frame_array[:, :, 3] != 0, packed
+
+        frame_arrays, opaque_masks, packed_frames = zip(*tile_executor.map(pack_frame, frames))
+
+        # Collect the colors used by the whole animation; processed frames
+        # only use the color key, so they nearly always fit in a single
+        # shared palette
+        used_colors = np.unique(np.concatenate([
+            packed[mask] for packed, mask in zip(packed_frames, opaque_masks)
+        ]))
+
+        if used_colors.size <= max_colors:
+            # Map every frame onto the shared palette exactly, instead of
+            # running the adaptive quantizer once per frame. The palette holds
+            # only the used colors, so PIL's unused-color optimize pass has
+            # nothing to remove and is skipped, and LZW codes stay narrow
+            transparent_color = used_colors.size
+            optimize_palette = False
+            shared_palette = np.zeros((transparent_color + 1, 3), dtype=np.uint8)
+            shared_palette[:used_colors.size, 0] = used_colors >> 16
+            shared_palette[:used_colors.size, 1] = used_colors >> 8
+            shared_palette[:used_colors.size, 2] = used_colors
+            shared_palette[transparent_color] = (1, 2, 3)
+            palettes = [shared_palette.ravel().tolist()] * len(frames)
+
+            def index_frame(packed, mask):
+                indices = np.full(packed.shape, transparent_color, dtype=np.uint8)
+                indices[mask] = np.searchsorted(used_colors, packed[mask])
+                return indices
+
+            frame_indices = list(tile_executor.map(index_frame, packed_frames, opaque_masks))
+        else:
+            # Too many colors to share one palette; quantize each frame on its
+            # own with an adaptive palette
+            transparent_color = max_colors
+            optimize_palette = True
+
+            def quantize_frame(frame_array, mask):
+                quantized = Image.fromarray(frame_array, 'RGBA').convert('P', palette=Image.ADAPTIVE, colors=255)
+                palette = quantized.getpalette()[:255 * 3]
+                palette += [0, 0, 0] * (255 - len(palette) // 3) + [1, 2, 3]
+                indices = np.array(quantized)
+                indices[~mask] = transparent_color
+                return indices, palette
 
-            if transparent_color is None:
-                # If not found, append black to the palette and set it as transparent
-                combined_p.putpalette(combined_p.getpalette() + [0, 0, 0])
-                transparent_color = len(combined_p.getpalette()) // 3 - 1
+            frame_indices, palettes = zip(*tile_executor.map(quantize_frame, frame_arrays, opaque_masks))
+
+        converted_frames = []
+        for indices, palette in zip(frame_indices, palettes):
+            combined_p = Image.fromarray(indices, 'P')
+            combined_p.putpalette(palette)
 
             # Assign the transparency index
             combined_p.info['transparency'] = transparent_color
@@ -3307,7 +3642,8 @@ def create_preview_gif(total_frames, delays, preview_folder, color_key_array, pr
             duration=frame_durations,
             loop=0,
             transparency=converted_frames[0].info['transparency'],
-            disposal=2
+            disposal=2,
+            optimize=optimize_palette
         )
 
         if message_callback:
@@ -3319,23 +3655,34 @@ def create_preview_gif(total_frames, delays, preview_folder, color_key_array, pr
 
 
 
+def clear_folder(folder, message_callback=None):
+    """
+    Empty 'folder' by removing the whole tree, subfolders included, in one
+    shutil.rmtree call and recreating it, instead of unlinking its files one by
+    one. Best effort: anything that can't be deleted (e.g. a file held open on
+    Windows) is reported and skipped, and the rest is still removed.
+    """
+    def report(func, path, exc):
+        # The folder itself is recreated anyway, so only its contents matter
+        if isinstance(exc, FileNotFoundError) or os.fspath(path) == os.fspath(folder):
+            return
+        if message_callback:
+            message_callback(f'Failed to delete {path}. Reason: {exc}')
+
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(folder, onexc=report)
+    else:
+        shutil.rmtree(folder, onerror=lambda func, path, exc_info: report(func, path, exc_info[1]))
+    os.makedirs(folder, exist_ok=True)
+
+
 def create_and_clear_preview_folder(message_callback=None):
     """
     Creates and clears the 'preview' folder.
     Returns the path to the 'preview' folder.
     """
-    preview_folder = exe_path_fs('game_data/stamp_preview')
-    os.makedirs(preview_folder, exist_ok=True)
-
-    # Clear 'preview' folder
-    for filename in os.listdir(preview_folder):
-        file_path = preview_folder / filename
-        try:
-            if os.path.isfile(file_path) or os.path.islink(file_path):
-                os.unlink(file_path)
-        except Exception as e:
-            if message_callback:
-                message_callback(f'Failed to delete {file_path}. Reason: {e}')
+    preview_folder = STAMP_PREVIEW_DIR
+    clear_folder(preview_folder, message_callback)
     return preview_folder
 
 
@@ -3423,7 +3770,7 @@ def main(image_path, remove_bg, preprocess_flag, use_lab_flag, brightness_flag,
                 message_callback("Processing animated image...")
             # Save the image to a temporary path if it's from the clipboard
             if image_path == 'clip':
-                temp_image_path = exe_path_fs('imagePawcessor/temp/clipboard_image.webp')
+                temp_image_path = CLIPBOARD_IMAGE_PATH
                 img.save(temp_image_path, 'WEBP')
                 image_path = temp_image_path
             process_and_save_gif(image_path, resize_dim, process_mode, use_lab_flag, process_params, color_key_array, remove_bg, preprocess_flag, progress_callback, message_callback, error_callback)
@@ -3446,6 +3793,159 @@ class WorkerSignals(QObject):
     message = Signal(str)     # For status messages
     error = Signal(str)
 
+class RandomImageSignals(QObject):
+    loaded = Signal(QImage, object, int)  # Image (null if none loaded), entry, request id
+
+# Finished (scaled, faded) random backgrounds as QImages, keyed by
+# (path, mtime, size) and capped at RANDOM_IMAGE_CACHE_SIZE entries, oldest
+# first out. Filled from the thread pool, so it holds QImages, not QPixmaps.
+# Stale loaders still run to completion, so several can touch it at once;
+# every access goes through RANDOM_IMAGE_CACHE_LOCK
+RANDOM_IMAGE_CACHE = {}
+RANDOM_IMAGE_CACHE_SIZE = 16
+RANDOM_IMAGE_CACHE_LOCK = threading.Lock()
+
+class RandomImageLoader(QRunnable):
+    """
+    Picks a random readable image from the entries, then decodes, scales and
+    fades it into a QImage on the thread pool. QPixmap can only be used on the
+    GUI thread, so the receiving slot converts the finished image.
+    """
+    def __init__(self, entries, request_id, max_attempts=10):
+        super().__init__()
+        self.entries = entries
+        self.request_id = request_id
+        self.max_attempts = max_attempts
+        self.signals = RandomImageSignals()
+
+    def run(self):
+        # Try up to max_attempts random entries; read_image sniffs the header
+        # before decoding, so bad entries are cheap to skip
+        candidates = list(self.entries)
+        image = QImage()
+        selected_entry = None
+        attempts = 0
+        cache_key = None
+        while attempts < self.max_attempts and candidates:
+            index = random.randrange(len(candidates))
+            selected = candidates[index]
+            try:
+                stat = os.stat(selected['path'])
+            except OSError:
+                stat = None
+            if stat is not None and stat.st_size > 0:
+                cache_key = (selected['path'], stat.st_mtime_ns, stat.st_size)
+                with RANDOM_IMAGE_CACHE_LOCK:
+                    cached = RANDOM_IMAGE_CACHE.get(cache_key)
+                if cached is not None:
+                    self.signals.loaded.emit(cached, selected, self.request_id)
+                    return
+                image = self.read_image(selected['path'])
+                if not image.isNull():
+                    selected_entry = selected
+                    break
+            # Drop the bad entry by swapping in the last one, instead of an
+            # O(n) list.remove
+            candidates[index] = candidates[-1]
+            candidates.pop()
+            attempts += 1
+
+        if selected_entry is not None:
+            # Resize the image while maintaining aspect ratio
+            scaled_image = image.scaled(
+                680, 460,  # Max dimensions
+                Qt.KeepAspectRatio,
+                Qt.FastTransformation
+            )
+
+            # Apply transparency
+            image = QImage(scaled_image.size(), QImage.Format_ARGB32_Premultiplied)
+            image.fill(Qt.transparent)
+            painter = QPainter(image)
+            painter.setOpacity(0.9)
+            painter.drawImage(0, 0, scaled_image)
+            painter.end()
+
+            with RANDOM_IMAGE_CACHE_LOCK:
+                RANDOM_IMAGE_CACHE[cache_key] = image
+                while len(RANDOM_IMAGE_CACHE) > RANDOM_IMAGE_CACHE_SIZE:
+                    RANDOM_IMAGE_CACHE.pop(next(iter(RANDOM_IMAGE_CACHE)))
+
+        self.signals.loaded.emit(image, selected_entry, self.request_id)
+
+    @staticmethod
+    def read_image(path):
+        """
+        Decode an image, letting the JPEG codec scale large photos down to the
+        display size while decoding instead of decoding every source pixel.
+        Other formats are read at full size so pixel art keeps its hard edges.
+        Files whose header doesn't parse return a null image without decoding.
+        """
+        reader = QImageReader(path)
+        if not reader.canRead():
+            return QImage()
+        source_size = reader.size()
+        if source_size.isEmpty():
+            return QImage()
+        if (
+            bytes(reader.format()) == b'jpeg'
+            and source_size.isValid()
+            and (source_size.width() > 680 or source_size.height() > 460)
+        ):
+            reader.setScaledSize(source_size.scaled(680, 460, Qt.KeepAspectRatio))
+        return reader.read()
+
+
+# Decoded preview GIF, keyed by (path, mtime, size) so it is only rebuilt when
+# a new stamp overwrites the file
+PREVIEW_GIF_FRAMES = {}
+
+
+def load_preview_gif_frames(gif_path):
+    """
+    Decode a preview GIF into nearest-neighbour scaled QPixmaps (fit to 680x460)
+    plus per-frame durations, reusing the last result while the file is
+    unchanged. Must be called on the GUI thread.
+    """
+    stat = os.stat(gif_path)
+    key = (os.fspath(gif_path), stat.st_mtime_ns, stat.st_size)
+    cached = PREVIEW_GIF_FRAMES.get(key)
+    if cached is not None:
+        return cached
+
+    with Image.open(gif_path) as gif:
+        # Extract all frames from the GIF
+        frames = []
+        durations = []
+        for frame in ImageSequence.Iterator(gif):
+            # Resize each frame with NEAREST interpolation. Premultiply while the
+            # frame is still small: RGBa is what QPixmap stores, so fromImage
+            # only has to reorder the bytes of the scaled frame
+            frame = frame.convert("RGBA").convert("RGBa")
+            scale_factor = min(680 / frame.width, 460 / frame.height)
+            new_size = (int(frame.width * scale_factor), int(frame.height * scale_factor))
+            k = new_size[0] // frame.width
+            if k > 1 and new_size == (frame.width * k, frame.height * k):
+                # Whole-number scale (typical for pixel art): nearest-neighbour
+                # is just repeating rows and columns, about twice as fast as
+                # PIL's resampler and byte-identical to it
+                data = np.asarray(frame).repeat(k, axis=0).repeat(k, axis=1)
+            else:
+                data = np.asarray(frame.resize(new_size, Image.NEAREST))
+
+            # Wrap the array for QPixmap, which copies it
+            qimage = QImage(data.data, data.shape[1], data.shape[0], data.strides[0], QImage.Format_RGBA8888_Premultiplied)
+            pixmap = QPixmap.fromImage(qimage)
+
+            # Store frame and duration
+            frames.append(pixmap)
+            durations.append(frame.info.get("duration", 100))  # Default to 100ms if no duration
+
+    # Only the current preview is ever shown again
+    PREVIEW_GIF_FRAMES.clear()
+    PREVIEW_GIF_FRAMES[key] = (frames, durations)
+    return frames, durations
+
 class ClickableLabel(QLabel):
     """
     A QLabel that emits a signal when clicked and allows toggling clickability.
@@ -3484,6 +3984,32 @@ class ClickableLabel(QLabel):
 
 
 
+@njit(cache=True)
+def paint_canvas_points(canvas, points, color_lut):
+    """
+    Paint (x, y, color_idx) rows of 'points' into the RGBA 'canvas' (H x W x 4,
+    uint8) as opaque pixels. Off-canvas points are skipped and unknown color
+    indices paint black. Runs in order, so a repeated point keeps its last color.
+    """
+    height, width = canvas.shape[:2]
+    n_colors = color_lut.shape[0]
+    for k in range(points.shape[0]):
+        x = points[k, 0]
+        y = points[k, 1]
+        c = points[k, 2]
+        if not (0 <= x < width and 0 <= y < height):
+            continue
+        if 0 <= c < n_colors:
+            canvas[y, x, 0] = color_lut[c, 0]
+            canvas[y, x, 1] = color_lut[c, 1]
+            canvas[y, x, 2] = color_lut[c, 2]
+        else:
+            canvas[y, x, 0] = 0
+            canvas[y, x, 1] = 0
+            canvas[y, x, 2] = 0
+        canvas[y, x, 3] = 255
+
+
 class CanvasWorker(QObject):
     """
     Worker class to handle JSON updates, monitoring, and image generation in a separate thread.
@@ -3556,6 +4082,10 @@ class CanvasWorker(QObject):
             60: 'e6bc98',
             61: 'ffe7d1'
         }
+        # COLOR_MAP as a (max index + 1, 3) uint8 table; gaps stay black
+        self.color_lut = np.zeros((max(self.COLOR_MAP) + 1, 3), dtype=np.uint8)
+        for color_idx, hex_color in self.COLOR_MAP.items():
+            self.color_lut[color_idx] = parse_hex_rgb(hex_color)
 
 
     @Slot(str, str)  # Receives config_path and json_path as strings
@@ -3583,9 +4113,12 @@ class CanvasWorker(QObject):
             timeout = time.time() + 7  # 7-second timeout
             success = False
             previous_menu_value = "nothing new!"
+            poll_interval = 0.05
 
             while time.time() < timeout:
-                time.sleep(0.5)  # Poll every 0.5 seconds
+                # Start polling fast and back off to every 0.5 seconds
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, 0.5)
                 try:
                     with open(config_path, "r") as file:
                         data = json.load(file)
@@ -3638,7 +4171,7 @@ class CanvasWorker(QObject):
         """
         Processes exported canvas data JSON and generates PNG images.
         """
-        output_directory = exe_path_fs("game_data/game_canvises")
+        output_directory = GAME_CANVASES_DIR
         output_directory.mkdir(parents=True, exist_ok=True)
 
         try:
@@ -3646,19 +4179,35 @@ class CanvasWorker(QObject):
                 canvas_data = json.load(file)
 
             def process_canvas(canvas_name: str, points: list):
-                img = Image.new("RGBA", (200, 200), (0, 0, 0, 0))
-                pixels = img.load()
-                for i in range(0, len(points), 3):
+                canvas = np.zeros((200, 200, 4), dtype=np.uint8)
+                try:
+                    # Flat [x, y, color_idx, ...] list -> (N, 3) rows; a trailing
+                    # partial triple is dropped
+                    n_points = len(points) // 3
+                    if n_points * 3 != len(points):
+                        print(f"Error processing canvas '{canvas_name}': incomplete point data")
+                    points = points[:n_points * 3]
                     try:
-                        x, y, color_idx = points[i:i + 3]
-                        if not (0 <= x < 200 and 0 <= y < 200):
-                            continue
-                        hex_color = self.COLOR_MAP.get(color_idx, "000000")
-                        r, g, b = int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
-                        pixels[x, y] = (r, g, b, 255)
-                    except Exception as e:
+                        point_rows = np.asarray(points, dtype=np.int64).reshape(-1, 3)
+                    except (TypeError, ValueError, OverflowError) as e:
+                        # A malformed value (None, a non-numeric string, ...) only
+                        # costs its own point: skip rows whose x or y isn't an int,
+                        # and paint an unusable color index black as before
                         print(f"Error processing canvas '{canvas_name}': {e}")
 
+                        def is_int64(value):
+                            return isinstance(value, int) and -2**63 <= value < 2**63
+
+                        point_rows = np.array([
+                            (x, y, color_idx if is_int64(color_idx) else -1)
+                            for x, y, color_idx in zip(points[0::3], points[1::3], points[2::3])
+                            if is_int64(x) and is_int64(y)
+                        ], dtype=np.int64).reshape(-1, 3)
+                    paint_canvas_points(canvas, point_rows, self.color_lut)
+                except Exception as e:
+                    print(f"Error processing canvas '{canvas_name}': {e}")
+
+                img = Image.fromarray(canvas, 'RGBA')
                 rotated_img = img.transpose(Image.ROTATE_270)
 
                 output_path = output_directory / f"{canvas_name.replace(' ', '_').lower()}.png"
@@ -3668,8 +4217,12 @@ class CanvasWorker(QObject):
 
             print("Processing canvas data...")
             with ThreadPoolExecutor(max_workers=4) as executor:
-                for canvas_name, points in canvas_data.items():
+                # Pop each canvas as it's handed off so its point list is freed
+                # as soon as that canvas is painted, not when every one is done
+                while canvas_data:
+                    canvas_name, points = canvas_data.popitem()
                     executor.submit(process_canvas, canvas_name, points)
+                    del points
 
             print("Image generation complete.")
 
@@ -3677,59 +4230,307 @@ class CanvasWorker(QObject):
             print(f"Error generating images: {e}")
 
 
-class HoverButton(QPushButton):
-    def __init__(self, default_icon_path, hover_icon_path, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.default_icon = QIcon(default_icon_path)
-        self.hover_icon = QIcon(hover_icon_path)
-        self.setIcon(self.default_icon)
-        self.setStyleSheet("border: none; background: transparent;")
-        self.setFixedSize(72, 72)
-
-    def enterEvent(self, event):
-        self.setIcon(self.hover_icon)
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        self.setIcon(self.default_icon)
-        super().leaveEvent(event)
-
-class CropLabel(QLabel):
-    crop_started = Signal(QPoint)
-    crop_updated = Signal(QPoint)
-    crop_finished = Signal(QPoint)
-    erase_pixel = Signal(QPoint)  # New signal for erasing
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.main_window = parent
-        self.setMouseTracking(True)
-        self.crop_rect = QRect()
-        self.is_drawing = False
-
-    def mousePressEvent(self, event):
-        if self.main_window.crop_mode and event.button() == Qt.LeftButton:
-            self.is_drawing = True
-            self.crop_rect.setTopLeft(event.position().toPoint())
-            self.crop_rect.setBottomRight(event.position().toPoint())
-            self.main_window.push_undo_stack()
-            self.crop_started.emit(event.position().toPoint())
-            self.update()
-#        elif self.main_window.erase_mode and event.button() == Qt.LeftButton:
-#            self.erase_pixel.emit(event.position().toPoint())
-        else:
-            super().mousePressEvent(event)
-
-    def mouseMoveEvent(self, event):
-        if self.main_window.crop_mode and self.is_drawing:
-            self.crop_rect.setBottomRight(event.position().toPoint())
-            self.crop_updated.emit(event.position().toPoint())
-            self.update()
-        """
-        elif self.main_window.erase_mode and event.buttons() & Qt.LeftButton:
-            self.erase_pixel.emit(event.position().toPoint())
-            self.update()  # Trigger repaint for eraser outline
-        else:
+# Shared widget stylesheets. Each is set once on a container and cascades to
+# the buttons/checkboxes inside, so Qt parses it once per panel
+MENU_BUTTON_STYLESHEET = """
+            QPushButton {
+                background-color: qlineargradient(
+                    spread:pad, x1:0, y1:0, x2:1, y2:1,
+                    stop:0 #7b1fa2, stop:1 #9c27b0);
+                color: white;
+                border-radius: 15px;  /* Rounded corners */
+                font-family: 'Comic Sans MS', 'Comic Neue', 'DejaVu Sans', 'FreeSans', sans-serif;
+                font-size: 20px;
+                font-weight: bold;
+                padding: 15px 30px;
+            }
+            QPushButton:hover {
+                background-color: qlineargradient(
+                    spread:pad, x1:0, y1:0, x2:1, y2:1,
+                    stop:0 #9c27b0, stop:1 #d81b60);
+            }
+            QPushButton:pressed {
+                background-color: qlineargradient(
+                    spread:pad, x1:0, y1:0, x2:1, y2:1,
+                    stop:0 #6a0080, stop:1 #880e4f);
+            }
+"""
+RESULT_BUTTON_STYLESHEET = """
+            QPushButton {
+                background-color: qlineargradient(
+                    spread:pad, x1:0, y1:0, x2:1, y2:1,
+                    stop:0 #7b1fa2, stop:1 #9c27b0);
+                color: white;
+                border-radius: 15px;  /* Rounded corners */
+                font-family: 'Comic Sans MS', 'Comic Neue', 'DejaVu Sans', 'FreeSans', sans-serif;
+                font-size: 30px;  /* Corrected font size syntax */
+                font-weight: bold;
+                padding: 15px 30px;
+                min-height: 50px;
+            }
+            QPushButton:hover {
+                background-color: qlineargradient(
+                    spread:pad, x1:0, y1:0, x2:1, y2:1,
+                    stop:0 #9c27b0, stop:1 #d81b60);
+            }
+            QPushButton:pressed {
+                background-color: qlineargradient(
+                    spread:pad, x1:0, y1:0, x2:1, y2:1,
+                    stop:0 #6a0080, stop:1 #880e4f);
+            }
+"""
+OPTION_CHECKBOX_STYLESHEET = """
+                QCheckBox {
+                    font-size: 16px;
+                    color: white;
+                    border: none;
+                    background: none;
+                    margin: 0px;
+                }
+                QCheckBox::indicator {
+                    width: 24px;
+                    height: 24px;
+                }
+"""
+
+COLOR_SLIDER_STYLESHEET = """
+                QLabel#boost_label {
+                    color: white; /* Always white */
+                    font-size: 17px; /* Adjusted font size */
+                    font-weight: bold;
+                    border: none; /* No ring */
+                    margin-bottom: 0px; /* Reduce bottom margin */
+                    padding-bottom: 0px; /* Reduce bottom padding */
+                    background: transparent; /* Ensure no background */
+                }
+                QLabel#threshold_label {
+                    color: white; /* Always white */
+                    font-size: 14px; /* Adjusted font size */
+                    font-weight: bold;
+                    border: none; /* No ring */
+                    margin-bottom: 0px; /* Reduce bottom margin */
+                    padding-bottom: 0px; /* Reduce bottom padding */
+                    background: transparent; /* Ensure no background */
+                }
+                QSlider::groove:horizontal {
+                    height: 6px;
+                    background: #7b1fa2;
+                    border-radius: 3px;
+                }
+                QSlider::handle:horizontal {
+                    background: #ffffff;
+                    border: 1px solid #7b1fa2;
+                    width: 14px;
+                    margin: -5px 0;
+                    border-radius: 7px;
+                }
+"""
+
+# Every SVG icon the UI uses, resolved against the install folder once at import
+# rather than on each widget construction
+ICON_NAMES = (
+    "check",
+    "check_white",
+    "crop",
+    "crop_hover",
+    "crop_on",
+    "delete",
+    "delete_hover",
+    "home",
+    "home_hover",
+    "rand",
+    "rand_hover",
+    "refresh",
+    "refresh_hover",
+    "rotate_left",
+    "rotate_left_hover",
+    "rotate_right",
+    "rotate_right_hover",
+    "save",
+    "save_hover",
+    "tack",
+    "tack_down",
+    "tack_hover",
+    "uncheck",
+    "uncheck_white",
+    "undo",
+    "undo_hover",
+)
+ICON_PATHS = {
+    name: exe_path_str(f"imagePawcessor/font_stuff/{name}.svg") for name in ICON_NAMES
+}
+
+# Icons and rendered SVG pixmaps, loaded once per path (and size). A stylesheet
+# `image: url(...svg)` rule or a fresh QIcon re-reads and re-parses the SVG
+# every time the widget is restyled or the icon is swapped on hover
+SVG_ICON_CACHE = {}
+SVG_PIXMAP_CACHE = {}
+
+
+def cached_svg_icon(path):
+    """
+    Return the shared QIcon for an SVG path.
+    """
+    icon = SVG_ICON_CACHE.get(path)
+    if icon is None:
+        icon = QIcon(path)
+        SVG_ICON_CACHE[path] = icon
+    return icon
+
+
+def cached_svg_pixmap(path, width, height):
+    """
+    Render an SVG once to fit width x height, keeping its aspect ratio the way
+    a stylesheet image does, and cache the pixmap.
+    """
+    key = (path, width, height)
+    pixmap = SVG_PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = cached_svg_icon(path).pixmap(QSize(width, height))
+        SVG_PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
+
+# 'white' or 'black' text for each swatch color, by normalized hex
+CONTRAST_COLOR_CACHE = {}
+
+
+def get_contrast_color(hex_color):
+    """
+    Returns 'white' or 'black' based on the luminance of the provided hex color.
+    """
+    hex_color = hex_color.lower().lstrip('#')
+    contrast = CONTRAST_COLOR_CACHE.get(hex_color)
+    if contrast is not None:
+        return contrast
+
+    # Convert hex to RGB
+    if len(hex_color) == 6:
+        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    elif len(hex_color) == 3:
+        r, g, b = tuple(int(hex_color[i]*2, 16) for i in range(3))
+    else:
+        # Default to white if format is unexpected
+        return 'white'
+
+    # Luminance 0.299 * r + 0.587 * g + 0.114 * b below 100, scaled by 1000
+    # to stay in integers
+    contrast = 'white' if 299 * r + 587 * g + 114 * b < 100000 else 'black'
+    CONTRAST_COLOR_CACHE[hex_color] = contrast
+    return contrast
+
+
+class SvgCheckBox(QCheckBox):
+    """
+    QCheckBox whose indicator is drawn from cached SVG pixmaps instead of
+    stylesheet `image:` rules. The stylesheet still sizes the indicator and
+    styles the label. The hover image, if given, wins over the checked one.
+    """
+    def __init__(self, text="", unchecked_svg=None, checked_svg=None, hover_svg=None, parent=None):
+        super().__init__(text, parent)
+        self.unchecked_svg = unchecked_svg
+        self.checked_svg = checked_svg
+        self.hover_svg = hover_svg
+        if hover_svg:
+            # Repaint on enter/leave so the hover image shows up
+            self.setAttribute(Qt.WA_Hover)
+
+    def paintEvent(self, event):
+        option = QStyleOptionButton()
+        self.initStyleOption(option)
+        painter = QStylePainter(self)
+
+        if self.hover_svg and option.state & QStyle.State_MouseOver:
+            path = self.hover_svg
+        elif self.isChecked():
+            path = self.checked_svg
+        else:
+            path = self.unchecked_svg
+        indicator = self.style().subElementRect(QStyle.SE_CheckBoxIndicator, option, self)
+        if path:
+            pixmap = cached_svg_pixmap(path, indicator.width(), indicator.height())
+            painter.drawItemPixmap(indicator, Qt.AlignCenter, pixmap)
+
+        if self.text():
+            option.rect = self.style().subElementRect(QStyle.SE_CheckBoxContents, option, self)
+            painter.drawControl(QStyle.CE_CheckBoxLabel, option)
+
+
+class SvgButton(QPushButton):
+    """
+    Image-only QPushButton drawn from cached SVG pixmaps instead of stylesheet
+    `image:` rules; the hover image is also used while pressed.
+    """
+    def __init__(self, normal_svg, hover_svg, parent=None):
+        super().__init__(parent)
+        self.normal_svg = normal_svg
+        self.hover_svg = hover_svg
+        self.setAttribute(Qt.WA_Hover)
+
+    def paintEvent(self, event):
+        option = QStyleOptionButton()
+        self.initStyleOption(option)
+        painter = QStylePainter(self)
+
+        path = self.hover_svg if option.state & (QStyle.State_MouseOver | QStyle.State_Sunken) else self.normal_svg
+        contents = self.style().subElementRect(QStyle.SE_PushButtonContents, option, self)
+        pixmap = cached_svg_pixmap(path, contents.width(), contents.height())
+        painter.drawItemPixmap(contents, Qt.AlignCenter, pixmap)
+
+
+class HoverButton(QPushButton):
+    def __init__(self, default_icon_path, hover_icon_path, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default_icon = cached_svg_icon(default_icon_path)
+        self.hover_icon = cached_svg_icon(hover_icon_path)
+        self.setIcon(self.default_icon)
+        self.setStyleSheet("border: none; background: transparent;")
+        self.setFixedSize(72, 72)
+
+    def enterEvent(self, event):
+        self.setIcon(self.hover_icon)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.setIcon(self.default_icon)
+        super().leaveEvent(event)
+
+class CropLabel(QLabel):
+    crop_started = Signal(QPoint)
+    crop_updated = Signal(QPoint)
+    crop_finished = Signal(QPoint)
+    erase_pixel = Signal(QPoint)  # New signal for erasing
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.main_window = parent
+        self.setMouseTracking(True)
+        self.crop_rect = QRect()
+        self.is_drawing = False
+
+    def mousePressEvent(self, event):
+        if self.main_window.crop_mode and event.button() == Qt.LeftButton:
+            self.is_drawing = True
+            self.crop_rect.setTopLeft(event.position().toPoint())
+            self.crop_rect.setBottomRight(event.position().toPoint())
+            self.main_window.push_undo_stack()
+            self.crop_started.emit(event.position().toPoint())
+            self.update()
+#        elif self.main_window.erase_mode and event.button() == Qt.LeftButton:
+#            self.erase_pixel.emit(event.position().toPoint())
+        else:
+            super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if self.main_window.crop_mode and self.is_drawing:
+            self.crop_rect.setBottomRight(event.position().toPoint())
+            self.crop_updated.emit(event.position().toPoint())
+            self.update()
+        """
+        elif self.main_window.erase_mode and event.buttons() & Qt.LeftButton:
+            self.erase_pixel.emit(event.position().toPoint())
+            self.update()  # Trigger repaint for eraser outline
+        else:
             super().mouseMoveEvent(event)
         """
     def mouseReleaseEvent(self, event):
@@ -3773,13 +4574,11 @@ class ImageProcessingThread(threading.Thread):
         super().__init__()
         self.params = params
         self.signals = signals
-        self.executor = ThreadPoolExecutor(max_workers=6)  # Adjust based on your system's capability
 
     def run(self):
         try:
-            # Submit the main function to the thread pool
-            future = self.executor.submit(
-                main,
+            # This is already a worker thread, so run main on it directly
+            main(
                 image_path=self.params['image_path'],
                 remove_bg=self.params['remove_bg'],
                 preprocess_flag=self.params['preprocess_flag'],
@@ -3793,14 +4592,9 @@ class ImageProcessingThread(threading.Thread):
                 message_callback=self.signals.message.emit,
                 error_callback=self.signals.error.emit
             )
-
-            # Wait for the task to complete and capture exceptions if any
-            result = future.result()
             self.signals.message.emit("Processing finished")
         except Exception as e:
             self.signals.error.emit(str(e))
-        finally:
-            self.executor.shutdown()
 
 
 class MainWindow(QMainWindow):
@@ -3816,7 +4610,15 @@ class MainWindow(QMainWindow):
         self._drag_position = QPoint()
         self.delete_mode = False
         self.last_message_displayed = None
-        self.connected = False
+        self.background_click_entry = None  # Image entry opened by clicking the menu background
+        self.thumbnail_load_queued = False  # A load_visible_thumbnails call is pending
+        self.random_image_request = 0  # Bumped to drop stale background loads
+        # Random background candidates, rebuilt only when the menu_pics folder
+        # or saved_stamps.json changes
+        self.menu_image_index = None
+        self.menu_image_watcher = QFileSystemWatcher(self)
+        self.menu_image_watcher.directoryChanged.connect(self.invalidate_menu_image_index)
+        self.menu_image_watcher.fileChanged.connect(self.invalidate_menu_image_index)
         self.window_titles = [
             "are you kidding me?",
             "purple chalk???",
@@ -3881,29 +4683,6 @@ class MainWindow(QMainWindow):
             {'number': 4, 'hex': 'f4c009', 'boost': 1.2, 'threshold': 20},
             {'number': 6, 'hex': 'bac357', 'boost': 1.2, 'threshold': 20},
         ]
-        self.button_stylesheet = """
-            QPushButton {
-                background-color: qlineargradient(
-                    spread:pad, x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #7b1fa2, stop:1 #9c27b0);
-                color: white;
-                border-radius: 15px;  /* Rounded corners */
-                font-family: 'Comic Sans MS', 'Comic Neue', 'DejaVu Sans', 'FreeSans', sans-serif;
-                font-size: 20px;
-                font-weight: bold;
-                padding: 15px 30px;
-            }
-            QPushButton:hover {
-                background-color: qlineargradient(
-                    spread:pad, x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #9c27b0, stop:1 #d81b60);
-            }
-            QPushButton:pressed {
-                background-color: qlineargradient(
-                    spread:pad, x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #6a0080, stop:1 #880e4f);
-            }
-        """
         undo_shortcut = QShortcut(QKeySequence("Ctrl+Z"), self)
         undo_shortcut.activated.connect(self.undo_action)
         # Setup UI
@@ -4157,24 +4936,21 @@ class MainWindow(QMainWindow):
         pin_container.setLayout(pin_layout)
 
         # Add the pin button
-        self.always_on_top_checkbox = QCheckBox()
+        self.always_on_top_checkbox = SvgCheckBox(
+            unchecked_svg=ICON_PATHS["tack"],
+            checked_svg=ICON_PATHS["tack_down"],
+            hover_svg=ICON_PATHS["tack_hover"]
+        )
         self.always_on_top_checkbox.setFixedSize(80, 80) 
-        self.always_on_top_checkbox.setStyleSheet(f"""
-            QCheckBox {{
+        self.always_on_top_checkbox.setStyleSheet("""
+            QCheckBox {
                 background: transparent;
                 border: none;
-            }}
-            QCheckBox::indicator {{
+            }
+            QCheckBox::indicator {
                 width: 80px;
                 height: 80px;
-                image: url({exe_path_str("imagePawcessor/font_stuff/tack.svg")});
-            }}
-            QCheckBox::indicator:checked {{
-                image: url({exe_path_str("imagePawcessor/font_stuff/tack_down.svg")});
-            }}
-            QCheckBox::indicator:hover {{
-                image: url({exe_path_str("imagePawcessor/font_stuff/tack_hover.svg")});
-            }}
+            }
         """)
         self.always_on_top_checkbox.setChecked(False)
         
@@ -4200,7 +4976,9 @@ class MainWindow(QMainWindow):
         # Create a ClickableLabel to hold the background image
         self.background_label = ClickableLabel()
         self.background_label.setFixedSize(680, 460)
-        self.background_label.setPixmap(self.load_and_display_random_image())
+        # Pick the background once the event loop runs, so the folder scan and
+        # saved_stamps.json parse don't hold up the first paint of the menu
+        QTimer.singleShot(0, self.load_and_display_random_image)
         self.background_label.setAlignment(Qt.AlignCenter)
 
         self.background_label.setScaledContents(False)  # Prevent automatic scaling
@@ -4208,8 +4986,8 @@ class MainWindow(QMainWindow):
         spacer = QSpacerItem(0, 10, QSizePolicy.Minimum, QSizePolicy.Expanding)
         background_layout.addItem(spacer)
 
-        # Optionally, connect the clicked signal
-        # Example: self.background_label.clicked.connect(self.handle_background_click)
+        # Connected once; handle_background_click opens whatever image is showing
+        self.background_label.clicked.connect(self.handle_background_click)
 
         # -------------------------
         # Button Container: Stamp Buttons and Control Buttons
@@ -4220,30 +4998,8 @@ class MainWindow(QMainWindow):
         button_layout.setAlignment(Qt.AlignTop)  # Align buttons to the top
         button_container.setLayout(button_layout)
 
-        # Button Stylesheet
-        button_stylesheet = """
-            QPushButton {
-                background-color: qlineargradient(
-                    spread:pad, x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #7b1fa2, stop:1 #9c27b0);
-                color: white;
-                border-radius: 15px;  /* Rounded corners */
-                font-family: 'Comic Sans MS', 'Comic Neue', 'DejaVu Sans', 'FreeSans', sans-serif;
-                font-size: 20px;
-                font-weight: bold;
-                padding: 15px 30px;
-            }
-            QPushButton:hover {
-                background-color: qlineargradient(
-                    spread:pad, x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #9c27b0, stop:1 #d81b60);
-            }
-            QPushButton:pressed {
-                background-color: qlineargradient(
-                    spread:pad, x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #6a0080, stop:1 #880e4f);
-            }
-        """
+        # One stylesheet on the container styles every button in it
+        button_container.setStyleSheet(MENU_BUTTON_STYLESHEET)
 
         # First row of buttons: "Stamp from Files" and "Stamp from Clipboard"
         top_button_layout = QHBoxLayout()
@@ -4251,13 +5007,11 @@ class MainWindow(QMainWindow):
         top_button_layout.setAlignment(Qt.AlignCenter)
 
         self.new_image_files_button = QPushButton("Stamp from Files")
-        self.new_image_files_button.setStyleSheet(button_stylesheet)
         self.new_image_files_button.setMinimumSize(200, 60)
         self.new_image_files_button.clicked.connect(self.open_image_from_files)
         top_button_layout.addWidget(self.new_image_files_button)
 
         self.new_image_clipboard_button = QPushButton("Save In-Game Art")
-        self.new_image_clipboard_button.setStyleSheet(button_stylesheet)
         self.new_image_clipboard_button.setMinimumSize(200, 60)
         self.new_image_clipboard_button.clicked.connect(self.request_and_monitor_canvas)
         top_button_layout.addWidget(self.new_image_clipboard_button)
@@ -4270,14 +5024,12 @@ class MainWindow(QMainWindow):
         bottom_button_layout.setAlignment(Qt.AlignCenter)
 
         self.save_button = QPushButton("Save Menu")
-        self.save_button.setStyleSheet(button_stylesheet)
         self.save_button.setMinimumSize(160, 60)
         self.save_button.clicked.connect(self.show_save_menu)
         bottom_button_layout.addWidget(self.save_button)
 
 
         self.clip_button = QPushButton("Clipboard")
-        self.clip_button.setStyleSheet(button_stylesheet)
         self.clip_button.setMinimumSize(160, 60)
         #self.clip_button.clicked.connect(self.request_and_monitor_canvas)
         bottom_button_layout.addWidget(self.clip_button)
@@ -4285,7 +5037,6 @@ class MainWindow(QMainWindow):
 
 
         self.exit_button = QPushButton("Keybinds / Info")
-        self.exit_button.setStyleSheet(button_stylesheet)
         self.exit_button.setMinimumSize(200, 60)
         #self.exit_button.clicked.connect(self.request_and_monitor_canvas)
         bottom_button_layout.addWidget(self.exit_button)
@@ -4362,8 +5113,8 @@ class MainWindow(QMainWindow):
 
         # Home button
         home_button = HoverButton(
-            exe_path_str("imagePawcessor/font_stuff/home.svg"),
-            exe_path_str("imagePawcessor/font_stuff/home_hover.svg")
+            ICON_PATHS["home"],
+            ICON_PATHS["home_hover"]
         )
         home_button.setFixedSize(72, 72)
         home_button.setIconSize(QSize(72, 72))
@@ -4509,8 +5260,8 @@ class MainWindow(QMainWindow):
 
         # Home button using HoverButton
         home_button = HoverButton(
-            exe_path_str("imagePawcessor/font_stuff/home.svg"),
-            exe_path_str("imagePawcessor/font_stuff/home_hover.svg")
+            ICON_PATHS["home"],
+            ICON_PATHS["home_hover"]
         )
         home_button.setFixedSize(80, 80)
         home_button.setIconSize(QSize(80, 80))
@@ -4558,8 +5309,8 @@ class MainWindow(QMainWindow):
 
         # Undo Button
         undo_button = HoverButton(
-            exe_path_str("imagePawcessor/font_stuff/undo.svg"),
-            exe_path_str("imagePawcessor/font_stuff/undo_hover.svg")
+            ICON_PATHS["undo"],
+            ICON_PATHS["undo_hover"]
         )
         undo_button.setFixedSize(80,80)
         undo_button.setIconSize(QSize(80,80))
@@ -4571,8 +5322,8 @@ class MainWindow(QMainWindow):
 
         # Rotate Left Button
         rotate_left_button = HoverButton(
-            exe_path_str("imagePawcessor/font_stuff/rotate_left.svg"),
-            exe_path_str("imagePawcessor/font_stuff/rotate_left_hover.svg")
+            ICON_PATHS["rotate_left"],
+            ICON_PATHS["rotate_left_hover"]
         )
         rotate_left_button.setFixedSize(80,80)
         rotate_left_button.setIconSize(QSize(80,80))
@@ -4584,8 +5335,8 @@ class MainWindow(QMainWindow):
 
         # Rotate Right Button
         rotate_right_button = HoverButton(
-            exe_path_str("imagePawcessor/font_stuff/rotate_right.svg"),
-            exe_path_str("imagePawcessor/font_stuff/rotate_right_hover.svg")
+            ICON_PATHS["rotate_right"],
+            ICON_PATHS["rotate_right_hover"]
         )
         rotate_right_button.setFixedSize(80,80)
         rotate_right_button.setIconSize(QSize(80,80))
@@ -4596,24 +5347,21 @@ class MainWindow(QMainWindow):
         tools_layout.addSpacerItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding))
 
         # Crop Mode Checkbox with SVGs
-        self.crop_checkbox = QCheckBox()
+        self.crop_checkbox = SvgCheckBox(
+            unchecked_svg=ICON_PATHS["crop"],
+            checked_svg=ICON_PATHS["crop_on"],
+            hover_svg=ICON_PATHS["crop_hover"]
+        )
         self.crop_checkbox.setFixedSize(80,80)
-        self.crop_checkbox.setStyleSheet(f"""
-            QCheckBox {{
+        self.crop_checkbox.setStyleSheet("""
+            QCheckBox {
                 background: transparent;
                 border: none;
-            }}
-            QCheckBox::indicator {{
+            }
+            QCheckBox::indicator {
                 width: 80px;
                 height: 80px;
-                image: url({exe_path_str("imagePawcessor/font_stuff/crop.svg")});
-            }}
-            QCheckBox::indicator:checked {{
-                image: url({exe_path_str("imagePawcessor/font_stuff/crop_on.svg")});
-            }}
-            QCheckBox::indicator:hover {{
-                image: url({exe_path_str("imagePawcessor/font_stuff/crop_hover.svg")});
-            }}
+            }
         """)
         self.crop_checkbox.stateChanged.connect(self.toggle_crop_mode)
         tools_layout.addWidget(self.crop_checkbox, alignment=Qt.AlignCenter)
@@ -5085,7 +5833,7 @@ class MainWindow(QMainWindow):
         
         self.worker_thread.start()
         config_path = get_config_path()  # Define this function appropriately
-        json_path = exe_path_fs("game_data/game_canvises/game_canvises.json")  # Define this function
+        json_path = GAME_CANVASES_DIR / 'game_canvises.json'
 
         if not os.path.exists(config_path):
             self.show_floating_message("Config path does not exist.", True)
@@ -5114,7 +5862,7 @@ class MainWindow(QMainWindow):
         self.processing = False
         if success:
             print("Image generation completed successfully!")
-            self.update_save_menu1(exe_path_fs("game_data/game_canvises"))
+            self.update_save_menu1(GAME_CANVASES_DIR)
 
 
     def process_png_to_stamp(self, input_png_path):
@@ -5132,21 +5880,6 @@ class MainWindow(QMainWindow):
                 raise ValueError(f"Invalid hex color: {hex_color}")
             return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
-        # Helper function to find the closest color number from the color key
-        def find_closest_color(target_rgb, color_key_rgb):
-            min_distance = float('inf')
-            closest_color_num = None
-            for idx, color in enumerate(color_key_rgb):
-                distance = math.sqrt(
-                    (target_rgb[0] - color[0]) ** 2 +
-                    (target_rgb[1] - color[1]) ** 2 +
-                    (target_rgb[2] - color[2]) ** 2
-                )
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_color_num = idx
-            return closest_color_num
-
         try:
             # Define color key as per the provided mapping
             color_key = {
@@ -5218,9 +5951,9 @@ class MainWindow(QMainWindow):
             color_key_rgb = [hex_to_rgb(color_key[i]) for i in range(len(color_key))]
 
             # Paths
-            preview_dir = exe_path_fs('game_data/stamp_preview/')
+            preview_dir = STAMP_PREVIEW_DIR
             preview_image_path = os.path.join(preview_dir, 'preview.png')
-            current_stamp_dir = exe_path_fs('game_data/current_stamp_data/')
+            current_stamp_dir = CURRENT_STAMP_DIR
             stamp_txt_path = os.path.join(current_stamp_dir, 'stamp.txt')
 
             # Step 1: Manage Preview Directory
@@ -5237,7 +5970,8 @@ class MainWindow(QMainWindow):
             with Image.open(input_png_path) as img:
                 img = img.convert('RGBA')  # Ensure image has an alpha channel
                 width, height = img.size
-                pixels = img.load()
+                # Flipped so rows run bottom to top: row r is scaled_y = r * 0.1
+                img_arr = np.asarray(img)[::-1]
 
             # Calculate scaled dimensions
             scaled_width = round(width * 0.1, 1)
@@ -5246,43 +5980,17 @@ class MainWindow(QMainWindow):
             # Ensure the output directory exists
             os.makedirs(current_stamp_dir, exist_ok=True)
 
+            # Skip pixels with alpha <= 191, map the rest to the color key at once
+            opaque = img_arr[:, :, 3] > 191
+            rows, xs = np.nonzero(opaque)
+            color_nums = find_closest_indices_rgb(img_arr[:, :, :3][opaque], np.array(color_key_rgb, dtype=np.float32))
+
             with open(stamp_txt_path, 'w') as f:
                 # Write the first line with scaled dimensions
                 f.write(f"{scaled_width},{scaled_height},img\n")
                 print(f"Scaled dimensions written: {scaled_width},{scaled_height},img")
 
-                # Iterate through pixels from bottom to top, left to right
-                for y in range(height - 1, -1, -1):
-                    for x in range(width):
-                        pixel = pixels[x, y]
-
-                        # Extract RGBA values
-                        if len(pixel) == 4:
-                            r, g, b, a = pixel
-                        elif len(pixel) == 3:
-                            r, g, b = pixel
-                            a = 255
-                        else:
-                            print(f"Unexpected pixel format at ({x}, {y}): {pixel}")
-                            continue  # Skip unexpected formats
-
-                        # Skip pixels with alpha <= 191
-                        if a <= 191:
-                            continue
-
-                        # Find the closest color number from the color key
-                        closest_color_num = find_closest_color((r, g, b), color_key_rgb)
-
-                        if closest_color_num is None:
-                            print(f"No matching color found for pixel at ({x}, {y}): ({r}, {g}, {b})")
-                            continue  # Skip if no matching color is found
-
-                        # Scale the coordinates
-                        scaled_x = round(x * 0.1, 1)
-                        scaled_y = round((height - 1 - y) * 0.1, 1)
-
-                        # Write to the file
-                        f.write(f"{scaled_x},{scaled_y},{closest_color_num}\n")
+                f.write(format_pixel_lines(xs, rows, color_nums))
 
             print(f"Processing complete! Output saved to: {stamp_txt_path}")
 
@@ -5304,61 +6012,13 @@ class MainWindow(QMainWindow):
             self.show_floating_message("always on top: OFF", True)
         self.show()
 
-    def validate_image(self, entry):
-        """
-        Validates that the image exists and can be loaded by QPixmap.
-
-        Args:
-            entry (dict): Dictionary containing image information.
-
-        Returns:
-            bool: True if valid, False otherwise.
-        """
-        file_path = entry['path']
-        if os.path.exists(file_path):
-            try:
-                pixmap = QPixmap(file_path)
-                if not pixmap.isNull():
-                    return True
-            except Exception as e:
-                print(f"Error loading image with QPixmap: {e}")
-        return False
-
-    def get_valid_image(self, combined_list, max_attempts=10):
-        """
-        Selects a random valid image from the combined list by trying up to max_attempts times.
-
-        Args:
-            combined_list (list): List of image entries.
-            max_attempts (int): Maximum number of attempts to find a valid image.
-
-        Returns:
-            dict or None: Selected image entry or None if no valid images are found.
-        """
-        attempts = 0
-        temp_list = combined_list.copy()
-        while attempts < max_attempts and temp_list:
-            selected = random.choice(temp_list)
-            if self.validate_image(selected):
-                return selected
-            else:
-                temp_list.remove(selected)
-                attempts += 1
-        return None
-        
-    def load_and_display_random_image(self):
+    def build_menu_image_index(self, menu_pics_dir):
         """
-        Loads a random, non-animated image from either the menu_pics directory or the saved_stamps.json.
-        Sets up click handlers based on the image source.
-        Displays the image within the provided layout.
+        Lists the non-animated images in menu_pics_dir and saved_stamps.json, and
+        (re)registers those locations with the watcher so the list is rebuilt
+        when they change.
         """
-        self.reset_movie()
         # 1. Gather images from menu_pics_dir
-        menu_pics_dir = exe_path_str("imagePawcessor/menu_pics")
-        if not os.path.exists(menu_pics_dir):
-            QMessageBox.warning(self, "Error", f"Menu pictures directory not found: {menu_pics_dir}")
-            return
-
         # List all image files in the directory with valid extensions, excluding .gif
         image_files = [
             f for f in os.listdir(menu_pics_dir)
@@ -5375,8 +6035,7 @@ class MainWindow(QMainWindow):
 
         if saved_stamps_json_path.exists():
             try:
-                with open(saved_stamps_json_path, 'r') as f:
-                    saved_stamps = json.load(f)
+                saved_stamps = load_saved_stamps(saved_stamps_json_path)
 
                 for hash_key, value in saved_stamps.items():
                     if not value.get("is_gif", False):  # Skip animated GIFs
@@ -5390,75 +6049,91 @@ class MainWindow(QMainWindow):
                 print(f"Failed to load saved stamps: {e}")
                 # Continue with empty saved_stamp_entries
 
-        # 3. Combine all images
-        combined_images = menu_pics + saved_stamp_entries
+        # Watch the folder for added/removed pictures, and the AppData folder plus
+        # the JSON itself for saved stamps being written or replaced
+        watch_paths = [menu_pics_dir, appdata_dir.as_posix()]
+        if saved_stamps_json_path.exists():
+            watch_paths.append(saved_stamps_json_path.as_posix())
+        watched = set(self.menu_image_watcher.files()) | set(self.menu_image_watcher.directories())
+        new_paths = [path for path in watch_paths if path not in watched]
+        if new_paths:
+            self.menu_image_watcher.addPaths(new_paths)
 
-        if not combined_images:
-            QMessageBox.warning(self, "Error", "No images available to select.")
-            return
+        # 3. Combine all images
+        return menu_pics + saved_stamp_entries
 
-        # 4. Select a valid, non-animated image with limited attempts
-        selected_image_entry = self.get_valid_image(combined_images)
+    @Slot(str)
+    def invalidate_menu_image_index(self, path):
+        self.menu_image_index = None
 
-        if not selected_image_entry:
-            QMessageBox.warning(self, "Error", "No valid, non-animated images could be loaded from the sources.")
+    def load_and_display_random_image(self):
+        """
+        Loads a random, non-animated image from either the menu_pics directory or the saved_stamps.json.
+        The image is picked, decoded and scaled on the thread pool; show_random_image
+        displays it and makes it the target of background clicks.
+        """
+        self.reset_movie()
+        menu_pics_dir = MENU_PICS_DIR
+        if not os.path.exists(menu_pics_dir):
+            QMessageBox.warning(self, "Error", f"Menu pictures directory not found: {menu_pics_dir}")
             return
 
-        # 5. Load and display the selected image
-        pixmap = QPixmap(selected_image_entry['path'])
-        if pixmap.isNull():
-            QMessageBox.warning(self, "Error", f"Failed to load image: {selected_image_entry['path']}")
-            return
+        if self.menu_image_index is None:
+            self.menu_image_index = self.build_menu_image_index(menu_pics_dir)
+        combined_images = self.menu_image_index
 
-        # Resize the image while maintaining aspect ratio
-        if pixmap.width() > 680 or pixmap.height() > 460:
-            transformation_mode = Qt.FastTransformation  # Downscaling
-        else:
-            transformation_mode = Qt.FastTransformation  # Upscaling
+        if not combined_images:
+            QMessageBox.warning(self, "Error", "No images available to select.")
+            return
 
-        scaled_pixmap = pixmap.scaled(
-            680, 460,  # Max dimensions
-            Qt.KeepAspectRatio,
-            transformation_mode
-        )
+        # Select, decode and scale a valid image off the GUI thread
+        self.random_image_request += 1
+        loader = RandomImageLoader(combined_images, self.random_image_request)
+        loader.signals.loaded.connect(self.show_random_image)
+        QThreadPool.globalInstance().start(loader)
 
+    @Slot(QImage, object, int)
+    def show_random_image(self, image, selected_image_entry, request_id):
+        """
+        Displays an image finished by RandomImageLoader and makes it the target of
+        background clicks. Results from superseded requests are dropped.
+        """
+        if request_id != self.random_image_request:
+            return
 
-        # Apply transparency
-        transparent_pixmap = QPixmap(scaled_pixmap.size())
-        transparent_pixmap.fill(Qt.transparent)
+        if not selected_image_entry:
+            QMessageBox.warning(self, "Error", "No valid, non-animated images could be loaded from the sources.")
+            return
 
-        painter = QPainter(transparent_pixmap)
-        painter.setOpacity(0.9)
-        painter.drawPixmap(0, 0, scaled_pixmap)
-        painter.end()
+        self.background_label.setPixmap(QPixmap.fromImage(image))
 
-        # Disconnect any previously connected signals
-        if self.connected:
-            self.background_label.clicked.disconnect()
+        # Clicking the background now opens this image
+        self.background_click_entry = selected_image_entry
 
-        # Connect the click event based on the image source
-        if selected_image_entry['type'] == 'menu_pic':
-            self.background_label.clicked.connect(lambda: self.open_image_from_menu(selected_image_entry['path']))
-        elif selected_image_entry['type'] == 'saved_stamp':
-            self.background_label.clicked.connect(lambda: self.load_thumbnail(selected_image_entry['hash']))
+    def handle_background_click(self):
+        """
+        Opens the random background image that was clicked, based on its source.
+        """
+        entry = self.background_click_entry
+        if entry is None:
+            return
+        if entry['type'] == 'menu_pic':
+            self.open_image_from_menu(entry['path'])
+        elif entry['type'] == 'saved_stamp':
+            self.load_thumbnail(entry['hash'])
 
-        self.connected = True
-        return transparent_pixmap
-        
     def display_new_stamp(self):
         self.reset_movie()
         # Check and load the appropriate file
-        preview_png_path = exe_path_fs('game_data/stamp_preview/preview.png')
-        preview_gif_path = exe_path_fs('game_data/stamp_preview/preview.gif')
+        preview_png_path = PREVIEW_PNG_PATH
+        preview_gif_path = PREVIEW_GIF_PATH
 
-        if self.connected:
-            self.background_label.clicked.disconnect()
-            self.connected = False
-
-        if Path(preview_png_path).exists():
-            # Load the PNG
-            pixmap = QPixmap(str(preview_png_path))  # Convert Path to string
+        self.background_click_entry = None
 
+        # Try the PNG straight away instead of stat'ing both previews first; a
+        # missing file just gives a null pixmap
+        pixmap = QPixmap(str(preview_png_path))  # Convert Path to string
+        if not pixmap.isNull():
             # Resize the pixmap while maintaining the aspect ratio
             transformation_mode = Qt.FastTransformation  # Use hard edges
             scaled_pixmap = pixmap.scaled(
@@ -5471,44 +6146,29 @@ class MainWindow(QMainWindow):
             self.background_label.clear()  # Clear any existing content
             self.background_label.setPixmap(scaled_pixmap)
 
-        elif Path(preview_gif_path).exists():
+        else:
+            # Raises (and is skipped) if there's no GIF preview either
             try:
-                with Image.open(preview_gif_path) as gif:
-                    # Extract all frames from the GIF
-                    frames = []
-                    durations = []
-                    for frame in ImageSequence.Iterator(gif):
-                        # Resize each frame with NEAREST interpolation
-                        frame = frame.convert("RGBA")
-                        scale_factor = min(680 / frame.width, 460 / frame.height)
-                        new_size = (int(frame.width * scale_factor), int(frame.height * scale_factor))
-                        resized_frame = frame.resize(new_size, Image.NEAREST)
-
-                        # Convert to QImage for QPixmap
-                        data = resized_frame.tobytes("raw", "RGBA")
-                        qimage = QImage(data, resized_frame.width, resized_frame.height, QImage.Format_RGBA8888)
-                        pixmap = QPixmap.fromImage(qimage)
-
-                        # Store frame and duration
-                        frames.append(pixmap)
-                        durations.append(frame.info.get("duration", 100))  # Default to 100ms if no duration
-
-                    if frames:
-                        # Animate the frames using a QTimer
-                        self.current_frame = 0
-                        self.timer = QTimer(self)
-                        self.timer.timeout.connect(lambda: self.update_gif_frame(frames))
-                        self.timer.start(durations[0])  # Start with the first frame's duration
-                        self.gif_frames = frames
-                        self.gif_durations = durations
+                frames, durations = load_preview_gif_frames(preview_gif_path)
+
+                if frames:
+                    # Animate the frames using a QTimer
+                    self.current_frame = 0
+                    self.timer = QTimer(self)
+                    self.timer.timeout.connect(lambda: self.update_gif_frame(frames))
+                    self.timer.start(durations[0])  # Start with the first frame's duration
+                    self.gif_frames = frames
+                    self.gif_durations = durations
             except Exception as e:
                 pass
 
-        else:
-            # Handle the case where neither file exists
-            pass
-
     def update_gif_frame(self, frames):
+        # Another page is showing; stop animating until go_to_initial_menu
+        # brings the menu back, which always restarts the preview
+        if not self.background_label.isVisible():
+            self.timer.stop()
+            return
+
         # Update QLabel with the current frame
         self.background_label.setPixmap(self.gif_frames[self.current_frame])
 
@@ -5521,6 +6181,9 @@ class MainWindow(QMainWindow):
 
 
     def reset_movie(self):
+        # Drop any random background image still loading
+        self.random_image_request += 1
+
         # Stop the movie if it is playing
         if hasattr(self, 'movie') and self.movie is not None:
             self.movie.stop()
@@ -5573,19 +6236,16 @@ class MainWindow(QMainWindow):
             image_layout.addWidget(self.image_label)
 
             # Back button
-            self.back_button = QPushButton(self)
-            self.back_button.setStyleSheet(f"""
-                QPushButton {{
-                    border: none; 
+            self.back_button = SvgButton(
+                ICON_PATHS["home"],
+                ICON_PATHS["home_hover"],
+                self
+            )
+            self.back_button.setStyleSheet("""
+                QPushButton {
+                    border: none;
                     background-color: transparent;
-                    image: url({exe_path_str('imagePawcessor/font_stuff/home.svg')});
-                }}
-                QPushButton:hover {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/home_hover.svg')});
-                }}    
-                QPushButton:pressed {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/home_hover.svg')});
-                }}
+                }
             """)
             self.back_button.setFixedSize(60, 60)
             self.back_button.setCursor(Qt.PointingHandCursor)
@@ -5596,19 +6256,16 @@ class MainWindow(QMainWindow):
             image_layout.addWidget(self.back_button)
 
             # Refresh button 60px to the right of the back button
-            self.refresh_button = QPushButton(self)
-            self.refresh_button.setStyleSheet(f"""
-                QPushButton {{
+            self.refresh_button = SvgButton(
+                ICON_PATHS["refresh"],
+                ICON_PATHS["refresh_hover"],
+                self
+            )
+            self.refresh_button.setStyleSheet("""
+                QPushButton {
                     border: none;
-                    background-color: transparent; 
-                    image: url({exe_path_str('imagePawcessor/font_stuff/refresh.svg')});
-                }}
-                QPushButton:hover {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/refresh_hover.svg')});
-                }}    
-                QPushButton:pressed {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/refresh_hover.svg')});
-                }}       
+                    background-color: transparent;
+                }
             """)
             self.refresh_button.setFixedSize(60, 60)
             self.refresh_button.setCursor(Qt.PointingHandCursor)
@@ -5622,6 +6279,8 @@ class MainWindow(QMainWindow):
 
             # Ring-style frame to wrap all options
             ring_frame = QFrame()
+            # The option checkboxes inside share one rule set here instead of
+            # each parsing its own copy
             ring_frame.setStyleSheet("""
                 QFrame {
                     border: 3px solid #7b1fa2; /* Purple border */
@@ -5630,7 +6289,7 @@ class MainWindow(QMainWindow):
                     margin: 0px;
                     background-color: transparent;
                 }
-            """)
+            """ + OPTION_CHECKBOX_STYLESHEET)
             ring_layout = QVBoxLayout()
             ring_layout.setContentsMargins(5, 5, 5, 5)
             ring_layout.setSpacing(5)
@@ -5652,119 +6311,44 @@ class MainWindow(QMainWindow):
             ring_layout.addWidget(title_label)
 
             # Preprocess checkbox
-            self.preprocess_checkbox = QCheckBox("Preprocess Image")
+            self.preprocess_checkbox = SvgCheckBox(
+                "Preprocess Image",
+                unchecked_svg=ICON_PATHS["uncheck"],
+                checked_svg=ICON_PATHS["check"]
+            )
             self.preprocess_checkbox.setChecked(True)
-            self.preprocess_checkbox.setStyleSheet(f"""
-                QCheckBox {{
-                    font-size: 16px;
-                    color: white;
-                    border: none;
-                    background: none;
-                    margin: 0px;
-                }}
-                QCheckBox::indicator {{
-                    width: 24px;
-                    height: 24px;
-                }}
-                QCheckBox::indicator:unchecked {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/uncheck.svg')});
-                }}
-                QCheckBox::indicator:checked {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/check.svg')});
-                }}
-            """)
             ring_layout.addWidget(self.preprocess_checkbox)
 
             # LAB Colors checkbox
-            self.lab_color_checkbox = QCheckBox("Use LAB Colors")
-            self.lab_color_checkbox.setStyleSheet(f"""
-                QCheckBox {{
-                    font-size: 16px;
-                    color: white;
-                    border: none;
-                    background: none;
-                    margin: 0px;
-                }}
-                QCheckBox::indicator {{
-                    width: 24px;
-                    height: 24px;
-                }}
-                QCheckBox::indicator:unchecked {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/uncheck.svg')});
-                }}
-                QCheckBox::indicator:checked {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/check.svg')});
-                }}
-            """)
+            self.lab_color_checkbox = SvgCheckBox(
+                "Use LAB Colors",
+                unchecked_svg=ICON_PATHS["uncheck"],
+                checked_svg=ICON_PATHS["check"]
+            )
             ring_layout.addWidget(self.lab_color_checkbox)
 
             # Placing on Canvas
-            self.oncanvascheckbox = QCheckBox("Placing on Canvas")
-            self.oncanvascheckbox.setStyleSheet(f"""
-                QCheckBox {{
-                    font-size: 16px;
-                    color: white;
-                    border: none;
-                    background: none;
-                    margin: 0px;
-                }}
-                QCheckBox::indicator {{
-                    width: 24px;
-                    height: 24px;
-                }}
-                QCheckBox::indicator:unchecked {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/uncheck.svg')});
-                }}
-                QCheckBox::indicator:checked {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/check.svg')});
-                }}
-            """)
+            self.oncanvascheckbox = SvgCheckBox(
+                "Placing on Canvas",
+                unchecked_svg=ICON_PATHS["uncheck"],
+                checked_svg=ICON_PATHS["check"]
+            )
             ring_layout.addWidget(self.oncanvascheckbox)
 
             # Placing on Grass
-            self.ongrasscheckbox = QCheckBox("Placing on Grass")
-            self.ongrasscheckbox.setStyleSheet(f"""
-                QCheckBox {{
-                    font-size: 16px;
-                    color: white;
-                    border: none;
-                    background: none;
-                    margin: 0px;
-                }}
-                QCheckBox::indicator {{
-                    width: 24px;
-                    height: 24px;
-                }}
-                QCheckBox::indicator:unchecked {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/uncheck.svg')});
-                }}
-                QCheckBox::indicator:checked {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/check.svg')});
-                }}
-            """)
+            self.ongrasscheckbox = SvgCheckBox(
+                "Placing on Grass",
+                unchecked_svg=ICON_PATHS["uncheck"],
+                checked_svg=ICON_PATHS["check"]
+            )
             ring_layout.addWidget(self.ongrasscheckbox)
 
             # Chalks (client side)
-            self.bg_removal_checkbox = QCheckBox("Use Chalks (client side)")
-            self.bg_removal_checkbox.setStyleSheet(f"""
-                QCheckBox {{
-                    font-size: 16px;
-                    color: white;
-                    border: none;
-                    background: none;
-                    margin: 0px;
-                }}
-                QCheckBox::indicator {{
-                    width: 24px;
-                    height: 24px;
-                }}
-                QCheckBox::indicator:unchecked {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/uncheck.svg')});
-                }}
-                QCheckBox::indicator:checked {{
-                    image: url({exe_path_str('imagePawcessor/font_stuff/check.svg')});
-                }}
-            """)
+            self.bg_removal_checkbox = SvgCheckBox(
+                "Use Chalks (client side)",
+                unchecked_svg=ICON_PATHS["uncheck"],
+                checked_svg=ICON_PATHS["check"]
+            )
             ring_layout.addWidget(self.bg_removal_checkbox)
 
             global has_chalks
@@ -5786,12 +6370,10 @@ class MainWindow(QMainWindow):
             """)
             ring_layout.addWidget(processing_label)
 
-            self.processing_methods = [
-                {"name": name, "description": getattr(func, "description", "")}
-                for name, func in processing_method_registry.items()
-            ]
+            # Method names straight from the registry, added in one batch;
+            # descriptions are looked up from the registry when a method is picked
             self.processing_combobox = QComboBox()
-            self.processing_combobox.addItems([method["name"] for method in self.processing_methods])
+            self.processing_combobox.addItems(list(processing_method_registry))
             self.processing_combobox.setStyleSheet("""
                 QComboBox {
                     background-color: #7b1fa2;
@@ -5917,8 +6499,9 @@ class MainWindow(QMainWindow):
             # Color options
             self.setup_color_options_ui(secondary_layout)
 
-            # Initially populate method options
-            self.processing_method_changed('self.processing_combobox.currentText()')
+            # Initially populate method options; not a user choice, so the resize
+            # slider can still switch methods automatically
+            self.processing_method_changed(self.processing_combobox.currentText(), manual=False)
 
             # Action layout for process button, status label, and progress bar
             self.action_layout = QStackedWidget()
@@ -6044,41 +6627,17 @@ class MainWindow(QMainWindow):
         button_layout.setAlignment(Qt.AlignCenter)
         button_container.setLayout(button_layout)
 
-        # Styling for buttons (reused from the initial menu)
-        button_stylesheet = """
-            QPushButton {
-                background-color: qlineargradient(
-                    spread:pad, x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #7b1fa2, stop:1 #9c27b0);
-                color: white;
-                border-radius: 15px;  /* Rounded corners */
-                font-family: 'Comic Sans MS', 'Comic Neue', 'DejaVu Sans', 'FreeSans', sans-serif;
-                font-size: 30px;  /* Corrected font size syntax */
-                font-weight: bold;
-                padding: 15px 30px;
-                min-height: 50px;
-            }
-            QPushButton:hover {
-                background-color: qlineargradient(
-                    spread:pad, x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #9c27b0, stop:1 #d81b60);
-            }
-            QPushButton:pressed {
-                background-color: qlineargradient(
-                    spread:pad, x1:0, y1:0, x2:1, y2:1, 
-                    stop:0 #6a0080, stop:1 #880e4f);
-            }
-        """
+        # Styling for buttons (the initial menu's, with larger text), set once on
+        # the container
+        button_container.setStyleSheet(RESULT_BUTTON_STYLESHEET)
 
         # "Maybe not..." button
         self.maybe_not_button = QPushButton("Back to Options")
-        self.maybe_not_button.setStyleSheet(button_stylesheet)
         self.maybe_not_button.setMinimumSize(240, 60)
         self.maybe_not_button.clicked.connect(self.retry_processing)
         button_layout.addWidget(self.maybe_not_button)
 
         self.save_button = QPushButton("Save")
-        self.save_button.setStyleSheet(button_stylesheet)
         self.save_button.setMinimumSize(100, 60)
         # Placeholder action for Save button
         self.save_button.clicked.connect(self.save_current)
@@ -6086,7 +6645,6 @@ class MainWindow(QMainWindow):
 
         # "Awrooo!" button
         self.awrooo_button = QPushButton("Home")
-        self.awrooo_button.setStyleSheet(button_stylesheet)
         self.awrooo_button.setMinimumSize(120, 60)
         self.awrooo_button.clicked.connect(lambda: self.go_to_initial_menu(True))
         button_layout.addWidget(self.awrooo_button)
@@ -6122,51 +6680,36 @@ class MainWindow(QMainWindow):
         # Add Buttons
         buttons = [
             {
-                "normal": exe_path_str('imagePawcessor/font_stuff/home.svg'),
-                "hover": exe_path_str("imagePawcessor/font_stuff/home_hover.svg"),
+                "normal": ICON_PATHS["home"],
+                "hover": ICON_PATHS["home_hover"],
                 "action": self.go_to_initial_menu,
             },
             {
-                "normal": exe_path_str("imagePawcessor/font_stuff/save.svg"),
-                "hover": exe_path_str("imagePawcessor/font_stuff/save_hover.svg"),
+                "normal": ICON_PATHS["save"],
+                "hover": ICON_PATHS["save_hover"],
                 "action": lambda: self.save_current(True),
             },
             {
-                "normal": exe_path_str("imagePawcessor/font_stuff/rand.svg"),
-                "hover": exe_path_str("imagePawcessor/font_stuff/rand_hover.svg"),
+                "normal": ICON_PATHS["rand"],
+                "hover": ICON_PATHS["rand_hover"],
                 "action": self.randomize_saved_stamps,
             },
             {
-                "normal": exe_path_str("imagePawcessor/font_stuff/delete.svg"),
-                "hover": exe_path_str("imagePawcessor/font_stuff/delete_hover.svg"),
+                "normal": ICON_PATHS["delete"],
+                "hover": ICON_PATHS["delete_hover"],
                 "action": lambda: self.toggle_delete_mode(True),
             },
         ]
 
         self.buttons = []  # Store button references for toggle_delete_mode
         for button_info in buttons:
-            button = QPushButton()
-            button.setIcon(QIcon(button_info["normal"]))
+            # Swaps between the shared normal/hover icons, with a transparent,
+            # borderless style
+            button = HoverButton(button_info["normal"], button_info["hover"])
             button.setIconSize(QSize(72, 72))  # Increased icon size
             button.setFixedSize(96, 96)  # Increased button size
             button.setFlat(True)
 
-            # Add hover effects
-            normal_icon = button_info["normal"]
-            hover_icon = button_info["hover"]
-
-            button.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: none;
-                }
-                QPushButton:hover {
-                    background-color: transparent;
-                }
-            """)
-            button.enterEvent = lambda event, b=button, h=hover_icon: b.setIcon(QIcon(h))
-            button.leaveEvent = lambda event, b=button, n=normal_icon: b.setIcon(QIcon(n))
-
             button.clicked.connect(button_info["action"])
             button_layout.addWidget(button)
 
@@ -6197,20 +6740,28 @@ class MainWindow(QMainWindow):
         self.grid_container = grid_container
 
         self.populate_grid(self.grid_layout)
+        self.lazy_load_thumbnails()
         self.stacked_widget.addWidget(self.save_menu_widget)
 
     def populate_grid(self, grid_layout):
         """
         Populates the grid with placeholders and aligns them top-left with 1-pixel borders.
+        The images themselves are loaded by load_visible_thumbnails once scrolled into view.
         """
         self.thumbnails = []
         self.loaded_thumbnails = 0
         self.total_thumbnails = len(self.thumbnail_data)
+        self.visible_thumbnails = range(0)  # Indices shown by the last load_visible_thumbnails
 
         # Set spacing and margins
         grid_layout.setSpacing(8)
         grid_layout.setContentsMargins(6, 0, 0, 0)  # Margins around the grid
 
+        # Every cell is the same size, so load_visible_thumbnails can work out the
+        # visible rows from the scroll position alone
+        self.thumbnail_columns = 5
+        self.thumbnail_row_height = 128 + grid_layout.verticalSpacing()
+
         # Clear any layout alignment constraints to ensure top-left alignment
         grid_layout.setAlignment(Qt.AlignTop | Qt.AlignLeft)
 
@@ -6222,28 +6773,12 @@ class MainWindow(QMainWindow):
             layout.setSpacing(0)
             thumbnail_widget.setLayout(layout)
 
-            # Use the processed WebP preview instead of referencing original files
-            preview_path = Path(thumbnail_data["path"])
-            if thumbnail_data["is_gif"]:
-                # Load GIF as an animated WebP
-                gif_label = QLabel()
-                gif_movie = QMovie(str(preview_path))  # Use processed WebP
-                gif_label.setMovie(gif_movie)
-                gif_movie.start()
-                layout.addWidget(gif_label)
-            else:
-                # Load static WebP image
-                pixmap = QPixmap(str(preview_path))
-                if not pixmap.isNull():
-                    image_label = QLabel()
-                    image_label.setPixmap(pixmap)  # Set QPixmap object
-                    layout.addWidget(image_label)
-
             thumbnail_widget.setProperty("hash", thumbnail_data["key"])
+            thumbnail_widget.gif_movie = None  # Set once an animated preview is loaded
             thumbnail_widget.mousePressEvent = lambda event, key=thumbnail_data["key"]: self.handle_thumbnail_click(event, key)
 
             # Ensure widgets align top-left by positioning them explicitly
-            row, col = divmod(i, 5)  # 5 columns per row
+            row, col = divmod(i, self.thumbnail_columns)  # 5 columns per row
             grid_layout.addWidget(thumbnail_widget, row, col, alignment=Qt.AlignTop | Qt.AlignLeft)
             self.thumbnails.append(thumbnail_widget)
 
@@ -6252,56 +6787,96 @@ class MainWindow(QMainWindow):
         """
         Loads visible thumbnails as the user scrolls or when triggered programmatically.
         """
+        self.thumbnail_load_queued = False
 
         if not hasattr(self, 'thumbnails') or not hasattr(self, 'thumbnail_data'):
             print("Thumbnails or thumbnail data not initialized.")
             return
 
         scroll_area = self.scroll_area
+        # Nothing is on screen
+        if not scroll_area.isVisible():
+            return
         visible_area = scroll_area.viewport().rect()
         viewport_top = scroll_area.verticalScrollBar().value()
         viewport_bottom = viewport_top + visible_area.height()
 
-        for i, thumbnail_widget in enumerate(self.thumbnails):
-            widget_top = thumbnail_widget.y()
-            widget_bottom = widget_top + thumbnail_widget.height()
-
-            # Check if the thumbnail is in the visible range
-            if widget_bottom >= viewport_top and widget_top <= viewport_bottom:
-                if not thumbnail_widget.property("loaded"):
-                    thumbnail_data = self.thumbnail_data[i]
-                    layout = thumbnail_widget.layout()
-
-                    # Clear placeholder
-                    for j in reversed(range(layout.count())):
-                        layout.itemAt(j).widget().deleteLater()
-
-                    if thumbnail_data["is_gif"]:
-                        # Create a temporary copy of preview.webp
-                        original_path = Path(thumbnail_data["path"])
-                        temp_path = original_path.parent / f"temp_{original_path.name}"
-                        shutil.copy(str(original_path), str(temp_path))
-
-                        gif_label = QLabel()
-                        gif_movie = QMovie(str(temp_path))
-                        gif_label.setMovie(gif_movie)
-                        gif_movie.start()
-                        layout.addWidget(gif_label)
-
-                        # Store reference to QMovie and temp file for later cleanup
-                        thumbnail_widget.gif_movie = gif_movie
-                        thumbnail_widget.temp_path = temp_path
-                    else:
-                        # Load static WebP image
+        # Only the thumbnails in the rows overlapping the viewport
+        first_row = viewport_top // self.thumbnail_row_height
+        last_row = viewport_bottom // self.thumbnail_row_height
+        first = first_row * self.thumbnail_columns
+        last = min((last_row + 1) * self.thumbnail_columns, len(self.thumbnails))
+        visible = range(first, last)
+
+        # Pause the animations that scrolled out of view
+        for i in self.visible_thumbnails:
+            if i not in visible:
+                gif_movie = self.thumbnails[i].gif_movie
+                if gif_movie is not None:
+                    gif_movie.setPaused(True)
+        self.visible_thumbnails = visible
+
+        for i in visible:
+            thumbnail_widget = self.thumbnails[i]
+            if thumbnail_widget.property("loaded"):
+                # Resume an animation paused while it was out of view
+                if thumbnail_widget.gif_movie is not None:
+                    thumbnail_widget.gif_movie.setPaused(False)
+            else:
+                thumbnail_data = self.thumbnail_data[i]
+                layout = thumbnail_widget.layout()
+
+                # Clear placeholder
+                for j in reversed(range(layout.count())):
+                    layout.itemAt(j).widget().deleteLater()
+
+                if thumbnail_data["is_gif"]:
+                    # Play the animated preview from memory rather than from a
+                    # temp copy on disk, so no file handle stays open on it
+                    gif_label = QLabel()
+                    with open(thumbnail_data["path"], "rb") as gif_file:
+                        gif_data = QByteArray(gif_file.read())
+                    gif_buffer = QBuffer(gif_label)
+                    gif_buffer.setData(gif_data)
+                    gif_buffer.open(QIODevice.ReadOnly)
+                    gif_movie = QMovie(gif_buffer, QByteArray(), gif_label)
+                    gif_label.setMovie(gif_movie)
+                    gif_movie.start()
+                    layout.addWidget(gif_label)
+
+                    # Store reference to QMovie for later cleanup
+                    thumbnail_widget.gif_movie = gif_movie
+                else:
+                    # Load static WebP image. Decoded previews stay in Qt's pixmap
+                    # cache by stamp hash across grid rebuilds, until evicted
+                    cache_key = f"thumbnail:{thumbnail_data['key']}"
+                    pixmap = QPixmapCache.find(cache_key)
+                    if pixmap is None:
                         pixmap = QPixmap(str(thumbnail_data["path"]))
                         if not pixmap.isNull():
-                            image_label = QLabel()
-                            image_label.setPixmap(pixmap)
-                            layout.addWidget(image_label)
+                            # Saved previews are already 128x128; shrink anything
+                            # larger once here rather than keeping it full size
+                            if pixmap.width() > 128 or pixmap.height() > 128:
+                                pixmap = pixmap.scaled(128, 128, Qt.KeepAspectRatio, Qt.FastTransformation)
+                            QPixmapCache.insert(cache_key, pixmap)
+                    if not pixmap.isNull():
+                        image_label = QLabel()
+                        image_label.setPixmap(pixmap)
+                        layout.addWidget(image_label)
+
+                thumbnail_widget.setProperty("loaded", True)  # Mark as loaded
 
-                    thumbnail_widget.setProperty("loaded", True)  # Mark as loaded
 
 
+    def queue_visible_thumbnails(self, *args):
+        """
+        Runs load_visible_thumbnails once the event loop is free, folding a burst of
+        scroll/resize signals into a single pass.
+        """
+        if self.thumbnail_load_queued:
+            return
+        self.thumbnail_load_queued = True
+        QTimer.singleShot(0, self.load_visible_thumbnails)
 
     def lazy_load_thumbnails(self):
         """
@@ -6311,12 +6886,16 @@ class MainWindow(QMainWindow):
             print("Scroll area does not have a vertical scrollbar!")
             return
 
-        self.scroll_area.verticalScrollBar().valueChanged.connect(self.load_visible_thumbnails)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self.queue_visible_thumbnails)
+        # The range changes once the grid is laid out or the window is resized,
+        # which can bring more thumbnails into view without scrolling
+        self.scroll_area.verticalScrollBar().rangeChanged.connect(self.queue_visible_thumbnails)
         print("Lazy loading connected to scroll.")
         
     def load_thumbnail_data(self):
         """
-        Load thumbnail data from saved_stamps.json and cache as QPixmap objects.
+        Load thumbnail data from saved_stamps.json. Only the preview paths are kept;
+        the images are decoded when their thumbnails scroll into view.
         """
         # Use the new AppData directory
         appdata_dir = get_appdata_dir()
@@ -6324,15 +6903,13 @@ class MainWindow(QMainWindow):
         saved_stamps_dir = appdata_dir / "saved_stamps/"
 
         self.thumbnail_data = []
-        self.thumbnail_cache = {}
 
         if not saved_stamps_json.exists():
             print("No saved_stamps.json file found.")
             return
 
         try:
-            with open(saved_stamps_json, 'r') as f:
-                saved_stamps = json.load(f)
+            saved_stamps = load_saved_stamps(saved_stamps_json)
         except Exception as e:
             print(f"Error reading saved_stamps.json: {e}")
             return
@@ -6356,11 +6933,9 @@ class MainWindow(QMainWindow):
                 print(f"Missing any valid preview file for key: {key}")
                 continue
 
-            # Try loading the found preview file into a QPixmap
+            # Check the preview's header is readable without decoding it
             try:
-                pixmap = QPixmap(str(found_preview_path))
-                if not pixmap.isNull():
-                    self.thumbnail_cache[key] = pixmap
+                if QImageReader(str(found_preview_path)).canRead():
                     self.thumbnail_data.append({
                         "path": str(found_preview_path),
                         "is_gif": value.get("is_gif", False),
@@ -6393,20 +6968,22 @@ class MainWindow(QMainWindow):
         # Use the new AppData directory
         appdata_dir = get_appdata_dir()
         saved_stamps_json = appdata_dir / "saved_stamps.json"
+        removed = False
 
         try:
             # Load and update saved_stamps.json
             if saved_stamps_json.exists():
-                with open(saved_stamps_json, "r") as json_file:
-                    saved_stamps = json.load(json_file)
+                # Copy the shared parse before editing it
+                saved_stamps = dict(load_saved_stamps(saved_stamps_json))
 
                 if thumbnail_hash in saved_stamps:
                     print(f"Removing entry for hash {thumbnail_hash} from JSON.")
                     del saved_stamps[thumbnail_hash]
 
-                    # Write updated JSON back to file
-                    with open(saved_stamps_json, "w") as json_file:
-                        json.dump(saved_stamps, json_file, indent=4)
+                    # Write updated JSON back to file; the grid rebuild below
+                    # reuses this dict instead of reparsing the file
+                    save_saved_stamps(saved_stamps_json, saved_stamps)
+                    removed = True
                 else:
                     print(f"Hash {thumbnail_hash} not found in JSON.")
 
@@ -6419,7 +6996,42 @@ class MainWindow(QMainWindow):
             print(f"Error while deleting JSON entry: {e}")
             self.show_floating_message("Error", True)
 
-        self.repopulate_grid()
+        # Take just the one thumbnail out of the grid if it is there; otherwise
+        # rebuild the grid from the file
+        if not (removed and self.remove_thumbnail_widget(thumbnail_hash)):
+            self.repopulate_grid()
+
+    def remove_thumbnail_widget(self, thumbnail_hash):
+        """
+        Removes a thumbnail from the grid and moves the ones after it back one
+        cell. Returns False if no thumbnail has that hash.
+        """
+        for index, thumbnail_widget in enumerate(self.thumbnails):
+            if thumbnail_widget.property("hash") == thumbnail_hash:
+                break
+        else:
+            return False
+
+        self.grid_layout.removeWidget(thumbnail_widget)
+        if thumbnail_widget.gif_movie is not None:
+            thumbnail_widget.gif_movie.stop()
+        thumbnail_widget.deleteLater()
+        del self.thumbnails[index]
+        del self.thumbnail_data[index]
+        QPixmapCache.remove(f"thumbnail:{thumbnail_hash}")
+        self.total_thumbnails = len(self.thumbnail_data)
+
+        # Only the cells after the removed one change position
+        for i in range(index, len(self.thumbnails)):
+            row, col = divmod(i, self.thumbnail_columns)
+            self.grid_layout.addWidget(self.thumbnails[i], row, col, alignment=Qt.AlignTop | Qt.AlignLeft)
+
+        # The last visible index may no longer exist; the next pass loads the
+        # thumbnail that moved into view
+        visible = self.visible_thumbnails
+        self.visible_thumbnails = range(visible.start, min(visible.stop, len(self.thumbnails)))
+        self.queue_visible_thumbnails()
+        return True
 
     def load_thumbnail(self, thumbnail_hash):
         """
@@ -6429,7 +7041,7 @@ class MainWindow(QMainWindow):
         # Use the new AppData directory for saved stamps
         appdata_dir = get_appdata_dir()
         saved_stamp_dir = appdata_dir / "saved_stamps" / thumbnail_hash
-        current_stamp_dir = exe_path_fs("game_data/current_stamp_data/")
+        current_stamp_dir = CURRENT_STAMP_DIR
 
         if not saved_stamp_dir.exists():
             self.show_floating_message("Directory Not Found", True)
@@ -6474,7 +7086,7 @@ class MainWindow(QMainWindow):
                 widget.deleteLater()
                 
         for thumbnail_widget in self.thumbnails:
-            if hasattr(thumbnail_widget, 'gif_movie'):
+            if thumbnail_widget.gif_movie is not None:
                 thumbnail_widget.gif_movie.stop()
                 thumbnail_widget.gif_movie.deleteLater()
         # Reset thumbnails list and reload data
@@ -6484,8 +7096,8 @@ class MainWindow(QMainWindow):
         self.load_thumbnail_data()  # Reload data from JSON
         self.populate_grid(self.grid_layout)  # Repopulate the grid
 
-        # Trigger immediate visible thumbnail loading
-        self.load_visible_thumbnails()
+        # Load the visible thumbnails once the new placeholders are laid out
+        self.queue_visible_thumbnails()
 
 
     def toggle_delete_mode(self, callback = True):
@@ -6549,19 +7161,22 @@ class MainWindow(QMainWindow):
 
         if self.processing:
             return
-        
-        self.repopulate_grid()
-        if not hasattr(self, 'thumbnail_data'):
-            self.load_thumbnail_data()
 
         if not hasattr(self, 'save_menu_widget'):
+            # Built with an empty grid; the thumbnails are filled in below
+            self.thumbnail_data = []
             self.setup_save_menu()
-            
+
         self.stacked_widget.setCurrentWidget(self.save_menu_widget)
 
         self.delete_mode = True
         self.toggle_delete_mode(False)
 
+        # Paint the page first, then reread saved_stamps.json and rebuild the grid
+        # on the next pass of the event loop; repopulate_grid queues the visible
+        # thumbnails once the new placeholders are laid out
+        QTimer.singleShot(0, self.repopulate_grid)
+
     def close_application(self):
         for timer in self.color_timers.values():
             timer.stop()
@@ -6594,32 +7209,32 @@ class MainWindow(QMainWindow):
         if not self.manual_change:
             if not self.is_gif:
                 if value > 200:
-                    if "Jarvis Dither" in [method["name"] for method in self.processing_methods]:
+                    if "Jarvis Dither" in processing_method_registry:
                         self.processing_combobox.blockSignals(True)  # Block signals
                         self.processing_combobox.setCurrentText("Jarvis Dither")
                         self.processing_combobox.blockSignals(False)  # Unblock signals
                         self.processing_method_changed("Jarvis Dither", strength=False, manual=False)
                 elif value > 64:
-                    if "Pattern Dither" in [method["name"] for method in self.processing_methods]:
+                    if "Pattern Dither" in processing_method_registry:
                         self.processing_combobox.blockSignals(True)
                         self.processing_combobox.setCurrentText("Pattern Dither")
                         self.processing_combobox.blockSignals(False)
                         self.processing_method_changed("Pattern Dither", strength=False, manual=False)
                 else:
-                    if "Color Match" in [method["name"] for method in self.processing_methods]:
+                    if "Color Match" in processing_method_registry:
                         self.processing_combobox.blockSignals(True)
                         self.processing_combobox.setCurrentText("Color Match")
                         self.processing_combobox.blockSignals(False)
                         self.processing_method_changed("Color Match", strength=False, manual=False)
             else:
                 if value > 80:
-                    if "Pattern Dither" in [method["name"] for method in self.processing_methods]:
+                    if "Pattern Dither" in processing_method_registry:
                         self.processing_combobox.blockSignals(True)
                         self.processing_combobox.setCurrentText("Pattern Dither")
                         self.processing_combobox.blockSignals(False)
                         self.processing_method_changed("Pattern Dither", strength=False, manual=False)
                 else:
-                    if "Color Match" in [method["name"] for method in self.processing_methods]:
+                    if "Color Match" in processing_method_registry:
                         self.processing_combobox.blockSignals(True)
                         self.processing_combobox.setCurrentText("Color Match")
                         self.processing_combobox.blockSignals(False)
@@ -6636,27 +7251,9 @@ class MainWindow(QMainWindow):
         - Boost text and slider appear only when Preprocess Image is checked.
         """
         
-        # Helper function to determine text color based on background color
-        def get_contrast_color(hex_color):
-            """
-            Returns 'white' or 'black' based on the luminance of the provided hex color.
-            """
-            # Convert hex to RGB
-            hex_color = hex_color.lstrip('#')
-            if len(hex_color) == 6:
-                r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-            elif len(hex_color) == 3:
-                r, g, b = tuple(int(hex_color[i]*2, 16) for i in range(3))
-            else:
-                # Default to white if format is unexpected
-                return 'white'
-            
-            # Calculate luminance using the formula
-            luminance = (0.299 * r + 0.587 * g + 0.114 * b)
-            return 'white' if luminance < 100 else 'black'
-
         # Decorative ring-style border for the entire section
         ring_frame = QFrame()
+        # Also carries the Boost/Threshold label and slider rules for every color
         ring_frame.setStyleSheet("""
             QFrame {
                 border: 4px solid #7b1fa2; /* Increased Purple border */
@@ -6664,7 +7261,7 @@ class MainWindow(QMainWindow):
                 padding: 4px; /* Inner padding */
                 margin: 0px;  /* Outer margin */
             }
-        """)
+        """ + COLOR_SLIDER_STYLESHEET)
         ring_layout = QVBoxLayout()
         ring_layout.setSpacing(1)  # Increased spacing for better layout
         ring_layout.setContentsMargins(5, 5, 5, 5)  # Increased inner padding
@@ -6701,12 +7298,12 @@ class MainWindow(QMainWindow):
 
             # Dynamically set icons based on text color
             if text_color == "white":
-                unchecked_icon = exe_path_str('imagePawcessor/font_stuff/uncheck_white.svg')
-                checked_icon = exe_path_str('imagePawcessor/font_stuff/check_white.svg')
+                unchecked_icon = ICON_PATHS["uncheck_white"]
+                checked_icon = ICON_PATHS["check_white"]
                 border_color = "#ffffff"  # White border for light text
             else:
-                unchecked_icon = exe_path_str('imagePawcessor/font_stuff/uncheck.svg')
-                checked_icon = exe_path_str('imagePawcessor/font_stuff/check.svg')
+                unchecked_icon = ICON_PATHS["uncheck"]
+                checked_icon = ICON_PATHS["check"]
                 border_color = "#e3a8e6"
 
             # Store the border color
@@ -6723,23 +7320,14 @@ class MainWindow(QMainWindow):
             # Color box (replacing QLabel with QWidget)
             color_box = QWidget()
             color_box.setFixedSize(100, 100)
+            # The checkbox rules come after the QWidget rule so they win for the
+            # checkboxes, which now share this one stylesheet
             color_box.setStyleSheet(f"""
                 QWidget {{
                     background-color: #{color_hex};
                     border: 4px solid {border_color}; /* Dynamic border color */
                     border-radius: 10px;
                 }}
-            """)
-            color_container_layout.addWidget(color_box, alignment=Qt.AlignCenter)
-
-            # Layout for checkboxes inside the color box
-            checkbox_layout = QVBoxLayout()
-            checkbox_layout.setSpacing(8)
-            checkbox_layout.setContentsMargins(8, 10, 5, 5)  # Offset checkboxes by 5 pixels right and down
-            color_box.setLayout(checkbox_layout)
-
-            # Define a common stylesheet template for the checkboxes
-            checkbox_stylesheet = f"""
                 QCheckBox {{
                     color: {text_color}; /* Dynamic text color based on background */
                     font-size: 15px; /* Adjusted font size */
@@ -6751,18 +7339,18 @@ class MainWindow(QMainWindow):
                     width: 20px;
                     height: 20px;
                 }}
-                QCheckBox::indicator:unchecked {{
-                    image: url({unchecked_icon});
-                }}
-                QCheckBox::indicator:checked {{
-                    image: url({checked_icon});
-                }}
-            """
+            """)
+            color_container_layout.addWidget(color_box, alignment=Qt.AlignCenter)
+
+            # Layout for checkboxes inside the color box
+            checkbox_layout = QVBoxLayout()
+            checkbox_layout.setSpacing(8)
+            checkbox_layout.setContentsMargins(8, 10, 5, 5)  # Offset checkboxes by 5 pixels right and down
+            color_box.setLayout(checkbox_layout)
 
             # Enable checkbox
-            enable_checkbox = QCheckBox("Enable")
+            enable_checkbox = SvgCheckBox("Enable", unchecked_svg=unchecked_icon, checked_svg=checked_icon)
             enable_checkbox.setChecked(True)
-            enable_checkbox.setStyleSheet(checkbox_stylesheet)
             enable_checkbox.toggled.connect(
                 lambda checked, num=color_number: self.toggle_enable_options(num, checked)
             )
@@ -6770,8 +7358,7 @@ class MainWindow(QMainWindow):
             checkbox_layout.addWidget(enable_checkbox)
 
             # RGB checkbox
-            rgb_checkbox = QCheckBox("RGB")
-            rgb_checkbox.setStyleSheet(checkbox_stylesheet)
+            rgb_checkbox = SvgCheckBox("RGB", unchecked_svg=unchecked_icon, checked_svg=checked_icon)
             rgb_checkbox.toggled.connect(
                 lambda checked, num=color_number: self.toggle_rgb(num, checked)
             )
@@ -6779,8 +7366,7 @@ class MainWindow(QMainWindow):
             checkbox_layout.addWidget(rgb_checkbox)
 
             # Blank checkbox
-            blank_checkbox = QCheckBox("Blank")
-            blank_checkbox.setStyleSheet(checkbox_stylesheet)
+            blank_checkbox = SvgCheckBox("Blank", unchecked_svg=unchecked_icon, checked_svg=checked_icon)
             blank_checkbox.toggled.connect(
                 lambda checked, num=color_number: self.toggle_blank(num, checked)
             )
@@ -6794,17 +7380,7 @@ class MainWindow(QMainWindow):
             # Boost label
             boost_label = QLabel("Boost")
             boost_label.setAlignment(Qt.AlignCenter)
-            boost_label.setStyleSheet("""
-                QLabel {
-                    color: white; /* Always white */
-                    font-size: 17px; /* Adjusted font size */
-                    font-weight: bold;
-                    border: none; /* No ring */
-                    margin-bottom: 0px; /* Reduce bottom margin */
-                    padding-bottom: 0px; /* Reduce bottom padding */
-                    background: transparent; /* Ensure no background */
-                }
-            """)
+            boost_label.setObjectName("boost_label")
             boost_label.setVisible(False)
             self.boost_labels[color_number] = boost_label
             color_container_layout.addWidget(boost_label)
@@ -6815,20 +7391,6 @@ class MainWindow(QMainWindow):
             boost_slider.setValue(14)
             boost_slider.setTickInterval(1)
             boost_slider.setTickPosition(QSlider.TicksBelow)
-            boost_slider.setStyleSheet("""
-                QSlider::groove:horizontal {
-                    height: 6px;
-                    background: #7b1fa2;
-                    border-radius: 3px;
-                }
-                QSlider::handle:horizontal {
-                    background: #ffffff;
-                    border: 1px solid #7b1fa2;
-                    width: 14px;
-                    margin: -5px 0;
-                    border-radius: 7px;
-                }
-            """)
             boost_slider.setVisible(False)
             self.boost_sliders[color_number] = boost_slider
             boost_slider.setFixedWidth(100)  # Set the width to match the color box
@@ -6837,17 +7399,7 @@ class MainWindow(QMainWindow):
             # Threshold label
             threshold_label = QLabel("Threshold")
             threshold_label.setAlignment(Qt.AlignCenter)
-            threshold_label.setStyleSheet("""
-                QLabel {
-                    color: white; /* Always white */
-                    font-size: 14px; /* Adjusted font size */
-                    font-weight: bold;
-                    border: none; /* No ring */
-                    margin-bottom: 0px; /* Reduce bottom margin */
-                    padding-bottom: 0px; /* Reduce bottom padding */
-                    background: transparent; /* Ensure no background */
-                }
-            """)
+            threshold_label.setObjectName("threshold_label")
             threshold_label.setVisible(False)
             self.threshold_labels[color_number] = threshold_label
             color_container_layout.addWidget(threshold_label)
@@ -6858,20 +7410,6 @@ class MainWindow(QMainWindow):
             threshold_slider.setValue(20)
             threshold_slider.setTickInterval(1)
             threshold_slider.setTickPosition(QSlider.TicksBelow)
-            threshold_slider.setStyleSheet("""
-                QSlider::groove:horizontal {
-                    height: 6px;
-                    background: #7b1fa2;
-                    border-radius: 3px;
-                }
-                QSlider::handle:horizontal {
-                    background: #ffffff;
-                    border: 1px solid #7b1fa2;
-                    width: 14px;
-                    margin: -5px 0;
-                    border-radius: 7px;
-                }
-            """)
             threshold_slider.setVisible(False)
             self.threshold_sliders[color_number] = threshold_slider
             threshold_slider.setFixedWidth(100)  # Set the width to match the color box
@@ -7151,7 +7689,7 @@ class MainWindow(QMainWindow):
             # Step 4: Detect if the image is animated
             is_multiframe = getattr(img, "is_animated", False)
             # Step 5: Save the image to a temporary WebP file in directory
-            temp_image_path = exe_path_fs('imagePawcessor/temp/clipboard_image.webp')
+            temp_image_path = CLIPBOARD_IMAGE_PATH
             if is_multiframe:
                 # Save as an animated WebP
                 img.save(temp_image_path, format="WEBP", save_all=True, duration=img.info.get("duration", 100), loop=img.info.get("loop", 0))
@@ -7197,12 +7735,12 @@ class MainWindow(QMainWindow):
                 self.threshold_labels[color_number].setVisible(False)
 
         if self.is_gif:
-            if "Color Match" in [method["name"] for method in self.processing_methods]:
+            if "Color Match" in processing_method_registry:
                 self.processing_combobox.setCurrentText("Color Match")
                 self.processing_method_changed("Color Match")
 
         else:
-            if "Pattern Dither" in [method["name"] for method in self.processing_methods]:
+            if "Pattern Dither" in processing_method_registry:
                 self.processing_combobox.setCurrentText("Pattern Dither")
                 self.processing_method_changed("Pattern Dither")
 
@@ -7456,11 +7994,11 @@ class MainWindow(QMainWindow):
                 self.refresh_button.show()
                 self.refresh_button.raise_()
             if self.is_gif:
-                if "Color Match" in [method["name"] for method in self.processing_methods]:
+                if "Color Match" in processing_method_registry:
                     self.processing_combobox.setCurrentText("Color Match")
                     self.processing_method_changed("Color Match")
             else:
-                if "Pattern Dither" in [method["name"] for method in self.processing_methods]:
+                if "Pattern Dither" in processing_method_registry:
                     self.processing_combobox.setCurrentText("Pattern Dither")
                     self.processing_method_changed("Pattern Dither")
 
@@ -8182,8 +8720,8 @@ class MainWindow(QMainWindow):
         self.status_label.setText("Processing complete!")
 
         # Paths for PNG and GIF previews
-        preview_png_path = exe_path_fs('game_data/stamp_preview/preview.png')
-        preview_gif_path = exe_path_fs('game_data/stamp_preview/preview.gif')
+        preview_png_path = PREVIEW_PNG_PATH
+        preview_gif_path = PREVIEW_GIF_PATH
 
         try:
             if self.is_gif:
@@ -8437,7 +8975,7 @@ class MainWindow(QMainWindow):
         if usepreview:
             self.display_new_stamp()
         else: 
-            self.background_label.setPixmap(self.load_and_display_random_image())
+            self.load_and_display_random_image()
 
         if not hasattr(self, 'secondary_widget'):
             self.setup_secondary_menu()
@@ -8508,8 +9046,8 @@ class MainWindow(QMainWindow):
 
         # Define paths
         appdata_dir = get_appdata_dir()
-        current_stamp_dir = exe_path_fs("game_data/current_stamp_data")
-        preview_dir = exe_path_fs("game_data/stamp_preview")
+        current_stamp_dir = CURRENT_STAMP_DIR
+        preview_dir = STAMP_PREVIEW_DIR
         saved_stamps_json = appdata_dir / "saved_stamps.json"
         saved_stamps_dir = appdata_dir / "saved_stamps"
 
@@ -9022,6 +9560,10 @@ if __name__ == '__main__':
     startup()
 
     app = QApplication(sys.argv)
+    # Budget for the save menu's decoded thumbnails (up to 64 KB each at
+    # 128x128); beyond this Qt evicts the least recently used. The rendered SVG
+    # pixmaps are kept separately in SVG_PIXMAP_CACHE
+    QPixmapCache.setCacheLimit(100 * 1024)
 
     if sys.platform.startswith('win'):
         import ctypes
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "imagePawcessor" / "imagePawcess.py"
+
+# Runs in a child process so a deadlocked pool fails the test through the
+# timeout instead of hanging the test run
+BUILD_LUT = textwrap.dedent("""
+    import importlib.util
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+
+    import numpy as np
+
+    spec = importlib.util.spec_from_file_location("imagePawcess", sys.argv[1])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    workers = int(sys.argv[2])
+    module.TILE_WORKERS = workers
+    module.tile_executor = ThreadPoolExecutor(max_workers=workers)
+
+    palette = np.random.default_rng(0).integers(0, 256, (20, 3)).astype(np.float32)
+    lut = module.get_palette_lut(palette, False)
+
+    step = 1 << module.PALETTE_LUT_SHIFT
+    centers = np.arange(module.PALETTE_LUT_SIZE, dtype=np.float32) * step + (step - 1) / 2.0
+    grid = np.stack(np.meshgrid(centers, centers, centers, indexing="ij"), axis=-1).reshape(-1, 3)
+    assert grid.shape[0] == 262144
+    expected = module._closest_indices_stripe(grid, palette).reshape(lut.shape)
+    assert (lut == expected).all()
+""")
+
+
+@pytest.mark.parametrize("workers", [2, 4])
+def test_rgb_palette_lut_does_not_deadlock_tile_pool(workers, tmp_path):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", NUMBA_CACHE_DIR=str(tmp_path))
+    result = subprocess.run(
+        [sys.executable, "-c", BUILD_LUT, str(MODULE_PATH), str(workers)],
+        env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr